@@ -4,128 +4,59 @@ Load tiles from YAML configuration files.
 
 import sys
 import os
-from pathlib import Path
 
 # Add project root to path so we can import src
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-import yaml
-from typing import List, Dict, Any
+from collections.abc import Sequence
+from typing import List, Optional
 from src import Tile
-from src.api import fetch_pokemon_image
-from src import styles
+from assets.tile_defs import TileSpec, load_tile_definitions
 
 
-def load_tiles_from_yaml(yaml_path: str) -> List[Tile]:
+def tile_from_spec(spec: TileSpec) -> Tile:
     """
-    Load tiles from a YAML file.
-
-    Args:
-        yaml_path: Path to YAML file (relative to project root or absolute)
-
-    Returns:
-        List of Tile objects
+    Create a Tile from a TileSpec. PokeAPI images are not fetched here; the
+    tile resolves them on first render (see src.asset_handle.prefetch_tiles).
     """
-    # Resolve path relative to project root if needed
-    if not os.path.isabs(yaml_path):
-        project_root = Path(__file__).parent.parent
-        yaml_path = project_root / yaml_path
-        # If file doesn't exist, try assets/ directory
-        if not yaml_path.exists() and not str(yaml_path).startswith("assets"):
-            assets_path = project_root / "assets" / Path(yaml_path).name
-            if assets_path.exists():
-                yaml_path = assets_path
+    return Tile(poke_api_image=spec.poke_api_image, **spec.tile_kwargs())
 
-    with open(yaml_path, "r") as f:
-        data = yaml.safe_load(f)
 
-    tiles = []
-    for tile_def in data.get("tiles", []):
-        # Handle PokeAPI images first (takes precedence over image_path)
-        image_path = None
-        if "poke_api_image" in tile_def:
-            pokemon_name = tile_def["poke_api_image"]
-            cached_path = fetch_pokemon_image(pokemon_name)
-            if cached_path:
-                image_path = cached_path
-            else:
-                print(f"Warning: Could not fetch Pokemon image for '{pokemon_name}'")
-        elif "local_image" in tile_def:
-            project_root = Path(__file__).parent.parent
-            image_path = str(project_root / "assets" / "images" / "local" / tile_def["local_image"])
-        elif "image_path" in tile_def:
-            image_path = tile_def.get("image_path")
-            if image_path and not os.path.isabs(image_path):
-                project_root = Path(__file__).parent.parent
-                image_path = str(project_root / image_path)
+class LazyTiles(Sequence):
+    """
+    Read-only list of tiles that creates each Tile on first access, so taking
+    one tile or a slice only costs the tiles touched.
+    """
 
-        background_image = None
-        if "local_background_image" in tile_def:
-            project_root = Path(__file__).parent.parent
-            background_image = str(project_root / "assets" / "images" / "local" / tile_def["local_background_image"])
+    def __init__(self, specs: List[TileSpec]):
+        self.specs = specs
+        self._tiles: List[Optional[Tile]] = [None] * len(specs)
 
-        def resolve_color(color_value):
-            if isinstance(color_value, str):
-                # Remove $ or @ prefix if present
-                color_name = color_value.lstrip("$@")
-                # Try to get from styles.COLORS
-                if hasattr(styles, "COLORS") and color_name in styles.COLORS:
-                    return styles.COLORS[color_name]
-                # Try get_color function
-                try:
-                    return styles.get_color(color_name)
-                except (KeyError, AttributeError):
-                    pass
-                # If not found, return as-is (might be a hex color or other format)
-                return color_value
-            elif isinstance(color_value, list):
-                # It's already an RGB list, convert to tuple
-                return tuple(color_value)
-            return color_value
+    def __len__(self):
+        return len(self.specs)
 
-        bg_color = tile_def.get("background_color", [255, 255, 255])
-        text_color = tile_def.get("text_color", [0, 0, 0])
-        border_color = tile_def.get("border_color", [0, 0, 0])
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        tile = self._tiles[index]
+        if tile is None:
+            tile = tile_from_spec(self.specs[index])
+            self._tiles[index] = tile
+        return tile
 
-        # Resolve color references
-        bg_color = resolve_color(bg_color)
-        text_color = resolve_color(text_color)
-        border_color = resolve_color(border_color)
 
-        # Ensure colors are tuples
-        if isinstance(bg_color, (list, tuple)) and len(bg_color) == 3:
-            bg_color = tuple(bg_color)
-        if isinstance(text_color, (list, tuple)) and len(text_color) == 3:
-            text_color = tuple(text_color)
-        if isinstance(border_color, (list, tuple)) and len(border_color) == 3:
-            border_color = tuple(border_color)
+def load_tiles_from_yaml(yaml_path: str) -> LazyTiles:
+    """
+    Load tiles from a YAML file.
 
-        # Create tile with all provided parameters
-        tile = Tile(
-            width=tile_def.get("width", 600),
-            height=tile_def.get("height", 600),
-            header=tile_def.get("header"),
-            text=tile_def.get("text"),
-            image_path=image_path,
-            image_scale=tile_def.get("image_scale", 0.8),
-            image_margin_top=tile_def.get("image_margin_top"),
-            image_anchor_bottom=tile_def.get("image_anchor_bottom", False),
-            background_color=bg_color
-            if isinstance(bg_color, tuple)
-            else (255, 255, 255),
-            text_color=text_color if isinstance(text_color, tuple) else (0, 0, 0),
-            border_color=border_color if isinstance(border_color, tuple) else (0, 0, 0),
-            border_width=tile_def.get("border_width", 1),
-            font_size=tile_def.get("font_size"),
-            footer=tile_def.get("footer"),
-            background_image=background_image,
-            text_margin_top=tile_def.get("text_margin_top", 0),
-            text_align=tile_def.get("text_align", "center"),
-        )
-        tiles.append(tile)
+    Args:
+        yaml_path: Path to YAML file (relative to project root or absolute)
 
-    return tiles
+    Returns:
+        Sequence of Tile objects, created lazily on access
+    """
+    return LazyTiles(load_tile_definitions(yaml_path).specs)
 
 
 def load_tiles_by_name(yaml_path: str, names: List[str]) -> List[Tile]:
@@ -139,93 +70,13 @@ def load_tiles_by_name(yaml_path: str, names: List[str]) -> List[Tile]:
     Returns:
         List of Tile objects
     """
-    if not os.path.isabs(yaml_path):
-        project_root = Path(__file__).parent.parent
-        yaml_path = project_root / yaml_path
-
-    with open(yaml_path, "r") as f:
-        data = yaml.safe_load(f)
+    definitions = load_tile_definitions(yaml_path)
 
     tiles = []
-    tile_dict = {tile_def.get("name"): tile_def for tile_def in data.get("tiles", [])}
-
     for name in names:
-        if name in tile_dict:
-            tile_def = tile_dict[name]
-
-            image_path = None
-            if "poke_api_image" in tile_def:
-                pokemon_name = tile_def["poke_api_image"]
-                cached_path = fetch_pokemon_image(pokemon_name)
-                if cached_path:
-                    image_path = cached_path
-                else:
-                    print(
-                        f"Warning: Could not fetch Pokemon image for '{pokemon_name}'"
-                    )
-            elif "local_image" in tile_def:
-                project_root = Path(__file__).parent.parent
-                image_path = str(project_root / "assets" / "images" / "local" / tile_def["local_image"])
-            elif "image_path" in tile_def:
-                image_path = tile_def.get("image_path")
-                if image_path and not os.path.isabs(image_path):
-                    project_root = Path(__file__).parent.parent
-                    image_path = str(project_root / image_path)
-
-            background_image = None
-            if "local_background_image" in tile_def:
-                project_root = Path(__file__).parent.parent
-                background_image = str(project_root / "assets" / "images" / "local" / tile_def["local_background_image"])
-
-            def resolve_color(color_value):
-                if isinstance(color_value, str):
-                    color_name = color_value.lstrip("$@")
-                    if hasattr(styles, "COLORS") and color_name in styles.COLORS:
-                        return styles.COLORS[color_name]
-                    try:
-                        return styles.get_color(color_name)
-                    except (KeyError, AttributeError):
-                        pass
-                    return color_value
-                elif isinstance(color_value, list):
-                    return tuple(color_value)
-                return color_value
-
-            bg_color = resolve_color(tile_def.get("background_color", [255, 255, 255]))
-            text_color = resolve_color(tile_def.get("text_color", [0, 0, 0]))
-            border_color = resolve_color(tile_def.get("border_color", [0, 0, 0]))
-
-            if isinstance(bg_color, (list, tuple)) and len(bg_color) == 3:
-                bg_color = tuple(bg_color)
-            if isinstance(text_color, (list, tuple)) and len(text_color) == 3:
-                text_color = tuple(text_color)
-            if isinstance(border_color, (list, tuple)) and len(border_color) == 3:
-                border_color = tuple(border_color)
-
-            tile = Tile(
-                width=tile_def.get("width", 600),
-                height=tile_def.get("height", 600),
-                header=tile_def.get("header"),
-                text=tile_def.get("text"),
-                image_path=image_path,
-                image_scale=tile_def.get("image_scale", 0.8),
-                image_margin_top=tile_def.get("image_margin_top"),
-                image_anchor_bottom=tile_def.get("image_anchor_bottom", False),
-                background_color=bg_color
-                if isinstance(bg_color, tuple)
-                else (255, 255, 255),
-                text_color=text_color if isinstance(text_color, tuple) else (0, 0, 0),
-                border_color=border_color
-                if isinstance(border_color, tuple)
-                else (0, 0, 0),
-                border_width=tile_def.get("border_width", 1),
-                font_size=tile_def.get("font_size"),
-                footer=tile_def.get("footer"),
-                background_image=background_image,
-                text_margin_top=tile_def.get("text_margin_top", 0),
-                text_align=tile_def.get("text_align", "center"),
-            )
-            tiles.append(tile)
+        index = definitions.index_of(name)
+        if index is not None:
+            tiles.append(tile_from_spec(definitions.specs[index]))
         else:
             print(f"Warning: Tile '{name}' not found in {yaml_path}")
 
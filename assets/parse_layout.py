@@ -1,37 +1,156 @@
 """
 Parse layout.txt to understand tile placement pattern.
+
+The layout file is parsed once into a BoardLayout, cached by the file's
+content hash. The parse_* helpers below are thin views over it.
 """
 
-def _split_sections(layout_file: str):
-    """Split layout file into sections separated by blank lines, ignoring comment lines."""
-    with open(layout_file, 'r') as f:
-        lines = [line for line in f.readlines() if not line.strip().startswith('#')]
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+DIRECTION_TO_DEGREES = {'D': 0, 'U': 180, 'L': 270, 'R': 90}
+
+_layout_cache: Dict[str, "BoardLayout"] = {}
+
+
+def _split_sections(content: str):
+    """Split layout text into sections separated by blank lines, ignoring comment lines."""
+    lines = [line for line in content.splitlines(keepends=True) if not line.strip().startswith('#')]
     content = ''.join(lines)
     sections = [s.strip() for s in content.split('\n\n') if s.strip()]
     return sections
 
 
-def parse_layout(layout_file: str = "assets/layout.txt"):
+def _split_row(line: str) -> List[str]:
+    return [cell.strip() for cell in line.strip().split('-')]
+
+
+class BoardLayout:
     """
-    Parse the layout file and return a mapping of tile numbers to (row, col) positions.
-    
-    Returns:
-        dict: {tile_number: (row, col), ...}
+    Compiled board description with dense row/col grids.
+
+    Attributes:
+        rows, cols: Board dimensions
+        tile_grid: tile_grid[row][col] is the tile number at a position, or None
+        special_grid: special_grid[row][col] is a special code (e.g. 'ru'), or None
+        rotation_grid: rotation_grid[row][col] is the rotation in degrees, or None
+        positions: positions[tile_number] is (row, col), or None if not placed
+        tile_numbers: Placed tile numbers in path order
+        connections: {tile_number: {'north': bool, 'south': bool, 'east': bool, 'west': bool}}
     """
-    sections = _split_sections(layout_file)
-    layout = {}
 
-    for row_idx, line in enumerate(sections[0].splitlines()):
-        cols = line.strip().split('-')
-        for col_idx, cell in enumerate(cols):
-            if cell != 'xx':
+    def __init__(self, content: str):
+        sections = _split_sections(content)
+        grid_rows = [_split_row(line) for line in sections[0].splitlines()]
+        self.rows = len(grid_rows)
+        self.cols = len(grid_rows[0])
+
+        self.tile_grid: List[List[Optional[int]]] = [[None] * self.cols for _ in range(self.rows)]
+        self.special_grid: List[List[Optional[str]]] = [[None] * self.cols for _ in range(self.rows)]
+        self.rotation_grid: List[List[Optional[int]]] = [[None] * self.cols for _ in range(self.rows)]
+        self.specials: Dict[str, Tuple[int, int]] = {}
+        found: Dict[int, Tuple[int, int]] = {}
+
+        for row_idx, cells in enumerate(grid_rows):
+            for col_idx, cell in enumerate(cells):
+                if cell == 'xx' or col_idx >= self.cols:
+                    continue
                 try:
                     tile_num = int(cell)
-                    layout[tile_num] = (row_idx, col_idx)
                 except ValueError:
-                    pass
+                    self.special_grid[row_idx][col_idx] = cell
+                    self.specials[cell] = (row_idx, col_idx)
+                    continue
+                self.tile_grid[row_idx][col_idx] = tile_num
+                found[tile_num] = (row_idx, col_idx)
+
+        if len(sections) >= 2:
+            for row_idx, line in enumerate(sections[1].splitlines()[:self.rows]):
+                for col_idx, cell in enumerate(_split_row(line)[:self.cols]):
+                    if cell in DIRECTION_TO_DEGREES:
+                        self.rotation_grid[row_idx][col_idx] = DIRECTION_TO_DEGREES[cell]
+
+        self.tile_numbers: List[int] = sorted(found)
+        self.positions: List[Optional[Tuple[int, int]]] = [None] * (max(found, default=0) + 1)
+        for tile_num, pos in found.items():
+            self.positions[tile_num] = pos
+
+        self.connections = self._compute_connections()
+
+    def tile_at(self, row: int, col: int) -> Optional[int]:
+        """Tile number at a position, or None."""
+        return self.tile_grid[row][col]
+
+    def position_of(self, tile_number: int) -> Optional[Tuple[int, int]]:
+        """(row, col) of a tile number, or None if it is not on the board."""
+        if 0 <= tile_number < len(self.positions):
+            return self.positions[tile_number]
+        return None
+
+    def rotation_at(self, row: int, col: int) -> int:
+        """Rotation in degrees at a position (0 if none is defined)."""
+        return self.rotation_grid[row][col] or 0
+
+    def _compute_connections(self):
+        """Determine which direction each tile connects to the next tile."""
+        connections = {}
+        tile_numbers = self.tile_numbers
+
+        for i, tile_num in enumerate(tile_numbers):
+            row, col = self.positions[tile_num]
+
+            # Find next tile in sequence
+            next_row, next_col = self.positions[tile_numbers[(i + 1) % len(tile_numbers)]]
+
+            # Determine direction to next tile
+            row_diff = next_row - row
+            col_diff = next_col - col
+
+            # Initialize borders (all True = thick border)
+            borders = {
+                'north': True,  # Top border
+                'south': True,  # Bottom border
+                'east': True,   # Right border
+                'west': True    # Left border
+            }
+
+            # Remove border in direction of movement
+            if row_diff < 0:  # Moving north (up)
+                borders['north'] = False
+            elif row_diff > 0:  # Moving south (down)
+                borders['south'] = False
+            elif col_diff > 0:  # Moving east (right)
+                borders['east'] = False
+            elif col_diff < 0:  # Moving west (left)
+                borders['west'] = False
+
+            connections[tile_num] = borders
+
+        return connections
+
+
+def load_board_layout(layout_file: str = "assets/layout.txt") -> BoardLayout:
+    """
+    Load the compiled layout for a file, reusing the cached parse while the
+    file content is unchanged.
+    """
+    with open(layout_file, 'rb') as f:
+        raw = f.read()
+    key = hashlib.sha256(raw).hexdigest()
+    if key not in _layout_cache:
+        _layout_cache[key] = BoardLayout(raw.decode('utf-8'))
+    return _layout_cache[key]
+
 
-    return layout
+def parse_layout(layout_file: str = "assets/layout.txt"):
+    """
+    Parse the layout file and return a mapping of tile numbers to (row, col) positions.
+    
+    Returns:
+        dict: {tile_number: (row, col), ...}
+    """
+    board = load_board_layout(layout_file)
+    return {tile_num: board.positions[tile_num] for tile_num in board.tile_numbers}
 
 
 def parse_special_tiles(layout_file: str = "assets/layout.txt"):
@@ -41,21 +160,7 @@ def parse_special_tiles(layout_file: str = "assets/layout.txt"):
     Returns:
         dict: {code: (row, col), ...} e.g. {'ru': (4, 3), 'tb': (4, 5)}
     """
-    sections = _split_sections(layout_file)
-    specials = {}
-
-    for row_idx, line in enumerate(sections[0].splitlines()):
-        cols = line.strip().split('-')
-        for col_idx, cell in enumerate(cols):
-            cell = cell.strip()
-            if cell == 'xx':
-                continue
-            try:
-                int(cell)
-            except ValueError:
-                specials[cell] = (row_idx, col_idx)
-
-    return specials
+    return dict(load_board_layout(layout_file).specials)
 
 
 def parse_rotation_map(layout_file: str = "assets/layout.txt"):
@@ -66,30 +171,19 @@ def parse_rotation_map(layout_file: str = "assets/layout.txt"):
         dict: {(row, col): rotation_degrees, ...}
         Rotation values: 0 (D=down), 90 (R=right), 180 (U=up), 270 (L=left)
     """
-    sections = _split_sections(layout_file)
-    if len(sections) < 2:
-        return {}
-
-    rotation_map = {}
-    direction_to_degrees = {'D': 0, 'U': 180, 'L': 270, 'R': 90}
-
-    for row_idx, line in enumerate(sections[1].splitlines()):
-        cols = line.strip().split('-')
-        for col_idx, cell in enumerate(cols):
-            cell = cell.strip()
-            if cell in direction_to_degrees:
-                rotation_map[(row_idx, col_idx)] = direction_to_degrees[cell]
-
-    return rotation_map
+    board = load_board_layout(layout_file)
+    return {
+        (row, col): degrees
+        for row, grid_row in enumerate(board.rotation_grid)
+        for col, degrees in enumerate(grid_row)
+        if degrees is not None
+    }
 
 
 def get_board_dimensions(layout_file: str = "assets/layout.txt"):
     """Get board dimensions from layout file."""
-    sections = _split_sections(layout_file)
-    lines = sections[0].splitlines()
-    rows = len(lines)
-    cols = len(lines[0].strip().split('-'))
-    return rows, cols
+    board = load_board_layout(layout_file)
+    return board.rows, board.cols
 
 
 def get_tile_connections(layout_file: str = "assets/layout.txt"):
@@ -99,41 +193,5 @@ def get_tile_connections(layout_file: str = "assets/layout.txt"):
     Returns:
         dict: {tile_number: {'north': bool, 'south': bool, 'east': bool, 'west': bool}, ...}
     """
-    layout = parse_layout(layout_file)
-    connections = {}
-    
-    # Get all tile numbers in order
-    tile_numbers = sorted(layout.keys())
-    
-    for i, tile_num in enumerate(tile_numbers):
-        row, col = layout[tile_num]
-        
-        # Find next tile in sequence
-        next_tile_num = tile_numbers[(i + 1) % len(tile_numbers)]
-        next_row, next_col = layout[next_tile_num]
-        
-        # Determine direction to next tile
-        row_diff = next_row - row
-        col_diff = next_col - col
-        
-        # Initialize borders (all True = thick border)
-        borders = {
-            'north': True,  # Top border
-            'south': True,  # Bottom border
-            'east': True,   # Right border
-            'west': True    # Left border
-        }
-        
-        # Remove border in direction of movement
-        if row_diff < 0:  # Moving north (up)
-            borders['north'] = False
-        elif row_diff > 0:  # Moving south (down)
-            borders['south'] = False
-        elif col_diff > 0:  # Moving east (right)
-            borders['east'] = False
-        elif col_diff < 0:  # Moving west (left)
-            borders['west'] = False
-        
-        connections[tile_num] = borders
-    
-    return connections
+    connections = load_board_layout(layout_file).connections
+    return {tile_num: dict(borders) for tile_num, borders in connections.items()}
@@ -0,0 +1,330 @@
+"""
+Fast, cached loading of tile definitions from YAML.
+
+Definitions are parsed with the libyaml C loader when it is available,
+validated and normalized into TileSpecs in one pass, and cached in a pickle
+sidecar keyed by the YAML file's content hash. Nothing here imports PIL, so tools that only read
+the board (like simulate.py) stay lightweight.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_DIR = PROJECT_ROOT / ".build_cache" / "tile_defs"
+LOCAL_IMAGES_DIR = PROJECT_ROOT / "assets" / "images" / "local"
+STYLES_FILE = PROJECT_ROOT / "src" / "styles.py"
+
+# Bump when the normalized format changes to invalidate old sidecars
+CACHE_VERSION = 3
+
+_memory_cache: Dict[str, "TileDefinitions"] = {}
+
+
+def resolve_yaml_path(yaml_path) -> Path:
+    """
+    Resolve a YAML path relative to the project root, falling back to assets/.
+
+    Args:
+        yaml_path: Path to YAML file (relative to project root or absolute)
+
+    Returns:
+        Resolved path
+    """
+    yaml_path = Path(yaml_path)
+    if yaml_path.is_absolute():
+        return yaml_path
+    resolved = PROJECT_ROOT / yaml_path
+    # If file doesn't exist, try assets/ directory
+    if not resolved.exists() and not str(yaml_path).startswith("assets"):
+        assets_path = PROJECT_ROOT / "assets" / yaml_path.name
+        if assets_path.exists():
+            return assets_path
+    return resolved
+
+
+# Allowed YAML keys and the types their values may have (None = may be null)
+TILE_SCHEMA: Dict[str, tuple] = {
+    "name": (str,),
+    "header": (str, None),
+    "text": (str, None),
+    "footer": (str, None),
+    "poke_api_image": (str,),
+    "local_image": (str,),
+    "image_path": (str, None),
+    "local_background_image": (str,),
+    "width": (int,),
+    "height": (int,),
+    "image_scale": (int, float),
+    "image_filter": (str,),
+    "image_margin_top": (int, None),
+    "image_anchor_bottom": (bool,),
+    "background_color": (str, list),
+    "text_color": (str, list),
+    "border_color": (str, list),
+    "border_width": (int,),
+    "font_size": (int, str, None),
+    "text_margin_top": (int,),
+    "text_align": (str,),
+}
+
+TEXT_ALIGNMENTS = ("left", "center")
+IMAGE_FILTERS = ("auto", "nearest", "lanczos")
+
+
+class TileDefinitionError(ValueError):
+    """A tile definition in the YAML file doesn't match TILE_SCHEMA."""
+
+
+@dataclass(slots=True, frozen=True)
+class TileSpec:
+    """
+    A validated, normalized tile definition: defaults applied, colors resolved
+    to interned RGB tuples and local asset paths made absolute. The PokeAPI
+    image is kept by name, since fetching it needs the network.
+    """
+
+    name: Optional[str] = None
+    poke_api_image: Optional[str] = None
+    width: int = 600
+    height: int = 600
+    header: Optional[str] = None
+    text: Optional[str] = None
+    image_path: Optional[str] = None
+    image_scale: float = 0.8
+    image_filter: str = "auto"
+    image_margin_top: Optional[int] = None
+    image_anchor_bottom: bool = False
+    background_color: Tuple[int, ...] = (255, 255, 255)
+    text_color: Tuple[int, ...] = (0, 0, 0)
+    border_color: Tuple[int, ...] = (0, 0, 0)
+    border_width: int = 1
+    font_size: Optional[int | str] = None  # Pixels, or "auto" to fit the text
+    footer: Optional[str] = None
+    background_image: Optional[str] = None
+    text_margin_top: int = 0
+    text_align: str = "center"
+
+    def tile_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for Tile, without the PokeAPI image."""
+        kwargs = {field.name: getattr(self, field.name) for field in fields(self)}
+        del kwargs["name"]
+        del kwargs["poke_api_image"]
+        return kwargs
+
+
+class _SpecCompiler:
+    """Builds TileSpecs in one pass, sharing one tuple per distinct color."""
+
+    def __init__(self):
+        from src import styles
+
+        self.styles = styles
+        self.palette: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+
+    def intern_color(self, color: Tuple[int, ...]) -> Tuple[int, ...]:
+        return self.palette.setdefault(color, color)
+
+    def resolve_color(self, color_value, default):
+        """
+        Resolve a color from YAML into an RGB tuple.
+
+        Named colors ("gym", "$gym", "@gym") are looked up in src.styles.
+        Unknown names fall back to `default`.
+        """
+        if isinstance(color_value, str):
+            # Remove $ or @ prefix if present
+            color_name = color_value.lstrip("$@")
+            try:
+                color_value = self.styles.get_color(color_name)
+            except (KeyError, AttributeError):
+                return self.intern_color(default)
+        return self.intern_color(tuple(color_value))
+
+    def validate(self, index: int, tile_def: Dict[str, Any]):
+        """Check a raw definition against TILE_SCHEMA."""
+        label = f"Tile #{index + 1} ({tile_def.get('name', 'unnamed')})"
+        if not isinstance(tile_def, dict):
+            raise TileDefinitionError(f"{label}: expected a mapping, got {type(tile_def).__name__}")
+
+        for key, value in tile_def.items():
+            if key not in TILE_SCHEMA:
+                print(f"Warning: {label}: unknown key '{key}' is ignored")
+                continue
+            allowed = TILE_SCHEMA[key]
+            if value is None and None in allowed:
+                continue
+            types = tuple(t for t in allowed if t is not None)
+            # bool is an int subclass; only accept it where bool is expected
+            if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                names = ", ".join("null" if t is None else t.__name__ for t in allowed)
+                raise TileDefinitionError(
+                    f"{label}: '{key}' must be {names}, got {type(value).__name__}"
+                )
+
+        for key in ("background_color", "text_color", "border_color"):
+            value = tile_def.get(key)
+            if isinstance(value, list) and not all(
+                isinstance(c, int) and 0 <= c <= 255 for c in value
+            ):
+                raise TileDefinitionError(f"{label}: '{key}' must be a list of 0-255 integers")
+
+        if tile_def.get("image_filter", "auto") not in IMAGE_FILTERS:
+            raise TileDefinitionError(
+                f"{label}: 'image_filter' must be one of {', '.join(IMAGE_FILTERS)}"
+            )
+
+        font_size = tile_def.get("font_size")
+        if isinstance(font_size, str) and font_size != "auto":
+            raise TileDefinitionError(f"{label}: 'font_size' must be a number or \"auto\"")
+
+        if tile_def.get("text_align", "center") not in TEXT_ALIGNMENTS:
+            raise TileDefinitionError(
+                f"{label}: 'text_align' must be one of {', '.join(TEXT_ALIGNMENTS)}"
+            )
+
+    def compile(self, index: int, tile_def: Dict[str, Any]) -> TileSpec:
+        self.validate(index, tile_def)
+
+        background_image = None
+        if "local_background_image" in tile_def:
+            background_image = str(LOCAL_IMAGES_DIR / tile_def["local_background_image"])
+
+        return TileSpec(
+            name=tile_def.get("name"),
+            poke_api_image=tile_def.get("poke_api_image"),
+            width=tile_def.get("width", 600),
+            height=tile_def.get("height", 600),
+            header=tile_def.get("header"),
+            text=tile_def.get("text"),
+            image_path=_resolve_image_path(tile_def),
+            image_scale=tile_def.get("image_scale", 0.8),
+            image_filter=tile_def.get("image_filter", "auto"),
+            image_margin_top=tile_def.get("image_margin_top"),
+            image_anchor_bottom=tile_def.get("image_anchor_bottom", False),
+            background_color=self.resolve_color(tile_def.get("background_color", [255, 255, 255]), (255, 255, 255)),
+            text_color=self.resolve_color(tile_def.get("text_color", [0, 0, 0]), (0, 0, 0)),
+            border_color=self.resolve_color(tile_def.get("border_color", [0, 0, 0]), (0, 0, 0)),
+            border_width=tile_def.get("border_width", 1),
+            font_size=tile_def.get("font_size"),
+            footer=tile_def.get("footer"),
+            background_image=background_image,
+            text_margin_top=tile_def.get("text_margin_top", 0),
+            text_align=tile_def.get("text_align", "center"),
+        )
+
+
+def _resolve_image_path(tile_def: Dict[str, Any]) -> Optional[str]:
+    """Absolute path of a tile's local image. PokeAPI images are resolved later."""
+    if "poke_api_image" in tile_def:
+        return None
+    if "local_image" in tile_def:
+        return str(LOCAL_IMAGES_DIR / tile_def["local_image"])
+    image_path = tile_def.get("image_path")
+    if image_path and not os.path.isabs(image_path):
+        return str(PROJECT_ROOT / image_path)
+    return image_path
+
+
+def compile_tile_specs(raw: List[Dict[str, Any]]) -> List[TileSpec]:
+    """Validate and normalize raw YAML tile entries in one pass."""
+    compiler = _SpecCompiler()
+    return [compiler.compile(i, tile_def) for i, tile_def in enumerate(raw)]
+
+
+class TileDefinitions:
+    """
+    Parsed tile definitions with an in-memory index.
+
+    Attributes:
+        raw: Tile entries exactly as written in the YAML file
+        specs: Validated TileSpecs, same order
+        by_name: {name: index}; later duplicates win
+    """
+
+    def __init__(self, raw: List[Dict[str, Any]], specs: Optional[List[TileSpec]] = None):
+        self.raw = raw
+        if specs is None:
+            specs = compile_tile_specs(raw)
+        self.specs = specs
+        self.by_name = {tile_def.get("name"): i for i, tile_def in enumerate(raw)}
+
+    def __len__(self):
+        return len(self.raw)
+
+    def index_of(self, name: str) -> Optional[int]:
+        """Index of the tile with this name, or None."""
+        return self.by_name.get(name)
+
+
+def _cache_key(content: bytes) -> str:
+    digest = hashlib.sha256(content)
+    digest.update(str(PROJECT_ROOT).encode("utf-8"))
+    digest.update(str(CACHE_VERSION).encode("utf-8"))
+    try:
+        digest.update(STYLES_FILE.read_bytes())
+    except OSError:
+        pass
+    return digest.hexdigest()
+
+
+def load_tile_definitions(yaml_path, use_cache: bool = True) -> TileDefinitions:
+    """
+    Load tile definitions, served from memory or the sidecar cache when the
+    YAML content is unchanged.
+
+    Args:
+        yaml_path: Path to YAML file (relative to project root or absolute)
+        use_cache: Whether to read and write the sidecar cache
+
+    Returns:
+        TileDefinitions for the file
+    """
+    path = resolve_yaml_path(yaml_path)
+    with open(path, "rb") as f:
+        content = f.read()
+    key = _cache_key(content)
+
+    if key in _memory_cache:
+        return _memory_cache[key]
+
+    sidecar = CACHE_DIR / f"{key}.pickle"
+    if use_cache and sidecar.exists():
+        try:
+            with open(sidecar, "rb") as f:
+                raw, specs = pickle.load(f)
+            definitions = TileDefinitions(raw, specs)
+            _memory_cache[key] = definitions
+            return definitions
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError) as e:
+            print(f"Warning: Ignoring unreadable tile cache {sidecar}: {e}")
+
+    data = yaml.load(content, Loader=SafeLoader) or {}
+    definitions = TileDefinitions(data.get("tiles", []))
+
+    if use_cache:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = sidecar.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    (definitions.raw, definitions.specs), f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, sidecar)
+        except OSError as e:
+            print(f"Warning: Could not write tile cache {sidecar}: {e}")
+
+    _memory_cache[key] = definitions
+    return definitions
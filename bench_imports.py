@@ -0,0 +1,67 @@
+"""
+Import-time benchmark for the CLI entry points.
+Usage: python bench_imports.py [runs]
+
+Imports each entry point in fresh interpreters, like a watch-mode rebuild
+or a `--check` run starts, and reports the median import time and which
+heavy optional libraries got loaded along the way. ReportLab, requests and
+NumPy should only show up where a code path needs them.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+DEFAULT_RUNS = 7
+
+# Label -> statement run in a fresh interpreter
+ENTRY_POINTS = {
+    "main.py (CLI, --check)": "import main",
+    "simulate.py (tile definitions)": "from assets.tile_defs import load_tile_definitions",
+    "src.tile": "from src.tile import Tile",
+    "src.engine": "from src.engine import BoardGameEngine",
+    "src (package)": "import src",
+}
+
+HEAVY_MODULES = ("PIL.Image", "numpy", "reportlab", "requests", "yaml")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [m for m in {heavy!r} if m in sys.modules]]))
+"""
+
+
+def time_import(statement: str, runs: int):
+    """
+    Import in `runs` fresh interpreters.
+
+    Returns:
+        (median seconds, heavy modules loaded)
+    """
+    times = []
+    loaded = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, check=True,
+        )
+        elapsed, loaded = json.loads(result.stdout.strip().splitlines()[-1])
+        times.append(elapsed)
+    return statistics.median(times), loaded
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    print(f"Import times, median of {runs} fresh interpreters")
+    print("=" * 50)
+    for label, statement in ENTRY_POINTS.items():
+        seconds, loaded = time_import(statement, runs)
+        print(f"  {label:32} {seconds * 1000:7.1f}ms  loads: {', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
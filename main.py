@@ -1,248 +1,734 @@
 from src import BoardGameEngine
 from src.tile import Tile
+from src.asset_handle import PREFETCH_WORKERS, prefetch_tiles
+from src.build_cache import CACHE_DIR, BuildCache, hash_file, hash_files, hash_values
+from src.engine import PAGE_SIZES, applied_profile, mm_to_pixels, output_profile
+from src.derived_assets import DERIVED, derive_asset, tile_asset_requests
+from src.info_panels import load_rules_index, render_info_panel
+from src.layout_check import check_tile
+from src.pipeline import Stage, run_pipeline
+from src.sprite_atlas import build_sprite_atlas, tile_source_images
 from assets.load_tiles import load_tiles_from_yaml
-from assets.parse_layout import parse_layout, get_board_dimensions, get_tile_connections, parse_rotation_map, parse_special_tiles
-from PIL import Image, ImageDraw, ImageFont
+from assets.parse_layout import load_board_layout
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import List, Optional, Tuple
 import os
-import re
 import sys
+import time
+
+
+PROJECT_ROOT = Path(__file__).parent
+FONT_FILES = [
+    PROJECT_ROOT / "assets" / "fonts" / "gbboot.ttf",
+    PROJECT_ROOT / "assets" / "fonts" / "gil.TTF",
+]
+RULES_FILE = "docs/rules.md"
+
+# Modules a tile render depends on: the tile layout and rasterizer, image
+# resolution and scaling, and the size conversions in engine.py
+RENDERER_FILES = [
+    PROJECT_ROOT / "src" / "tile.py",
+    PROJECT_ROOT / "src" / "glyphs.py",
+    PROJECT_ROOT / "src" / "derived_assets.py",
+    PROJECT_ROOT / "src" / "display_list.py",
+    PROJECT_ROOT / "src" / "sprite_atlas.py",
+    PROJECT_ROOT / "src" / "asset_handle.py",
+    PROJECT_ROOT / "src" / "engine.py",
+]
+
+# Modules an info panel render depends on
+PANEL_RENDERER_FILES = [
+    PROJECT_ROOT / "src" / "info_panels.py",
+    PROJECT_ROOT / "src" / "glyphs.py",
+]
+
+# Modules the board exports depend on: composition, the PNG/PDF/SVG writers
+# and the vector PDF and SVG drawn from tile display lists
+EXPORT_RENDERER_FILES = [
+    PROJECT_ROOT / "main.py",
+    PROJECT_ROOT / "src" / "engine.py",
+    PROJECT_ROOT / "src" / "stream_export.py",
+    PROJECT_ROOT / "src" / "display_list.py",
+]
+
+# Threads of the tile pipeline's CPU stages (fetching uses PREFETCH_WORKERS)
+DERIVE_WORKERS = 4
+RENDER_WORKERS = 2
+
+TILE_SIZE = 600
+BOARD_DPI = 300
+# Physical size of a board cell; tiles are rendered to fill it at each variant's DPI
+TILE_MM = TILE_SIZE / BOARD_DPI * 25.4
+
+# Special info panels in the center area: code -> (header, rules section, height in tiles)
+SPECIAL_PANELS = {
+    "ru": ("Rules", "Basics", 2),
+    "tb": ("Trainer Battle", "Trainer Battle", 2),
+    "gb": ("Gym Battle", "Gym Mechanics", 2),
+    "it": ("Items", "Items", 1),
+}
 
-
-TRANSPOSE_MAP = {
-    90: Image.Transpose.ROTATE_90,
-    180: Image.Transpose.ROTATE_180,
-    270: Image.Transpose.ROTATE_270,
+# Board variants buildable in one run with --variants
+VARIANTS = {
+    "plain": {"rotation": False, "page": "A4", "dpi": BOARD_DPI, "suffix": ""},
+    "rotated": {"rotation": True, "page": "A4", "dpi": BOARD_DPI, "suffix": "_rotated"},
+    "a3": {"rotation": True, "page": "A3", "dpi": BOARD_DPI, "suffix": "_rotated_a3"},
+    "print600dpi": {"rotation": True, "page": "A4", "dpi": 600, "suffix": "_rotated_600dpi"},
 }
 
-def rotate_tile(tile_image: Image.Image, degrees: int) -> Image.Image:
-    """Rotate tile using lossless transpose for 90-degree increments."""
-    if degrees == 0:
-        return tile_image
-    if degrees in TRANSPOSE_MAP:
-        return tile_image.transpose(TRANSPOSE_MAP[degrees])
-    return tile_image.rotate(degrees, expand=True)
 
+def tile_signature(tile: Tile, fonts_sig: str, dpi: int = BOARD_DPI) -> str:
+    """
+    Hash everything a tile render depends on: its settings, images, fonts and
+    renderer. Images are hashed as they are on disk, so signing never waits
+    on a fetch; a PokeAPI image not downloaded yet counts as no image.
+    """
+    image_path, background_path = tile.local_image_paths()
+    return hash_values(
+        sorted(vars(tile).items()),
+        hash_file(image_path),
+        hash_file(background_path),
+        fonts_sig,
+        hash_files(RENDERER_FILES),
+        tile_scale(tile, dpi),
+    )
+
+
+def tile_px(dpi: int) -> int:
+    """Board cell size in pixels at a resolution."""
+    return mm_to_pixels(TILE_MM, dpi)
 
-def parse_rules_section(rules_file: str, section_name: str) -> str:
-    """Extract a section from rules.md by heading name."""
-    with open(rules_file) as f:
-        content = f.read()
 
-    pattern = rf"## {re.escape(section_name)}\s*\n(.*?)(?=\n#+ |\Z)"
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return ""
+def tile_scale(tile: Tile, dpi: int) -> float:
+    """Render scale that draws a tile at its physical board size at `dpi`."""
+    return tile.scale_for(TILE_MM, dpi)
 
 
-def render_info_panel(header: str, body: str, width: int, height: int) -> Image.Image:
-    """Render a free-form info panel with header and body text at native resolution."""
-    w, h = width, height
-    project_root = Path(__file__).parent
-    fonts_dir = project_root / "assets" / "fonts"
+def prepare_board(
+    yaml_file: str, layout_file: str, scale: float = 1.0, svg: bool = False
+) -> dict:
+    """
+    Load tiles, layout and rules. Nothing is rendered here; the plan is
+    shared by all variants, and render signatures are computed per
+    resolution on demand (see render_signatures).
 
-    img = Image.new("RGB", (w, h), (255, 255, 255))
-    draw = ImageDraw.Draw(img)
+    Args:
+        yaml_file: Tile definitions
+        layout_file: Board layout
+        scale: Preview scale; below 1.0 builds a low-resolution preview
+        svg: Also export each variant as SVG (not for previews)
+    """
+    tiles = load_tiles_from_yaml(yaml_file)
+    print(f"Loaded {len(tiles)} tiles from {yaml_file}")
+
+    # Parse layout to get tile positions
+    layout = load_board_layout(layout_file)
 
-    def get_font(size, font_type="text"):
-        if font_type == "header":
-            path = fonts_dir / "gbboot.ttf"
+    print(f"Board layout: {layout.rows}x{layout.cols} (from {layout_file})")
+    print(f"Layout defines {len(layout.tile_numbers)} tile positions")
+
+    # Tile 1 (index 0) goes to position 01, tile 2 (index 1) goes to position 02, etc.
+    placements = []
+    for tile_index, tile in enumerate(tiles):
+        tile_number = tile_index + 1  # Tiles are 1-indexed in layout
+        position = layout.position_of(tile_number)
+        if position is not None:
+            row, col = position
+            placements.append((tile_number, tile, row, col))
         else:
-            path = fonts_dir / "gil.TTF"
-        try:
-            return ImageFont.truetype(str(path), size)
-        except Exception:
-            return ImageFont.load_default()
-
-    header_font = get_font(w // 10, "header")
-    hbox = draw.textbbox((0, 0), header, font=header_font)
-    hx = (w - (hbox[2] - hbox[0])) // 2
-    draw.text((hx, 10), header, fill=(0, 0, 0), font=header_font)
-    y = hbox[3] - hbox[1] + 40
-
-    body_font = get_font(w // 18)
-    padding = 16
-    available_width = w - padding * 2
-    line_h = draw.textbbox((0, 0), "Ag", font=body_font)[3] + 4
-
-    def parse_styled(text):
-        """Parse text into [(word, is_bold), ...]"""
-        segments = re.split(r"(\*\*.*?\*\*)", text)
-        result = []
-        for seg in segments:
-            if not seg:
-                continue
-            bold = seg.startswith("**") and seg.endswith("**")
-            clean = seg[2:-2] if bold else seg
-            for w in clean.split():
-                result.append((w, bold))
-        return result
-
-    def draw_styled_line(styled_words, x, y):
-        plain = " ".join(w for w, _ in styled_words)
-        cursor_x = x
-        for i, (word, bold) in enumerate(styled_words):
-            prefix = " ".join(w for w, _ in styled_words[:i])
-            if prefix:
-                prefix += " "
-            px = draw.textbbox((0, 0), prefix, font=body_font)[2] - draw.textbbox((0, 0), prefix, font=body_font)[0]
-            wx = x + px
-            draw.text((wx, y), word, fill=(0, 0, 0), font=body_font)
-            if bold:
-                draw.text((wx + 1, y), word, fill=(0, 0, 0), font=body_font)
-                draw.text((wx + 2, y), word, fill=(0, 0, 0), font=body_font)
-
-    for line in body.split("\n"):
-        stripped = line.strip()
-        if not stripped:
-            y += 6
-            continue
+            print(
+                f"Warning: Tile {tile_number} (index {tile_index}) not found in layout"
+            )
 
-        styled_words = parse_styled(stripped)
-        current_line = []
+    rules = load_rules_index(RULES_FILE)
+    panels = []
+    for code, (header, section, height_tiles) in SPECIAL_PANELS.items():
+        if code in layout.specials:
+            anchor_row, anchor_col = layout.specials[code]
+            body = rules.get(section, "")
+            if body:
+                panels.append((code, header, body, anchor_row, anchor_col, height_tiles))
+
+    return {
+        "output_name": os.path.splitext(os.path.basename(yaml_file))[0],
+        "layout": layout,
+        "placements": placements,
+        "panels": panels,
+        "fonts_sig": hash_files(FONT_FILES),
+        "panel_renderer_sig": hash_files(PANEL_RENDERER_FILES),
+        "renderer_sig": hash_files(EXPORT_RENDERER_FILES),
+        "scale": scale,
+        "preview": scale != 1.0,
+        "svg": svg and scale == 1.0,
+        "signatures": {},
+    }
 
-        for word, bold in styled_words:
-            test_text = " ".join(w for w, _ in current_line + [(word, bold)])
-            tw = draw.textbbox((0, 0), test_text, font=body_font)[2] - draw.textbbox((0, 0), test_text, font=body_font)[0]
-            if tw <= available_width:
-                current_line.append((word, bold))
-            else:
-                if current_line:
-                    draw_styled_line(current_line, padding, y)
-                    y += line_h
-                current_line = [(word, bold)]
 
-        if current_line:
-            draw_styled_line(current_line, padding, y)
-            y += line_h
+def render_signatures(plan: dict, dpi: int) -> Tuple[dict, dict]:
+    """
+    Signatures of every tile and panel render at a resolution.
+
+    Panels depend only on their own text, size, fonts and renderer, so a
+    build with unchanged rules reuses every cached panel.
+
+    Returns:
+        ({tile_number: signature}, {panel_code: signature})
+    """
+    if dpi not in plan["signatures"]:
+        fonts_sig = plan["fonts_sig"]
+        tile_sigs = {
+            tile_number: tile_signature(tile, fonts_sig, dpi)
+            for tile_number, tile, _, _ in plan["placements"]
+        }
+        cell = tile_px(dpi)
+        panel_sigs = {
+            code: hash_values(
+                header, body, cell, cell * height_tiles, cell / TILE_SIZE,
+                fonts_sig, plan["panel_renderer_sig"],
+            )
+            for code, header, body, _, _, height_tiles in plan["panels"]
+        }
+        plan["signatures"][dpi] = (tile_sigs, panel_sigs)
+    return plan["signatures"][dpi]
 
-    return img
 
+def render_node(kind: str, key, dpi: int) -> str:
+    """Build cache node of a tile or panel render at a resolution."""
+    return f"{kind}:{key}" if dpi == BOARD_DPI else f"{kind}:{key}@{dpi}dpi"
 
-def create_board_from_yaml(
-    yaml_file: str = "assets/tiles.yaml",
-    layout_file: str = "assets/layout.txt",
-    tile_rotation: bool = False,
-):
-    """Create a board using tiles defined in a YAML file, following the layout pattern."""
 
-    # Create output directory
-    os.makedirs("output", exist_ok=True)
+def variant_outputs(plan: dict, variant: dict) -> Tuple[str, Optional[str], Optional[str]]:
+    """PNG, PDF and SVG paths for a variant. Previews only have a PNG."""
+    base = f"output/board_{plan['output_name']}{variant['suffix']}"
+    if plan["preview"]:
+        return f"{base}_preview.png", None, None
+    return f"{base}.png", f"{base}.pdf", f"{base}.svg" if plan["svg"] else None
 
-    # Load tiles from YAML
-    tiles = load_tiles_from_yaml(yaml_file)
 
-    print(f"Loaded {len(tiles)} tiles from {yaml_file}")
+def variant_dpi(plan: dict, variant: dict) -> int:
+    """Resolution a variant is rendered and exported at, scaled down for previews."""
+    return round(variant["dpi"] * plan["scale"])
+
+
+def placement_rotation(layout, variant: dict, row: int, col: int) -> int:
+    """Rotation of the tile at (row, col) in a variant."""
+    return layout.rotation_at(row, col) if variant["rotation"] else 0
 
-    # Parse layout to get tile positions and connections
-    layout = parse_layout(layout_file)
-    board_rows, board_cols = get_board_dimensions(layout_file)
-    tile_connections = get_tile_connections(layout_file)
-    rotation_map = parse_rotation_map(layout_file) if tile_rotation else {}
-    
-    print(f"Board layout: {board_rows}x{board_cols} (from {layout_file})")
-    print(f"Layout defines {len(layout)} tile positions")
-    
-    if tile_rotation:
-        print(f"Tile rotation enabled: {len(rotation_map)} rotation entries loaded")
-    
-    # Initialize engine
+
+def variant_signatures(plan: dict, variant: dict, engine_options: dict) -> Tuple[str, str]:
+    """Build signatures of a variant's PNG and PDF exports."""
+    layout = plan["layout"]
+    dpi = variant_dpi(plan, variant)
+    tile_sigs, panel_sigs = render_signatures(plan, dpi)
+    # Signed with the encoding actually applied, which the canvas can change
+    profile = applied_profile(
+        output_profile(engine_options["profile"], engine_options["jpeg_quality"]),
+        engine_options["canvas"],
+    )
+    board_sig = hash_values(
+        [
+            (n, r, c, placement_rotation(layout, variant, r, c), tile_sigs[n])
+            for n, _, r, c in plan["placements"]
+        ],
+        [(code, r, c, panel_sigs[code]) for code, _, _, r, c, _ in plan["panels"]],
+        layout.rows,
+        layout.cols,
+        tile_px(dpi),
+        dpi,
+        plan["renderer_sig"],
+        profile["png_encoder"],
+        profile["png_compress_level"],
+        profile["png_optimize"],
+    )
+    return board_sig, hash_values(board_sig, variant["page"], sorted(profile.items()))
+
+
+def tiles_to_fetch(plan: dict, dpis: List[int], cache: BuildCache) -> set:
+    """
+    Tiles whose images must be resolved before they render: those with a
+    render at one of `dpis` missing from the cache, and those with a PokeAPI
+    image not downloaded yet, which is retried whenever the board is built.
+
+    Returns:
+        Tile numbers
+    """
+    tile_numbers = set()
+    for tile_number, tile, _, _ in plan["placements"]:
+        downloaded = all(handle.local_path() for handle in tile.asset_handles())
+        cached = all(
+            cache.has_image(
+                render_node("tile", tile_number, dpi),
+                render_signatures(plan, dpi)[0][tile_number],
+            )
+            for dpi in dpis
+        )
+        if not (downloaded and cached):
+            tile_numbers.add(tile_number)
+    return tile_numbers
+
+
+def render_images(plan: dict, dpis: List[int], cache: BuildCache) -> dict:
+    """
+    Render (or load from the cache) every tile and panel at each resolution.
+
+    Tiles run through a staged pipeline (see src/pipeline.py): resolve their
+    images, derive the pre-scaled sprites, render. A tile moves on as soon
+    as its stage is done with it, so tiles render while other tiles' sprites
+    are still downloading. Only tiles that will render, or still miss a
+    download, are fetched (see tiles_to_fetch). Panels don't use images and
+    render alongside.
+
+    Returns:
+        {dpi: ({tile_number: image}, {panel_code: image})}
+    """
+    fonts_sig = plan["fonts_sig"]
+    fetch_numbers = tiles_to_fetch(plan, dpis, cache)
+    prefetch_tiles(tile for number, tile, _, _ in plan["placements"] if number in fetch_numbers)
+
+    def fetch(job):
+        dpi, tile_number, tile = job
+        if tile_number in fetch_numbers:
+            for handle in tile.asset_handles():
+                handle.resolve()
+        signature = tile_signature(tile, fonts_sig, dpi)
+        # Exports are signed with the renders they actually contain
+        render_signatures(plan, dpi)[0][tile_number] = signature
+        return dpi, tile_number, tile, signature
+
+    def derive(job):
+        dpi, tile_number, tile, signature = job
+        # Derive pre-scaled sprites and backgrounds first, so the render only pastes
+        if not cache.has_image(render_node("tile", tile_number, dpi), signature):
+            for request in tile_asset_requests(tile, tile_scale(tile, dpi)):
+                derive_asset(request)
+        return job
+
+    def render(job):
+        dpi, tile_number, tile, signature = job
+        return cache.image(
+            render_node("tile", tile_number, dpi),
+            signature,
+            partial(tile.render, tile_scale(tile, dpi)),
+        )
+
+    def render_panels(dpi):
+        _, panel_sigs = render_signatures(plan, dpi)
+        cell = tile_px(dpi)
+        return {
+            code: cache.image(
+                render_node("panel", code, dpi),
+                panel_sigs[code],
+                partial(render_info_panel, header, body, cell, cell * height_tiles, cell / TILE_SIZE),
+            )
+            for code, header, body, _, _, height_tiles in plan["panels"]
+        }
+
+    jobs = [
+        (dpi, tile_number, tile)
+        for dpi in dpis
+        for tile_number, tile, _, _ in plan["placements"]
+    ]
+    with ThreadPoolExecutor(max_workers=1) as panel_pool:
+        panels = {dpi: panel_pool.submit(render_panels, dpi) for dpi in dpis}
+        renders = run_pipeline(
+            jobs,
+            [
+                Stage("fetch", fetch, workers=PREFETCH_WORKERS),
+                Stage("derive", derive, workers=DERIVE_WORKERS),
+                Stage("render", render, workers=RENDER_WORKERS),
+            ],
+        )
+
+    images = {dpi: ({}, panels[dpi].result()) for dpi in dpis}
+    for (dpi, tile_number, _), image in zip(jobs, renders):
+        images[dpi][0][tile_number] = image
+    for dpi in dpis:
+        print(f"Rendered {len(images[dpi][0])} tiles at {dpi} DPI")
+    return images
+
+
+def compose_board(
+    plan: dict,
+    variant: dict,
+    tile_images: dict,
+    panel_images: dict,
+    engine_options: dict,
+) -> BoardGameEngine:
+    """Place the tile renders and info panels for one variant."""
+    layout = plan["layout"]
+    cell = tile_px(variant_dpi(plan, variant))
     engine = BoardGameEngine(
-        tile_width=600,
-        tile_height=600,
-        board_cols=board_cols,
-        board_rows=board_rows,
+        tile_width=cell,
+        tile_height=cell,
+        board_cols=layout.cols,
+        board_rows=layout.rows,
         tile_spacing=0,  # No spacing between tiles
+        # Keep the canvas file on disk; the system temp dir is often in RAM
+        canvas_dir=CACHE_DIR / "canvas",
+        edge_color=(0, 0, 0),  # Top and left border
+        **engine_options,
     )
-    
-    # Place tiles according to layout pattern
-    # Tile 1 (index 0) goes to position 01, tile 2 (index 1) goes to position 02, etc.
-    placed_count = 0
-    for tile_index, tile in enumerate(tiles):
-        tile_number = tile_index + 1  # Tiles are 1-indexed in layout
-        if tile_number in layout:
-            row, col = layout[tile_number]
-            tile_image = tile.render()
-            
-            if tile_rotation and (row, col) in rotation_map:
-                tile_image = rotate_tile(tile_image, rotation_map[(row, col)])
-            
-            engine.set_tile(row, col, tile_image)
-            placed_count += 1
+    # Vector outputs draw the tiles from their layouts instead of the renders
+    vector = plan["svg"] or engine.output_profile["pdf_image"] == "vector"
+    for tile_number, tile, row, col in plan["placements"]:
+        rotation = placement_rotation(layout, variant, row, col)
+        display_list = tile.display_list() if vector else None
+        engine.set_tile(row, col, tile_images[tile_number], rotation, display_list)
+
+    for code, _, _, anchor_row, anchor_col, _ in plan["panels"]:
+        engine.add_overlay(panel_images[code], (anchor_col * cell, anchor_row * cell))
+
+    return engine
+
+
+def export_variant(
+    plan: dict,
+    name: str,
+    cache: BuildCache,
+    tile_images: dict,
+    panel_images: dict,
+    engine_options: dict,
+):
+    """
+    Compose and export one variant, skipping outputs that are up to date.
+
+    Tiles and panels come rendered at the variant's own DPI, so the board is
+    composed at its final resolution and never resampled.
+
+    With the memory canvas the board is rendered once and shared by the PNG
+    and PDF exports. With the memmap canvas the engine composes into a file
+    and encodes both exports in strips, so the composed board is never held
+    in RAM (the tile renders still are). When the profile's PDF image is
+    lossless, the PDF embeds the PNG's compressed data instead of encoding
+    the board a second time. The SVG is drawn from the tile layouts. The
+    exports are encoded concurrently. Previews only write the PNG.
+    """
+    variant = VARIANTS[name]
+    png_path, pdf_path, svg_path = variant_outputs(plan, variant)
+    board_sig, pdf_sig = variant_signatures(plan, variant, engine_options)
+    board_node = f"board:{png_path}"
+    pdf_node = f"pdf:{pdf_path}"
+    svg_node = f"svg:{svg_path}"
+    canvas = engine_options["canvas"]
+
+    engine = compose_board(plan, variant, tile_images, panel_images, engine_options)
+    embed_png = engine.can_embed_png()
+    board = None
+
+    def export_png():
+        engine.export_image(png_path, dpi=variant_dpi(plan, variant), board=board)
+        cache.record(board_node, board_sig, [png_path])
+
+    def export_pdf():
+        engine.export_pdf(
+            pdf_path,
+            page_size=PAGE_SIZES[variant["page"]],
+            board=board,
+            png_path=png_path if embed_png else None,
+        )
+        cache.record(pdf_node, pdf_sig, [pdf_path])
+
+    def export_svg():
+        engine.export_svg(svg_path, dpi=variant_dpi(plan, variant))
+        cache.record(svg_node, board_sig, [svg_path])
+
+    try:
+        png_fresh = cache.is_fresh(board_node, board_sig, [png_path])
+        pdf_stale = bool(pdf_path) and not cache.is_fresh(pdf_node, pdf_sig, [pdf_path])
+        svg_stale = bool(svg_path) and not cache.is_fresh(svg_node, board_sig, [svg_path])
+        # Only a raster PDF encoded from the board pixels reads the board
+        pdf_needs_board = (
+            pdf_stale and not embed_png
+            and engine.output_profile["pdf_image"] != "vector"
+        )
+        if png_fresh:
+            if canvas == "memory" and pdf_needs_board:
+                with Image.open(png_path) as existing:
+                    board = existing.convert("RGB")
+            print(f"[{name}] Board {png_path} is up to date")
+        elif canvas == "memory":
+            board = engine.render_board()
         else:
-            print(
-                f"Warning: Tile {tile_number} (index {tile_index}) not found in layout"
+            engine.render_canvas()  # Compose once, before the exports read it
+
+        # The exports encode the composed board concurrently, except that a
+        # PDF embedding the PNG's data waits for the PNG
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            png_future = None if png_fresh else pool.submit(export_png)
+            futures = [png_future] if png_future else []
+            if pdf_stale:
+                if embed_png and png_future:
+                    png_future.result()
+                futures.append(pool.submit(export_pdf))
+            if svg_stale:
+                futures.append(pool.submit(export_svg))
+            for future in futures:
+                future.result()
+    finally:
+        engine.close()
+
+
+def build_variants(
+    yaml_file: str = "assets/tiles.yaml",
+    variants: List[str] = ("plain",),
+    layout_file: str = "assets/layout.txt",
+    use_cache: bool = True,
+    compositor: str = "pil",
+    canvas: str = "memory",
+    profile: str = "release",
+    jpeg_quality: Optional[int] = None,
+    preview_scale: Optional[float] = None,
+    svg: bool = False,
+):
+    """
+    Build several board variants from one load and one render of the tiles.
+
+    Tile renders and info panels are shared by all variants at the same DPI
+    (rotation is applied at placement). Tiles are fetched, derived and
+    rendered in a staged pipeline (see render_images), and the variants are
+    composed and exported in parallel.
+    Tile renders, info panels and exports are tracked in the build cache
+    (.build_cache/), so only nodes whose inputs changed are rebuilt.
+
+    With `preview_scale` (e.g. 0.25) everything is rendered at that fraction
+    of the resolution into `*_preview.png` files, and no PDF is written.
+    With `svg` each variant is also exported as a vector SVG.
+    """
+    unknown = [name for name in variants if name not in VARIANTS]
+    if unknown:
+        raise ValueError(f"Unknown variant(s) {unknown}, choose from {list(VARIANTS)}")
+
+    engine_options = {
+        "compositor": compositor,
+        "canvas": canvas,
+        "profile": profile,
+        "jpeg_quality": jpeg_quality,
+    }
+    output_profile(profile)  # Fail on an unknown profile before doing any work
+    scale = preview_scale or 1.0
+    if not 0 < scale <= 1:
+        raise ValueError(f"Preview scale must be in (0, 1], got {scale}")
+
+    os.makedirs("output", exist_ok=True)
+    cache = BuildCache(enabled=use_cache)
+    plan = prepare_board(yaml_file, layout_file, scale, svg)
+
+    # Images that couldn't be downloaded sign as missing, so the outputs look
+    # fresh without them; retry the downloads on every run instead
+    undownloaded = sum(
+        not handle.local_path()
+        for _, tile, _, _ in plan["placements"]
+        for handle in tile.asset_handles()
+    )
+    if undownloaded:
+        print(f"{undownloaded} PokeAPI images not downloaded yet, retrying")
+
+    stale = []
+    for name in variants:
+        variant = VARIANTS[name]
+        png_path, pdf_path, svg_path = variant_outputs(plan, variant)
+        if undownloaded:
+            stale.append(name)
+            continue
+        # Outputs never built are stale whatever their inputs, so a cold build
+        # starts rendering without waiting for every image to be fetched
+        # and hashed for the signatures
+        if not all(
+            cache.was_built(f"{kind}:{path}", [path])
+            for kind, path in (("board", png_path), ("pdf", pdf_path), ("svg", svg_path))
+            if path
+        ):
+            stale.append(name)
+            continue
+        board_sig, pdf_sig = variant_signatures(plan, variant, engine_options)
+        if (
+            cache.is_fresh(f"board:{png_path}", board_sig, [png_path])
+            and (pdf_path is None or cache.is_fresh(f"pdf:{pdf_path}", pdf_sig, [pdf_path]))
+            and (svg_path is None or cache.is_fresh(f"svg:{svg_path}", board_sig, [svg_path]))
+        ):
+            outputs = ", ".join(path for path in (png_path, pdf_path, svg_path) if path)
+            print(f"✓ [{name}] Board is up to date ({outputs})")
+        else:
+            stale.append(name)
+
+    if not stale:
+        return
+
+    # Pack every source image into one sheet, so each is decoded once
+    DERIVED.atlas = build_sprite_atlas(
+        tile_source_images(tile for _, tile, _, _ in plan["placements"])
+    )
+
+    # Render every tile and panel once per resolution, shared by all
+    # variants at that resolution
+    dpis = sorted({variant_dpi(plan, VARIANTS[name]) for name in stale})
+    images = render_images(plan, dpis, cache)
+
+    with ThreadPoolExecutor(max_workers=len(stale)) as pool:
+        futures = [
+            pool.submit(
+                export_variant,
+                plan,
+                name,
+                cache,
+                *images[variant_dpi(plan, VARIANTS[name])],
+                engine_options,
             )
+            for name in stale
+        ]
+        for future in futures:
+            future.result()
 
-    print(f"Placed {placed_count} tiles on board")
+    cache.save()
+    print(f"Build cache: {cache.summary()}")
 
-    # Render board, then overlay info panels
-    board = engine.render_board()
+    print(f"\n✓ Board created from {yaml_file}!")
+    for name in stale:
+        for path in variant_outputs(plan, VARIANTS[name]):
+            if path:
+                print(f"  - {os.path.basename(path)}")
 
-    # Draw top and left border
-    from PIL import ImageDraw as ID
-    board_draw = ID.Draw(board)
-    board_draw.line([(0, 0), (board.width - 1, 0)], fill=(0, 0, 0))
-    board_draw.line([(0, 0), (0, board.height - 1)], fill=(0, 0, 0))
 
-    # Place special info panels in the center area
-    special_tiles = parse_special_tiles(layout_file)
-    rules_file = "docs/rules.md"
+def create_board_from_yaml(
+    yaml_file: str = "assets/tiles.yaml",
+    layout_file: str = "assets/layout.txt",
+    tile_rotation: bool = False,
+    use_cache: bool = True,
+    compositor: str = "pil",
+    canvas: str = "memory",
+    profile: str = "release",
+    jpeg_quality: Optional[int] = None,
+    preview_scale: Optional[float] = None,
+    svg: bool = False,
+):
+    """Create a board using tiles defined in a YAML file, following the layout pattern."""
+    variant = "rotated" if tile_rotation else "plain"
+    build_variants(
+        yaml_file,
+        [variant],
+        layout_file=layout_file,
+        use_cache=use_cache,
+        compositor=compositor,
+        canvas=canvas,
+        profile=profile,
+        jpeg_quality=jpeg_quality,
+        preview_scale=preview_scale,
+        svg=svg,
+    )
 
-    special_config = {
-        "ru": ("Rules", "Basics", 2),
-        "tb": ("Trainer Battle", "Trainer Battle", 2),
-        "gb": ("Gym Battle", "Gym Mechanics", 2),
-        "it": ("Items", "Items", 1),
-    }
 
-    tw, th = engine.tile_width, engine.tile_height
-    for code, (header, section, height_tiles) in special_config.items():
-        if code in special_tiles:
-            anchor_row, anchor_col = special_tiles[code]
-            body = parse_rules_section(rules_file, section)
-            if body:
-                panel_w = tw
-                panel_h = th * height_tiles
-                panel = render_info_panel(header, body, panel_w, panel_h)
-                px = anchor_col * tw
-                py = anchor_row * th
-                board.paste(panel, (px, py))
-                print(f"Placed info panel '{code}' ({header}) at pixel ({px}, {py}), size {panel_w}x{panel_h}")
-
-    # Export
-    suffix = "_rotated" if tile_rotation else ""
-    output_name = os.path.splitext(os.path.basename(yaml_file))[0]
+def check_layout(yaml_file: str = "assets/tiles.yaml") -> int:
+    """
+    Lint every tile's layout without rendering (see src/layout_check.py) and
+    print the issues by tile name. Images are never fetched: PokeAPI images
+    that aren't downloaded yet are left out of the check.
 
-    os.makedirs("output", exist_ok=True)
-    png_path = f"output/board_{output_name}{suffix}.png"
-    board.save(png_path, dpi=(300, 300))
-    print(f"Board exported to {png_path} ({board.width}x{board.height}px, 300 DPI)")
+    Returns:
+        Number of issues found
+    """
+    start = time.perf_counter()
+    tiles = load_tiles_from_yaml(yaml_file)
+    report = []
+    missing_images = 0
+    for i, (spec, tile) in enumerate(zip(tiles.specs, tiles)):
+        for handle in tile.asset_handles():
+            if not handle.resolve_cached():
+                missing_images += 1
+        name = spec.name or f"Tile {i + 1}"
+        report += [(name, issue) for issue in check_tile(tile)]
+
+    elapsed = time.perf_counter() - start
+    tile_count = len({name for name, _ in report})
+    print(
+        f"Layout check: {len(report)} issues in {tile_count} of {len(tiles)} tiles "
+        f"({elapsed:.2f}s)"
+    )
+    for name, issue in report:
+        print(f"  {name}: {issue}")
+    if missing_images:
+        print(f"  ({missing_images} images not downloaded yet were left out)")
+    return len(report)
 
-    engine.export_pdf(f"output/board_{output_name}{suffix}.pdf")
 
-    print(f"\n✓ Board created from {yaml_file}!")
-    print(f"  - board_{output_name}{suffix}.png")
-    print(f"  - board_{output_name}{suffix}.pdf")
+def get_flag_value(argv: List[str], name: str) -> Optional[str]:
+    """Return the value of `--name value` or `--name=value`, or None."""
+    for i, arg in enumerate(argv):
+        if arg.startswith(f"{name}="):
+            return arg.split("=", 1)[1]
+        if arg == name and i + 1 < len(argv):
+            return argv[i + 1]
+    return None
 
 
 if __name__ == "__main__":
-    print("Board Game Generator")
-    print("=" * 50)
-
     # Parse command line arguments
+    argv = sys.argv[1:]
+    variants_arg = get_flag_value(argv, "--variants")
+    # Board compositor: "pil" (default) or "numpy" for large boards
+    compositor = get_flag_value(argv, "--compositor") or "pil"
+    # Board canvas: "memory" (default) or "memmap" for poster-sized boards
+    canvas = get_flag_value(argv, "--canvas") or "memory"
+    # Low-resolution preview, e.g. 0.25: no PDF, written to *_preview.png
+    preview_arg = get_flag_value(argv, "--preview-scale")
+    preview_scale = float(preview_arg) if preview_arg else None
+    # Output profile: "draft" (fast, default for previews), "release" (default),
+    # "archive" (lossless PDF) or "vector" (PDF drawn from the tile layouts)
+    profile = get_flag_value(argv, "--profile") or ("draft" if preview_scale else "release")
+    jpeg_quality_arg = get_flag_value(argv, "--jpeg-quality")
+    jpeg_quality = int(jpeg_quality_arg) if jpeg_quality_arg else None
     args = [
         arg
-        for arg in sys.argv[1:]
-        if not arg.startswith("--") and not arg.startswith("-")
+        for arg in argv
+        if not arg.startswith("--")
+        and not arg.startswith("-")
+        and arg not in (variants_arg, compositor, canvas, profile, jpeg_quality_arg, preview_arg)
     ]
-    flags = [arg for arg in sys.argv[1:] if arg.startswith("--") or arg.startswith("-")]
+    flags = [arg for arg in argv if arg.startswith("--") or arg.startswith("-")]
 
     # Check for tile rotation flag
     tile_rotation = "--tileRotation" in flags or "-tileRotation" in flags
 
+    # Ignore the build cache and rebuild everything
+    use_cache = "--force" not in flags
+
+    # Also write a vector SVG of each board
+    svg = "--svg" in flags
+
     # Get YAML file (first non-flag argument, or default)
     yaml_file = args[0] if args else "assets/tiles.yaml"
 
-    create_board_from_yaml(yaml_file, tile_rotation=tile_rotation)
+    # Only lint the tile layouts; exits 1 if there are issues
+    if "--check" in flags:
+        sys.exit(1 if check_layout(yaml_file) else 0)
+
+    print("Board Game Generator")
+    print("=" * 50)
+
+    if variants_arg:
+        variants = [v.strip() for v in variants_arg.split(",") if v.strip()]
+        build_variants(
+            yaml_file,
+            variants,
+            use_cache=use_cache,
+            compositor=compositor,
+            canvas=canvas,
+            profile=profile,
+            jpeg_quality=jpeg_quality,
+            preview_scale=preview_scale,
+            svg=svg,
+        )
+    else:
+        create_board_from_yaml(
+            yaml_file,
+            tile_rotation=tile_rotation,
+            use_cache=use_cache,
+            compositor=compositor,
+            canvas=canvas,
+            profile=profile,
+            jpeg_quality=jpeg_quality,
+            preview_scale=preview_scale,
+            svg=svg,
+        )
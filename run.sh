@@ -1,3 +1,2 @@
 #!/bin/bash
-venv/bin/python main.py assets/tiles.yaml
-venv/bin/python main.py assets/tiles.yaml --tileRotation
+venv/bin/python main.py assets/tiles.yaml --variants plain,rotated
@@ -4,19 +4,17 @@ Pre-computes gym battle distributions, then simulates games.
 """
 
 import random
-import yaml
 from collections import defaultdict
 
+from assets.tile_defs import load_tile_definitions
+
 random.seed(42)
 
 NUM_GAMES = 50_000
 NUM_PLAYERS = 4
 GYM_PRECOMPUTE = 10_000
 
-with open("assets/tiles.yaml") as f:
-    data = yaml.safe_load(f)
-
-tile_defs = data["tiles"]
+tile_defs = load_tile_definitions("assets/tiles.yaml").raw
 NUM_TILES = len(tile_defs)
 
 GYMS = set()
@@ -94,18 +92,18 @@ def precompute_gym(name):
                     break
                 drinks += 2
 
-    elif "Celadon" in name:
-        toxic_total = 0
-        while True:
-            r, flash = gym_battle_once(3, 7)
-            for i in range(r):
-                toxic_total += 1
-                drinks += toxic_total
-            total_rounds += r
-            if flash:
-                break
-            drinks += 2
-            toxic_total = 0  # faint resets toxicity
+        elif "Celadon" in name:
+            toxic_total = 0
+            while True:
+                r, flash = gym_battle_once(3, 7)
+                for i in range(r):
+                    toxic_total += 1
+                    drinks += toxic_total
+                total_rounds += r
+                if flash:
+                    break
+                drinks += 2
+                toxic_total = 0  # faint resets toxicity
 
         elif "Fuchsia" in name:
             while True:
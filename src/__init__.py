@@ -1,9 +1,31 @@
 """
 Poke Drinking Game - Board game generator package.
+
+Tile and BoardGameEngine are imported on first access, so importing a light
+submodule (like src.styles) doesn't load PIL, NumPy and the renderers.
 """
 
-from .tile import Tile
-from .engine import BoardGameEngine
-from . import styles
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .engine import BoardGameEngine
+    from .tile import Tile
+
+# Exported name -> submodule defining it
+_LAZY_EXPORTS = {
+    "Tile": ".tile",
+    "BoardGameEngine": ".engine",
+}
 
 __all__ = ['Tile', 'BoardGameEngine', 'styles']
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name == "styles":
+        return importlib.import_module(".styles", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
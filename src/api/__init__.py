@@ -2,6 +2,6 @@
 API modules for fetching external resources.
 """
 
-from .pokeapi import fetch_pokemon_image, get_pokemon_sprite_url
+from .pokeapi import cached_pokemon_image, fetch_pokemon_image, get_pokemon_sprite_url
 
-__all__ = ['fetch_pokemon_image', 'get_pokemon_sprite_url']
+__all__ = ['cached_pokemon_image', 'fetch_pokemon_image', 'get_pokemon_sprite_url']
@@ -1,8 +1,10 @@
 """
 PokeAPI integration for fetching Pokemon and item images.
+
+`requests` is imported only when something is actually downloaded, so
+looking up already cached images stays cheap.
 """
 
-import requests
 import os
 from pathlib import Path
 from typing import Optional, Tuple
@@ -42,6 +44,8 @@ def get_sprite_url(path: str) -> Optional[str]:
     Returns:
         URL to the sprite image, or None if not found
     """
+    import requests
+
     try:
         resource_type, name = _parse_api_path(path)
         url = f"{POKEAPI_BASE_URL}/{resource_type}/{name}"
@@ -74,6 +78,30 @@ def get_pokemon_sprite_url(pokemon_name: str) -> Optional[str]:
     return get_sprite_url(f"pokemon/{pokemon_name}")
 
 
+def _cache_path(path: str, cache_dir: Optional[str] = None) -> Path:
+    """Where the image for a poke_api_image path is cached."""
+    resource_type, name = _parse_api_path(path)
+    if cache_dir is None:
+        project_root = Path(__file__).parent.parent.parent
+        return project_root / "tiles" / "images" / "pokeapi" / resource_type / f"{name}.png"
+    return Path(cache_dir) / resource_type / f"{name}.png"
+
+
+def cached_pokemon_image(path: str, cache_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Path of an already downloaded image, without touching the network.
+    
+    Args:
+        path: Path like "pokemon/pikachu" or "item/poke-ball"
+        cache_dir: Directory images are cached in (default: tiles/images/pokeapi/)
+        
+    Returns:
+        Path to the local image file, or None if it hasn't been fetched yet
+    """
+    cached_path = _cache_path(path, cache_dir)
+    return str(cached_path) if cached_path.exists() else None
+
+
 def fetch_pokemon_image(
     path: str,
     cache_dir: Optional[str] = None,
@@ -91,19 +119,10 @@ def fetch_pokemon_image(
     Returns:
         Path to the local image file, or None if fetch failed
     """
-    resource_type, name = _parse_api_path(path)
-    
-    # Set up cache directory with subdirectory for resource type
-    if cache_dir is None:
-        project_root = Path(__file__).parent.parent.parent
-        cache_dir = project_root / "tiles" / "images" / "pokeapi" / resource_type
-    else:
-        cache_dir = Path(cache_dir) / resource_type
-    
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    cached_path = _cache_path(path, cache_dir)
+    cached_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Check cache first
-    cached_path = cache_dir / f"{name}.png"
     if use_cache and cached_path.exists():
         return str(cached_path)
     
@@ -113,6 +132,8 @@ def fetch_pokemon_image(
         return None
     
     # Download the image
+    import requests
+
     try:
         response = requests.get(sprite_url, timeout=10)
         response.raise_for_status()
@@ -0,0 +1,115 @@
+"""
+Lazily resolved tile images.
+
+A tile's image can come from a local path or from PokeAPI. Resolving a
+PokeAPI image may hit the network, so it is deferred until the image is
+first needed (usually at render time) or prefetched in bulk in the background.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+PREFETCH_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class AssetHandle:
+    def __init__(self, path: Optional[str] = None, poke_api_image: Optional[str] = None):
+        """
+        Initialize an asset handle.
+
+        Args:
+            path: Local image path
+            poke_api_image: PokeAPI image like "pokemon/pikachu"; takes
+                precedence over path
+        """
+        self.path = path
+        self.poke_api_image = poke_api_image
+        self._lock = threading.Lock()
+        self._resolved = poke_api_image is None
+        self._result = None if poke_api_image else path
+
+    def __repr__(self):
+        # Describes the source, not the resolution state, so it is stable for hashing
+        return f"AssetHandle(path={self.path!r}, poke_api_image={self.poke_api_image!r})"
+
+    def __bool__(self):
+        return self.path is not None or self.poke_api_image is not None
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._resolved
+
+    def resolve(self) -> Optional[str]:
+        """
+        Return the local image path, fetching it from PokeAPI on first use.
+        Concurrent callers wait for a single fetch.
+        """
+        if self._resolved:
+            return self._result
+        with self._lock:
+            if not self._resolved:
+                from .api import fetch_pokemon_image
+
+                self._result = fetch_pokemon_image(self.poke_api_image)
+                if not self._result:
+                    print(f"Warning: Could not fetch Pokemon image for '{self.poke_api_image}'")
+                self._resolved = True
+        return self._result
+
+    def local_path(self) -> Optional[str]:
+        """
+        The image path if it's available without the network: a local image,
+        a resolved one, or an already downloaded PokeAPI image. Never fetches
+        and leaves the handle unresolved.
+        """
+        if self._resolved:
+            return self._result
+        from .api import cached_pokemon_image
+
+        return cached_pokemon_image(self.poke_api_image)
+
+    def resolve_cached(self) -> Optional[str]:
+        """
+        Resolve without the network: a PokeAPI image that hasn't been
+        downloaded yet resolves to None for the rest of this handle's life.
+        For quick checks that must not wait on fetches.
+        """
+        if self._resolved:
+            return self._result
+        with self._lock:
+            if not self._resolved:
+                from .api import cached_pokemon_image
+
+                self._result = cached_pokemon_image(self.poke_api_image)
+                self._resolved = True
+        return self._result
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=PREFETCH_WORKERS, thread_name_prefix="asset-prefetch"
+            )
+        return _executor
+
+
+def prefetch(handles: Iterable[AssetHandle]) -> List[Future]:
+    """
+    Start resolving handles in the background.
+
+    Returns:
+        Futures for the handles that still needed resolving
+    """
+    executor = _get_executor()
+    return [executor.submit(handle.resolve) for handle in handles if not handle.is_resolved]
+
+
+def prefetch_tiles(tiles) -> List[Future]:
+    """Start resolving the images of all tiles in the background."""
+    return prefetch(handle for tile in tiles for handle in tile.asset_handles())
@@ -0,0 +1,193 @@
+"""
+Content-hashed build cache for board artifacts.
+
+Every intermediate of a board build (tile renders, info panels, the
+composited board and its exports) is a node identified by a signature: a
+hash over everything the node depends on. A node is rebuilt only when its
+signature changes or its output is missing, like a tiny make.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Tuple
+
+from PIL import Image
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_DIR = PROJECT_ROOT / ".build_cache"
+
+_file_hashes: Dict[Tuple[str, int, int], str] = {}
+
+
+def hash_values(*values) -> str:
+    """Hash arbitrary values by their repr. Values must have a stable repr."""
+    digest = hashlib.sha256()
+    for value in values:
+        digest.update(repr(value).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def hash_file(path) -> str:
+    """
+    Hash a file's contents. Missing files hash to a fixed marker, so a file
+    appearing later still invalidates its dependents.
+
+    Args:
+        path: File path, or None
+
+    Returns:
+        Hex digest of the file contents
+    """
+    if path is None:
+        return "none"
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_hashes:
+        with open(path, "rb") as f:
+            _file_hashes[key] = hashlib.sha256(f.read()).hexdigest()
+    return _file_hashes[key]
+
+
+def hash_files(paths: Iterable) -> str:
+    """Hash several files into a single signature."""
+    return hash_values(*(hash_file(p) for p in paths))
+
+
+class BuildCache:
+    def __init__(self, cache_dir=CACHE_DIR, enabled: bool = True):
+        """
+        Initialize the build cache.
+
+        Args:
+            cache_dir: Directory holding the manifest and cached images
+            enabled: When False every node is considered stale
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.manifest_path = self.cache_dir / "manifest.json"
+        self.manifest: Dict[str, str] = {}
+        self.built: list[str] = []
+        self.reused: list[str] = []
+
+        if enabled and self.manifest_path.exists():
+            try:
+                with open(self.manifest_path) as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable build manifest: {e}")
+
+    @staticmethod
+    def _stamped(signature: str, outputs: Iterable) -> str:
+        """
+        The signature combined with the size and modification time of each
+        output file. An output cut off by an interrupted build was rewritten
+        after it was recorded, so its stamp no longer matches.
+        """
+        outputs = list(outputs)
+        if not outputs:
+            return signature
+        stamps = []
+        for path in outputs:
+            try:
+                stat = os.stat(path)
+                stamps.append((str(path), stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                stamps.append((str(path), "missing"))
+        return hash_values(signature, stamps)
+
+    def is_fresh(self, node: str, signature: str, outputs: Iterable = ()) -> bool:
+        """
+        Check whether a node was last built with this signature and all of its
+        output files still exist exactly as that build left them.
+        """
+        if not self.enabled or node not in self.manifest:
+            return False
+        return self.manifest[node] == self._stamped(signature, outputs)
+
+    def was_built(self, node: str, outputs: Iterable = ()) -> bool:
+        """
+        Check whether a node was built before and its outputs still exist,
+        whatever its inputs were. A node that wasn't is stale without
+        computing its signature.
+        """
+        return (
+            self.enabled
+            and node in self.manifest
+            and all(os.path.exists(p) for p in outputs)
+        )
+
+    def record(self, node: str, signature: str, outputs: Iterable = ()):
+        """
+        Mark a node as built with the given signature. Pass the output files
+        once they are written, so is_fresh can tell if they change later.
+        """
+        self.manifest[node] = self._stamped(signature, outputs)
+        self.built.append(node)
+
+    def _image_path(self, kind: str, signature: str) -> Path:
+        return self.cache_dir / kind / f"{signature}.png"
+
+    def has_image(self, node: str, signature: str) -> bool:
+        """Check whether an image for this node and signature is cached."""
+        kind = node.split(":", 1)[0]
+        return self.enabled and self._image_path(kind, signature).exists()
+
+    def image(
+        self, node: str, signature: str, build: Callable[[], Image.Image]
+    ) -> Image.Image:
+        """
+        Return the cached image for a node, building and storing it if stale.
+
+        Images are stored by signature, so switching back to an earlier input
+        state (e.g. undoing an edit) is also a cache hit.
+
+        Args:
+            node: Node name, e.g. "tile:12" or "panel:ru"
+            signature: Hash of the node's inputs
+            build: Function that renders the image on a cache miss
+
+        Returns:
+            PIL Image for the node
+        """
+        kind = node.split(":", 1)[0]
+        path = self._image_path(kind, signature)
+        if self.enabled and path.exists():
+            try:
+                with Image.open(path) as cached:
+                    img = cached.copy()
+                self.manifest[node] = signature
+                self.reused.append(node)
+                return img
+            except OSError as e:
+                print(f"Warning: Rebuilding unreadable cache entry {path}: {e}")
+
+        img = build()
+        if self.enabled:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Identical tiles share a signature and may be stored concurrently
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            img.save(tmp_path, format="PNG", compress_level=1)
+            os.replace(tmp_path, path)
+        self.record(node, signature)
+        return img
+
+    def save(self):
+        """Write the manifest to disk."""
+        if not self.enabled:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def summary(self) -> str:
+        return f"{len(self.built)} built, {len(self.reused)} reused from cache"
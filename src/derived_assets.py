@@ -0,0 +1,178 @@
+"""
+Content-addressed store of derived (pre-scaled) tile images.
+
+Source sprites and backgrounds come in mixed sizes and modes. Each one is
+converted to RGBA at the exact size a tile needs once, and stored under a
+hash of the source content and target size, so rendering a tile is just a
+paste. Derived images live in memory and in .build_cache/derived/. Sources
+are read from the sprite atlas when one is set (see sprite_atlas.py).
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from .build_cache import CACHE_DIR, hash_file, hash_values
+
+if TYPE_CHECKING:
+    from .sprite_atlas import SpriteAtlas
+
+# Bump when the conversion changes to invalidate stored images
+DERIVE_VERSION = 2
+MEMORY_ITEMS = 128
+
+# "auto" treats sources this small with a small palette as pixel art
+PIXEL_ART_MAX_SIZE = 128
+PIXEL_ART_MAX_COLORS = 256
+
+
+def is_pixel_art(img: Image.Image) -> bool:
+    """Small palette sprites, like the 96x96 PokeAPI sprites."""
+    if max(img.size) > PIXEL_ART_MAX_SIZE:
+        return False
+    return img.mode == "P" or img.getcolors(PIXEL_ART_MAX_COLORS) is not None
+
+
+def scale_image(img: Image.Image, size: Tuple[int, int], image_filter: str = "lanczos") -> Image.Image:
+    """
+    Scale an image to exactly `size`.
+
+    Args:
+        img: Source image (RGBA)
+        size: Target (width, height)
+        image_filter: "lanczos", or "nearest" for an integer nearest-neighbour
+            upscale followed by at most one small bilinear resize to the exact size
+
+    Returns:
+        Scaled image
+    """
+    size = tuple(size)
+    if img.size == size:
+        return img
+    if image_filter == "nearest":
+        factor = max(1, round(min(size[0] / img.width, size[1] / img.height)))
+        if factor > 1:
+            img = img.resize((img.width * factor, img.height * factor), Image.Resampling.NEAREST)
+        if img.size != size:
+            img = img.resize(size, Image.Resampling.BILINEAR)
+        return img
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+
+class DerivedAssetStore:
+    def __init__(self, store_dir=CACHE_DIR / "derived", enabled: bool = True):
+        """
+        Initialize the store.
+
+        Args:
+            store_dir: Directory for derived images on disk
+            enabled: When False, derived images are only kept in memory
+        """
+        self.store_dir = store_dir
+        self.enabled = enabled
+        # Packed source images, set by the atlas build step
+        self.atlas: Optional["SpriteAtlas"] = None
+        self._memory: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._sizes: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def source_size(self, source_path: str) -> Tuple[int, int]:
+        """Pixel size of a source image, read from its header only."""
+        key = hash_file(source_path)
+        if key not in self._sizes:
+            rect = self.atlas.rects.get(key) if self.atlas else None
+            if rect is not None:
+                self._sizes[key] = rect[2:]
+            else:
+                with Image.open(source_path) as img:
+                    self._sizes[key] = img.size
+        return self._sizes[key]
+
+    def _load_source(self, source_path: str) -> Image.Image:
+        """Source image as RGBA, cut from the atlas when it's packed there."""
+        if self.atlas is not None:
+            sprite = self.atlas.sprite(source_path)
+            if sprite is not None:
+                return sprite
+        with Image.open(source_path) as source:
+            return source.convert("RGBA")
+
+    def _remember(self, key: str, img: Image.Image):
+        with self._lock:
+            self._memory[key] = img
+            self._memory.move_to_end(key)
+            while len(self._memory) > MEMORY_ITEMS:
+                self._memory.popitem(last=False)
+
+    def get(
+        self, source_path: str, size: Tuple[int, int], image_filter: str = "lanczos"
+    ) -> Image.Image:
+        """
+        Get a source image converted to RGBA at exactly `size`.
+
+        Args:
+            source_path: Path to the source image
+            size: Target (width, height) in pixels
+            image_filter: "lanczos", "nearest" (see scale_image), or "auto" to
+                use nearest for pixel-art upscales and lanczos otherwise
+
+        Returns:
+            RGBA PIL Image; treat as read-only, it is shared
+        """
+        key = hash_values(hash_file(source_path), tuple(size), image_filter, DERIVE_VERSION)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        path = self.store_dir / f"{key}.png"
+        if self.enabled and path.exists():
+            try:
+                with Image.open(path) as stored:
+                    img = stored.convert("RGBA")
+                self._remember(key, img)
+                return img
+            except OSError as e:
+                print(f"Warning: Rebuilding unreadable derived image {path}: {e}")
+
+        source = self._load_source(source_path)
+        if image_filter == "auto":
+            upscaling = size[0] >= source.width * 2 and size[1] >= source.height * 2
+            image_filter = "nearest" if upscaling and is_pixel_art(source) else "lanczos"
+        img = scale_image(source, size, image_filter)
+
+        if self.enabled:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            img.save(tmp_path, format="PNG", compress_level=1)
+            os.replace(tmp_path, path)
+
+        self._remember(key, img)
+        return img
+
+
+# Shared store used by tile rendering
+DERIVED = DerivedAssetStore()
+
+
+def tile_asset_requests(tile, scale: float = 1.0) -> List[Tuple[str, Tuple[int, int], str]]:
+    """
+    The derived images a tile render at `scale` needs, as (source path,
+    size, image filter). Pictures are sized by the layout, which also reads
+    the source headers.
+    """
+    return [
+        (picture.path, picture.size_at(scale), picture.image_filter)
+        for picture in tile.display_list().pictures
+    ]
+
+
+def derive_asset(request: Tuple[str, Tuple[int, int], str]):
+    """Derive one image from tile_asset_requests into the shared store."""
+    try:
+        DERIVED.get(*request)
+    except OSError:
+        pass  # Reported when the tile renders
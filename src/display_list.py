@@ -0,0 +1,410 @@
+"""
+Display lists: a tile's layout as resolution-independent drawing ops.
+
+Tile.display_list() makes every layout decision once (header metrics, text
+wrapping, image placement) in the tile's own pixel units, with y pointing
+down, and records the result as a list of ops. Backends only draw:
+
+- render_raster: PIL image at any scale (what Tile.render uses)
+- draw_pdf: vector drawing on a ReportLab canvas
+- svg_elements: SVG markup (BoardGameEngine.export_svg builds on it)
+
+Display lists are plain data and round-trip through to_dict/from_dict, so
+they can be stored as JSON.
+"""
+
+import base64
+import io
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from .derived_assets import DERIVED, is_pixel_art
+from .glyphs import ATLAS, bold_offsets
+
+# Image files SVG viewers read directly; others are embedded as PNG
+SVG_IMAGE_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+# Stroke width of faux-bold text in vector output, as a fraction of the font
+# size; about the weight of the raster backend's 3px smear on 600px tiles
+BOLD_STROKE = 0.04
+
+
+@dataclass(slots=True, frozen=True)
+class Rect:
+    """A filled rectangle."""
+
+    x: float
+    y: float
+    width: float
+    height: float
+    color: Tuple[int, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class Border:
+    """
+    Lines along the right and bottom edges, `width` px thick. The left and top
+    edges are drawn by the neighbouring tiles (or the board edge).
+    """
+
+    width: int
+    color: Tuple[int, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class Picture:
+    """An image file scaled into a box, drawn with its alpha channel."""
+
+    path: str
+    x: float
+    y: float
+    width: float
+    height: float
+    image_filter: str = "lanczos"
+    role: str = "image"  # "image" (the tile sprite) or "background"
+
+    def size_at(self, scale: float) -> Tuple[int, int]:
+        """Pixel size the image is drawn at in a raster of `scale`."""
+        return max(1, round(self.width * scale)), max(1, round(self.height * scale))
+
+
+@dataclass(slots=True, frozen=True)
+class Text:
+    """
+    A line of (text, is_bold) runs. (x, y) is the top-left of the line like
+    PIL's default "la" anchor; the baseline is `ascent` below y.
+    """
+
+    x: float
+    y: float
+    runs: Tuple[Tuple[str, bool], ...]
+    font: Optional[str]  # Font file, None for PIL's default font
+    size: int
+    ascent: float
+    color: Tuple[int, ...]
+    role: str = "text"  # "header", "text" (a body line) or "footer"
+
+    def size_at(self, scale: float) -> int:
+        """Font size in a raster of `scale`."""
+        return max(1, round(self.size * scale))
+
+
+OP_TYPES = {"rect": Rect, "border": Border, "picture": Picture, "text": Text}
+OP_NAMES = {op_type: name for name, op_type in OP_TYPES.items()}
+
+
+@dataclass(slots=True, frozen=True)
+class DisplayList:
+    """Drawing ops in order, over a background color, in a width x height box."""
+
+    width: int
+    height: int
+    background: Tuple[int, ...]
+    ops: Tuple[object, ...]
+
+    @property
+    def pictures(self) -> Tuple[Picture, ...]:
+        return tuple(op for op in self.ops if isinstance(op, Picture))
+
+    def to_dict(self) -> dict:
+        """JSON-compatible form, see from_dict."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "background": self.background,
+            "ops": [{"op": OP_NAMES[type(op)], **asdict(op)} for op in self.ops],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DisplayList":
+        ops = []
+        for entry in data["ops"]:
+            fields = dict(entry)
+            op_type = OP_TYPES[fields.pop("op")]
+            if "color" in fields:
+                fields["color"] = _color(fields["color"])
+            if "runs" in fields:
+                fields["runs"] = tuple((text, bold) for text, bold in fields["runs"])
+            ops.append(op_type(**fields))
+        return cls(data["width"], data["height"], _color(data["background"]), tuple(ops))
+
+
+def _color(value):
+    # JSON turns color tuples into lists
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _rgb(color) -> Tuple[int, int, int]:
+    """RGB tuple of a color tuple or a PIL color name."""
+    if isinstance(color, str):
+        return ImageColor.getrgb(color)[:3]
+    return tuple(color[:3])
+
+
+def placement_matrix(rotation: int, width: float, height: float) -> Tuple[float, ...]:
+    """
+    Affine matrix (a, b, c, d, e, f) placing a width x height box, y down,
+    rotated counter-clockwise by a quarter-turn multiple into its slot, like
+    PIL's Image.transpose. The form is the one SVG's matrix() and ReportLab's
+    canvas.transform() take: x' = a*x + c*y + e, y' = b*x + d*y + f.
+    """
+    return {
+        0: (1, 0, 0, 1, 0, 0),
+        90: (0, -1, 1, 0, 0, width),
+        180: (-1, 0, 0, -1, width, height),
+        270: (0, 1, -1, 0, height, 0),
+    }[rotation % 360]
+
+
+def _load_font(path: Optional[str], size: int):
+    if path is None:
+        return ImageFont.load_default()
+    return ATLAS.load_font(path, size)
+
+
+def render_raster(display_list: DisplayList, scale: float = 1.0) -> Image.Image:
+    """
+    Rasterize a display list.
+
+    Args:
+        display_list: Layout to draw
+        scale: Pixels per display list unit
+
+    Returns:
+        RGB PIL Image
+    """
+    width = max(1, round(display_list.width * scale))
+    height = max(1, round(display_list.height * scale))
+    img = Image.new("RGB", (width, height), display_list.background)
+    draw = ImageDraw.Draw(img)
+
+    for op in display_list.ops:
+        if isinstance(op, Rect):
+            x0, y0 = round(op.x * scale), round(op.y * scale)
+            x1, y1 = round((op.x + op.width) * scale), round((op.y + op.height) * scale)
+            if x1 > x0 and y1 > y0:
+                img.paste(op.color, (x0, y0, x1, y1))
+        elif isinstance(op, Border):
+            border_width = max(1, round(op.width * scale))
+            for i in range(border_width):
+                draw.line([(width - 1 - i, 0), (width - 1 - i, height - 1)], fill=op.color)
+                draw.line([(0, height - 1 - i), (width - 1, height - 1 - i)], fill=op.color)
+        elif isinstance(op, Picture):
+            try:
+                picture = DERIVED.get(op.path, op.size_at(scale), op.image_filter)
+                img.paste(picture, (round(op.x * scale), round(op.y * scale)), picture)
+            except Exception as e:
+                print(f"Warning: Could not load image {op.path}: {e}")
+        elif isinstance(op, Text):
+            font = _load_font(op.font, op.size_at(scale))
+            ATLAS.draw_runs(
+                img,
+                (round(op.x * scale), round(op.y * scale)),
+                op.runs,
+                font,
+                op.color,
+                bold_offsets(scale),
+            )
+    return img
+
+
+_pdf_fonts: Dict[str, str] = {}
+
+
+def _pdf_font(path: Optional[str]) -> str:
+    """Register a TrueType font with ReportLab once; Helvetica if that fails."""
+    if path is None:
+        return "Helvetica"
+    if path not in _pdf_fonts:
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        name = Path(path).stem
+        try:
+            pdfmetrics.registerFont(TTFont(name, path))
+        except Exception as e:
+            print(f"Warning: Could not embed font {path} in PDF, using Helvetica: {e}")
+            name = "Helvetica"
+        _pdf_fonts[path] = name
+    return _pdf_fonts[path]
+
+
+def draw_pdf(c, display_list: DisplayList):
+    """
+    Draw a display list as vectors on a ReportLab canvas.
+
+    The caller sets up the transform so that display list units map onto the
+    page with y pointing down (see placement_matrix). Images are embedded from
+    their source files, which ReportLab stores once per file however often they
+    are drawn.
+
+    Args:
+        c: reportlab.pdfgen.canvas.Canvas
+        display_list: Layout to draw
+    """
+    w, h = display_list.width, display_list.height
+    c.setFillColorRGB(*(v / 255 for v in _rgb(display_list.background)))
+    c.rect(0, 0, w, h, stroke=0, fill=1)
+
+    for op in display_list.ops:
+        if isinstance(op, Rect):
+            c.setFillColorRGB(*(v / 255 for v in _rgb(op.color)))
+            c.rect(op.x, op.y, op.width, op.height, stroke=0, fill=1)
+        elif isinstance(op, Border):
+            c.setFillColorRGB(*(v / 255 for v in _rgb(op.color)))
+            c.rect(w - op.width, 0, op.width, h, stroke=0, fill=1)
+            c.rect(0, h - op.width, w, op.width, stroke=0, fill=1)
+        elif isinstance(op, Picture):
+            # Images are drawn bottom-up; flip them back in the y-down space
+            c.saveState()
+            c.transform(1, 0, 0, -1, op.x, op.y + op.height)
+            try:
+                c.drawImage(op.path, 0, 0, op.width, op.height, mask="auto")
+            except Exception as e:
+                print(f"Warning: Could not load image {op.path}: {e}")
+            c.restoreState()
+        elif isinstance(op, Text):
+            font = _pdf_font(op.font)
+            c.saveState()
+            c.transform(1, 0, 0, -1, op.x, op.y + op.ascent)
+            c.setFillColorRGB(*(v / 255 for v in _rgb(op.color)))
+            c.setStrokeColorRGB(*(v / 255 for v in _rgb(op.color)))
+            c.setLineWidth(op.size * BOLD_STROKE)
+            text = c.beginText(0, 0)
+            text.setFont(font, op.size)
+            for run, bold in op.runs:
+                text.setTextRenderMode(2 if bold else 0)  # 2 = fill and stroke
+                text.textOut(run)
+            c.drawText(text)
+            c.restoreState()
+
+
+def font_family(path: Optional[str]) -> str:
+    """CSS font family a font file is referred to by in SVG output."""
+    return Path(path).stem if path else "sans-serif"
+
+
+def svg_font_face(path: str) -> str:
+    """CSS @font-face rule embedding a TrueType font file for font_family(path)."""
+    with open(path, "rb") as f:
+        data = base64.b64encode(f.read()).decode("ascii")
+    return (
+        f'@font-face{{font-family:"{font_family(path)}";'
+        f'src:url(data:font/ttf;base64,{data}) format("truetype")}}'
+    )
+
+
+def _data_uri(data: bytes, mime: str) -> str:
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def png_data_uri(image: Image.Image, compress_level: int = 6) -> str:
+    """Data URI of an image encoded as PNG."""
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=compress_level)
+    return _data_uri(buffer.getvalue(), "image/png")
+
+
+def is_pixelated(picture: Picture) -> bool:
+    """
+    Whether a picture should be shown with hard pixel edges, deciding its
+    "auto" filter like DerivedAssetStore.get does for a 600px tile.
+    """
+    if picture.image_filter != "auto":
+        return picture.image_filter == "nearest"
+    with Image.open(picture.path) as source:
+        upscaling = picture.width >= source.width * 2 and picture.height >= source.height * 2
+        return upscaling and is_pixel_art(source)
+
+
+def svg_shared_image(image_id: str, path: str, pixelated: bool = False) -> str:
+    """
+    An <image> for <defs> embedding an image file at its own pixel size, to be
+    placed with svg_use. Formats browsers don't read are embedded as PNG.
+    """
+    width, height = DERIVED.source_size(path)
+    mime = SVG_IMAGE_TYPES.get(Path(path).suffix.lower())
+    if mime:
+        with open(path, "rb") as f:
+            href = _data_uri(f.read(), mime)
+    else:
+        with Image.open(path) as source:
+            href = png_data_uri(source.convert("RGBA"))
+    rendering = ' image-rendering="pixelated"' if pixelated else ""
+    return f'<image id="{image_id}" width="{width}" height="{height}"{rendering} href="{href}"/>'
+
+
+def svg_use(image_id: str, picture: Picture) -> str:
+    """A <use> of a shared image (see svg_shared_image) scaled into a picture's box."""
+    width, height = DERIVED.source_size(picture.path)
+    return (
+        f'<use href="#{image_id}" transform="translate({picture.x:g} {picture.y:g}) '
+        f'scale({picture.width / width:g} {picture.height / height:g})"/>'
+    )
+
+
+def _svg_color(color: Tuple[int, ...]) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*_rgb(color))
+
+
+def svg_image(picture: Picture) -> str:
+    """An <image> element linking the picture's file."""
+    rendering = ' image-rendering="pixelated"' if picture.image_filter == "nearest" else ""
+    return (
+        f'<image x="{picture.x:g}" y="{picture.y:g}" width="{picture.width:g}" '
+        f'height="{picture.height:g}" preserveAspectRatio="none"{rendering} '
+        f'href={quoteattr(Path(picture.path).resolve().as_uri())}/>'
+    )
+
+
+def svg_elements(
+    display_list: DisplayList,
+    image_markup: Callable[[Picture], str] = svg_image,
+) -> Iterator[str]:
+    """
+    SVG elements drawing a display list in its own units, one per op.
+
+    Args:
+        display_list: Layout to draw
+        image_markup: Element for a Picture, e.g. a <use> of a shared image
+
+    Yields:
+        SVG markup strings
+    """
+    w, h = display_list.width, display_list.height
+    yield f'<rect width="{w}" height="{h}" fill="{_svg_color(display_list.background)}"/>'
+
+    for op in display_list.ops:
+        if isinstance(op, Rect):
+            yield (
+                f'<rect x="{op.x:g}" y="{op.y:g}" width="{op.width:g}" '
+                f'height="{op.height:g}" fill="{_svg_color(op.color)}"/>'
+            )
+        elif isinstance(op, Border):
+            fill = _svg_color(op.color)
+            yield f'<rect x="{w - op.width}" width="{op.width}" height="{h}" fill="{fill}"/>'
+            yield f'<rect y="{h - op.width}" width="{w}" height="{op.width}" fill="{fill}"/>'
+        elif isinstance(op, Picture):
+            yield image_markup(op)
+        elif isinstance(op, Text):
+            color = _svg_color(op.color)
+            spans = "".join(
+                f'<tspan stroke="{color}" stroke-width="{op.size * BOLD_STROKE:g}">{escape(run)}</tspan>'
+                if bold
+                else escape(run)
+                for run, bold in op.runs
+            )
+            yield (
+                f'<text x="{op.x:g}" y="{op.y + op.ascent:g}" font-family="{font_family(op.font)}" '
+                f'font-size="{op.size}" fill="{color}" xml:space="preserve">{spans}</text>'
+            )
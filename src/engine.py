@@ -3,11 +3,155 @@ Board game engine for combining tiles into a printable game board.
 """
 
 from PIL import Image
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.utils import ImageReader
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, TYPE_CHECKING
+import importlib.util
+import io
+import math
 import os
+import tempfile
+import time
+
+if TYPE_CHECKING:
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen.canvas import Canvas
+
+    from .display_list import DisplayList
+
+
+# ISO page sizes in points, as ReportLab defines them. ReportLab itself is
+# only imported when a PDF is written (see _pdf_canvas)
+POINTS_PER_MM = 72 / 25.4
+PAGE_SIZES = {
+    "A4": (210 * POINTS_PER_MM, 297 * POINTS_PER_MM),
+    "A3": (297 * POINTS_PER_MM, 420 * POINTS_PER_MM),
+}
+
+COMPOSITORS = ("pil", "numpy")
+CANVASES = ("memory", "memmap")
+
+# Output profiles trade encode time against file size and fidelity:
+#   png_encoder: "pil", or "strips" for the single-filter strip encoder,
+#       several times faster than PIL's adaptive filtering (needs NumPy)
+#   png_compress_level / png_optimize: zlib effort for the PNG
+#   pdf_image: "jpeg" (DCT, embedded as is), "flate" (lossless) or "vector"
+#       (tiles drawn from their display lists, crisp at any print size)
+#   jpeg_quality: JPEG quality when pdf_image is "jpeg"
+#   pdf_reduce: integer factor the PDF image is downscaled by
+OUTPUT_PROFILES = {
+    "draft": {
+        "png_encoder": "strips",
+        "png_compress_level": 1,
+        "png_optimize": False,
+        "pdf_image": "jpeg",
+        "jpeg_quality": 75,
+        "pdf_reduce": 2,
+    },
+    "release": {
+        "png_encoder": "pil",
+        "png_compress_level": 6,
+        "png_optimize": True,
+        "pdf_image": "jpeg",
+        "jpeg_quality": 92,
+        "pdf_reduce": 1,
+    },
+    "archive": {
+        "png_encoder": "pil",
+        "png_compress_level": 9,
+        "png_optimize": True,
+        "pdf_image": "flate",
+        "jpeg_quality": None,
+        "pdf_reduce": 1,
+    },
+    "vector": {
+        "png_encoder": "pil",
+        "png_compress_level": 6,
+        "png_optimize": True,
+        "pdf_image": "vector",
+        "jpeg_quality": None,
+        "pdf_reduce": 1,
+    },
+}
+
+
+
+def output_profile(name: str, jpeg_quality: Optional[int] = None) -> dict:
+    """
+    Settings of an output profile.
+
+    Args:
+        name: Profile name from OUTPUT_PROFILES
+        jpeg_quality: Override the profile's JPEG quality for the PDF
+
+    Returns:
+        Copy of the profile settings
+    """
+    if name not in OUTPUT_PROFILES:
+        raise ValueError(f"Unknown profile '{name}', choose from {list(OUTPUT_PROFILES)}")
+    settings = dict(OUTPUT_PROFILES[name])
+    if jpeg_quality is not None:
+        settings["jpeg_quality"] = jpeg_quality
+    return settings
+
+
+def applied_profile(settings: dict, canvas: str) -> dict:
+    """
+    The encoder settings an export actually applies: the strip PNG encoder
+    falls back to PIL without NumPy, and the memmap canvas always writes the
+    PNG with the strip encoder and the PDF image losslessly in strips.
+
+    Args:
+        settings: Output profile settings (see output_profile)
+        canvas: "memory" or "memmap"
+
+    Returns:
+        Copy of the settings as applied
+    """
+    settings = dict(settings)
+    if canvas == "memmap":
+        settings["png_encoder"] = "strips"
+        if settings["png_optimize"]:
+            settings["png_compress_level"] = 9
+        settings["png_optimize"] = False
+        if settings["pdf_image"] == "jpeg":
+            settings["pdf_image"] = "flate"
+            settings["jpeg_quality"] = None
+    elif settings["png_encoder"] == "strips" and importlib.util.find_spec("numpy") is None:
+        settings["png_encoder"] = "pil"
+    return settings
+
+
+# Upper bound for the pixel strip a memmap canvas is encoded from at once
+STRIP_BYTES = 32 * 1024 * 1024
+
+TRANSPOSE_MAP = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+
+def _numpy():
+    """
+    NumPy, imported on first use, or None if it isn't installed. It is
+    optional: only the numpy compositor, the memmap canvas and the strip
+    PNG encoder need it.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _pdf_canvas(output_path: str, page_size: Tuple[float, float]) -> "Canvas":
+    """A ReportLab canvas for a PDF page. ReportLab is imported on first use."""
+    from reportlab import rl_config
+    from reportlab.pdfgen import canvas
+
+    # Embed PDF streams as binary instead of ASCII85 text: 25% smaller, and the
+    # pure Python ASCII85 encoder costs more than compressing the board
+    rl_config.useA85 = 0
+    return canvas.Canvas(output_path, pagesize=page_size)
 
 
 def mm_to_pixels(mm: float, dpi: int = 300) -> int:
@@ -48,6 +192,12 @@ class BoardGameEngine:
         board_cols: int = 4,
         board_rows: int = 4,
         tile_spacing: int = 10,
+        compositor: str = "pil",
+        canvas: str = "memory",
+        canvas_dir: Optional[str] = None,
+        edge_color: Optional[Tuple[int, int, int]] = None,
+        profile: str = "release",
+        jpeg_quality: Optional[int] = None,
     ):
         """
         Initialize the board game engine.
@@ -58,13 +208,45 @@ class BoardGameEngine:
             board_cols: Number of columns in the board
             board_rows: Number of rows in the board
             tile_spacing: Spacing between tiles in pixels
+            compositor: "pil" (paste tiles onto a PIL image) or "numpy"
+                (assemble the board in one preallocated array, needs NumPy)
+            canvas: "memory" (render the board as one PIL image) or "memmap"
+                (compose into a memory-mapped file and encode exports in
+                strips, so the composed board isn't held in RAM; the tiles
+                still are. Needs NumPy)
+            canvas_dir: Directory for the memmap canvas file (default: system temp)
+            edge_color: Color of a 1px line along the board's top and left
+                edges, which tiles don't draw themselves (default: none)
+            profile: Output profile for exports, see OUTPUT_PROFILES
+            jpeg_quality: Override the profile's JPEG quality for the PDF
         """
+        if compositor not in COMPOSITORS:
+            raise ValueError(f"Unknown compositor '{compositor}', choose from {COMPOSITORS}")
+        if canvas not in CANVASES:
+            raise ValueError(f"Unknown canvas '{canvas}', choose from {CANVASES}")
+        if (compositor == "numpy" or canvas == "memmap") and _numpy() is None:
+            raise ImportError(
+                f"The {compositor if compositor == 'numpy' else 'memmap canvas'} "
+                f"requires NumPy (pip install numpy)"
+            )
         self.tile_width = tile_width
         self.tile_height = tile_height
         self.board_cols = board_cols
         self.board_rows = board_rows
         self.tile_spacing = tile_spacing
+        self.compositor = compositor
+        self.canvas = canvas
+        self.canvas_dir = canvas_dir
+        self.edge_color = edge_color
+        self.profile = profile
+        self.output_profile = output_profile(profile, jpeg_quality)
         self.tiles: List[List[Optional[Image.Image]]] = []
+        self.rotations: List[List[int]] = []
+        self.display_lists: List[List[Optional["DisplayList"]]] = []
+        self.overlays: List[Tuple[Image.Image, Tuple[int, int]]] = []
+        self._canvas_array = None
+        self._canvas_path: Optional[str] = None
+        self._canvas_stale = True
 
         # Initialize empty board
         self._initialize_board()
@@ -74,33 +256,80 @@ class BoardGameEngine:
         self.tiles = [
             [None for _ in range(self.board_cols)] for _ in range(self.board_rows)
         ]
+        self.rotations = [
+            [0 for _ in range(self.board_cols)] for _ in range(self.board_rows)
+        ]
+        self.display_lists = [
+            [None for _ in range(self.board_cols)] for _ in range(self.board_rows)
+        ]
 
-    def set_tile(self, row: int, col: int, tile_image: Image.Image):
+    def set_tile(
+        self,
+        row: int,
+        col: int,
+        tile_image: Image.Image,
+        rotation: int = 0,
+        display_list: Optional["DisplayList"] = None,
+    ):
         """
         Set a tile at a specific position.
 
+        The tile is stored unrotated; the rotation is applied while compositing
+        the board, so no rotated copy is kept per tile. Tiles are only resampled
+        if their size, once rotated, does not match the slot.
+
         Args:
             row: Row index (0-based)
             col: Column index (0-based)
-            tile_image: PIL Image of the tile
+            tile_image: PIL Image of the tile, in unrotated orientation
+            rotation: Counter-clockwise rotation in degrees applied on placement
+            display_list: The tile's layout (see Tile.display_list), for vector
+                exports; without it they embed `tile_image`
         """
         if 0 <= row < self.board_rows and 0 <= col < self.board_cols:
-            if tile_image.size != (self.tile_width, self.tile_height):
-                tile_image = tile_image.resize(
-                    (self.tile_width, self.tile_height), Image.Resampling.LANCZOS
-                )
+            rotation %= 360
+            if rotation not in (0, *TRANSPOSE_MAP):
+                # Arbitrary angles can't be deferred to a transpose
+                tile_image = tile_image.rotate(rotation, expand=True)
+                rotation = 0
+                display_list = None
+
+            # Size the slot expects before rotation (swapped for quarter turns)
+            if rotation in (90, 270):
+                target = (self.tile_height, self.tile_width)
+            else:
+                target = (self.tile_width, self.tile_height)
+            if tile_image.size != target:
+                tile_image = tile_image.resize(target, Image.Resampling.LANCZOS)
+
             self.tiles[row][col] = tile_image
+            self.rotations[row][col] = rotation
+            self.display_lists[row][col] = display_list
+            self._canvas_stale = True
         else:
             raise IndexError(f"Position ({row}, {col}) is out of bounds")
 
-    def render_board(self) -> Image.Image:
+    def add_overlay(self, image: Image.Image, position: Tuple[int, int]):
         """
-        Render the complete board as a single image.
+        Add an image drawn over the tiles, e.g. an info panel.
 
-        Returns:
-            PIL Image of the complete board
+        Args:
+            image: PIL Image to paste
+            position: (x, y) of its top-left corner on the board, in pixels
         """
-        # Calculate board dimensions
+        self.overlays.append((image, position))
+        self._canvas_stale = True
+
+    def placed_tile(self, row: int, col: int) -> Optional[Image.Image]:
+        """Return the tile at a position in its placed orientation."""
+        tile_image = self.tiles[row][col]
+        rotation = self.rotations[row][col]
+        if tile_image is None or not rotation:
+            return tile_image
+        return tile_image.transpose(TRANSPOSE_MAP[rotation])
+
+    def board_size(self) -> Tuple[int, int]:
+        """Board (width, height) in pixels."""
         board_width = (
             self.board_cols * self.tile_width
             + (self.board_cols - 1) * self.tile_spacing
@@ -109,6 +338,20 @@ class BoardGameEngine:
             self.board_rows * self.tile_height
             + (self.board_rows - 1) * self.tile_spacing
         )
+        return board_width, board_height
+
+    def render_board(self) -> Image.Image:
+        """
+        Render the complete board as a single image.
+
+        Returns:
+            PIL Image of the complete board
+        """
+        if self.compositor == "numpy":
+            return self._render_board_numpy()
+
+        # Calculate board dimensions
+        board_width, board_height = self.board_size()
 
         # Create board image
         board = Image.new("RGB", (board_width, board_height), (255, 255, 255))
@@ -116,14 +359,217 @@ class BoardGameEngine:
         # Paste tiles onto board
         for row in range(self.board_rows):
             for col in range(self.board_cols):
-                if self.tiles[row][col] is not None:
+                tile_image = self.placed_tile(row, col)
+                if tile_image is not None:
                     x = col * (self.tile_width + self.tile_spacing)
                     y = row * (self.tile_height + self.tile_spacing)
-                    board.paste(self.tiles[row][col], (x, y))
+                    board.paste(tile_image, (x, y))
+
+        if self.edge_color is not None:
+            board.paste(self.edge_color, (0, 0, board_width, 1))
+            board.paste(self.edge_color, (0, 0, 1, board_height))
+        for image, position in self.overlays:
+            board.paste(image, position)
 
         return board
 
-    def export_image(self, output_path: str, dpi: int = 300):
+    def compose_array(self, out=None):
+        """
+        Assemble the board into one contiguous uint8[H, W, 4] RGBX array.
+
+        Pixels are 4 bytes wide, matching how PIL stores RGB internally, so
+        each tile is read out of PIL with a plain copy and written into its
+        slot with a single slice assignment of whole 32-bit pixels. Rotations
+        are applied as rotated views of the tile data, without a rotated copy.
+
+        Args:
+            out: Preallocated uint8[H, W, 4] array to fill (default: allocate)
+
+        Returns:
+            The board array
+        """
+        np = _numpy()
+        board_width, board_height = self.board_size()
+        if out is None:
+            out = np.empty((board_height, board_width, 4), dtype=np.uint8)
+        out[...] = 255
+        pixels_out = out.view(np.uint32)[:, :, 0]
+
+        for row in range(self.board_rows):
+            for col in range(self.board_cols):
+                tile_image = self.tiles[row][col]
+                if tile_image is None:
+                    continue
+                if tile_image.mode != "RGB":
+                    tile_image = tile_image.convert("RGB")
+                pixels = np.frombuffer(
+                    tile_image.tobytes("raw", "RGBX"), dtype=np.uint32
+                ).reshape(tile_image.height, tile_image.width)
+                rotation = self.rotations[row][col]
+                if rotation:
+                    # np.rot90 turns counter-clockwise, like Image.Transpose.ROTATE_*
+                    pixels = np.rot90(pixels, k=rotation // 90)
+                x = col * (self.tile_width + self.tile_spacing)
+                y = row * (self.tile_height + self.tile_spacing)
+                pixels_out[y:y + pixels.shape[0], x:x + pixels.shape[1]] = pixels
+
+        if self.edge_color is not None:
+            edge = np.frombuffer(bytes((*self.edge_color, 255)), dtype=np.uint32)[0]
+            pixels_out[0, :] = edge
+            pixels_out[:, 0] = edge
+        for image, (x, y) in self.overlays:
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            pixels = np.frombuffer(
+                image.tobytes("raw", "RGBX"), dtype=np.uint32
+            ).reshape(image.height, image.width)
+            # Clip to the board, like Image.paste does
+            x0, y0 = max(x, 0), max(y, 0)
+            x1 = min(x + image.width, board_width)
+            y1 = min(y + image.height, board_height)
+            if x1 > x0 and y1 > y0:
+                pixels_out[y0:y1, x0:x1] = pixels[y0 - y:y1 - y, x0 - x:x1 - x]
+
+        return out
+
+    def _render_board_numpy(self) -> Image.Image:
+        """Render the board via compose_array and hand the buffer to PIL."""
+        board_width, board_height = self.board_size()
+        pixels = self.compose_array()
+        # RGBX matches PIL's in-memory RGB layout, so this is one straight
+        # copy into a regular, writable RGB image
+        return Image.frombytes(
+            "RGB", (board_width, board_height), pixels, "raw", "RGBX", 0, 1
+        )
+
+    def render_canvas(self):
+        """
+        Compose the board into the memory-mapped canvas file (memmap canvas).
+
+        The canvas is only recomposed when tiles or overlays changed, so
+        several exports share one composition.
+
+        Returns:
+            uint8[H, W, 4] RGBX memmap of the board
+        """
+        if self._canvas_array is None:
+            np = _numpy()
+            board_width, board_height = self.board_size()
+            if self.canvas_dir:
+                os.makedirs(self.canvas_dir, exist_ok=True)
+            fd, self._canvas_path = tempfile.mkstemp(suffix=".canvas", dir=self.canvas_dir)
+            os.close(fd)
+            self._canvas_array = np.memmap(
+                self._canvas_path, dtype=np.uint8, mode="w+",
+                shape=(board_height, board_width, 4),
+            )
+            # The mapping keeps the pages alive, so the file can go right away
+            # and a killed build leaves nothing behind. Windows can't delete a
+            # mapped file; close() removes it there.
+            try:
+                os.remove(self._canvas_path)
+                self._canvas_path = None
+            except OSError:
+                pass
+        if self._canvas_stale:
+            self.compose_array(out=self._canvas_array)
+            self._canvas_array.flush()
+            self._canvas_stale = False
+        return self._canvas_array
+
+    def close(self):
+        """Release the memmap canvas and delete its file, if still there."""
+        # The mapping goes away with the last reference
+        self._canvas_array = None
+        self._canvas_stale = True
+        if self._canvas_path is not None:
+            try:
+                os.remove(self._canvas_path)
+            except OSError:
+                pass
+            self._canvas_path = None
+
+    def _strip_rows(self, width: int) -> int:
+        """Rows per strip so one RGBX strip stays within STRIP_BYTES."""
+        return max(1, STRIP_BYTES // (width * 4))
+
+    def iter_strips(self):
+        """Yield the canvas as uint8[rows, W, 3] RGB strips, top to bottom."""
+        pixels = self.render_canvas()
+        board_height, board_width = pixels.shape[:2]
+        rows = self._strip_rows(board_width)
+        for y in range(0, board_height, rows):
+            yield pixels[y:y + rows, :, :3]
+
+    def iter_scaled_strips(self, size: Tuple[int, int]):
+        """
+        Yield the canvas resized to `size` as RGB strips, top to bottom.
+
+        Each output strip is resampled from just the source rows under it,
+        plus the Lanczos filter's reach, so the result matches resizing the
+        whole board while only holding one strip.
+        """
+        np = _numpy()
+        pixels = self.render_canvas()
+        board_height, board_width = pixels.shape[:2]
+        target_width, target_height = size
+        scale_y = board_height / target_height
+        # Lanczos samples 3 source pixels either side, stretched when downscaling
+        reach = math.ceil(3 * max(scale_y, 1.0)) + 1
+        rows = self._strip_rows(max(board_width, target_width))
+        for out_y in range(0, target_height, rows):
+            out_y1 = min(out_y + rows, target_height)
+            top, bottom = out_y * scale_y, out_y1 * scale_y
+            y0 = max(0, math.floor(top) - reach)
+            y1 = min(board_height, math.ceil(bottom) + reach)
+            strip = Image.frombytes(
+                "RGB", (board_width, y1 - y0), pixels[y0:y1].tobytes(), "raw", "RGBX", 0, 1
+            )
+            scaled = strip.resize(
+                (target_width, out_y1 - out_y),
+                Image.Resampling.LANCZOS,
+                box=(0, top - y0, board_width, bottom - y0),
+            )
+            yield np.asarray(scaled)
+
+    def _png_level(self) -> int:
+        """zlib level for PNGs written by the strip encoder."""
+        profile = self.output_profile
+        return 9 if profile["png_optimize"] else profile["png_compress_level"]
+
+    def _save_png(self, image: Image.Image, output_path: str, dpi: int):
+        """Save an in-memory board as PNG with the output profile's settings."""
+        profile = self.output_profile
+        np = _numpy()
+        if profile["png_encoder"] == "strips" and np is not None:
+            from .stream_export import write_png_strips
+
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            pixels = np.asarray(image)
+            rows = self._strip_rows(image.width)
+            strips = (pixels[y:y + rows] for y in range(0, image.height, rows))
+            write_png_strips(
+                output_path, image.width, image.height, strips, dpi=dpi,
+                compress_level=profile["png_compress_level"],
+            )
+        else:
+            image.save(
+                output_path,
+                dpi=(dpi, dpi),
+                compress_level=profile["png_compress_level"],
+                optimize=profile["png_optimize"],
+            )
+
+    def _report_output(self, output_path: str, started: float):
+        """Print the size and encode time of an export."""
+        size_mb = os.path.getsize(output_path) / (1024 * 1024)
+        elapsed = time.perf_counter() - started
+        print(f"  {self.profile} profile: {size_mb:.1f} MB, encoded in {elapsed:.2f}s")
+
+    def export_image(
+        self, output_path: str, dpi: int = 300, board: Optional[Image.Image] = None
+    ):
         """
         Export the board as an image. Tiles are already rendered at their
         target pixel size, so no upscaling is done.
@@ -131,19 +577,40 @@ class BoardGameEngine:
         Args:
             output_path: Path to save the image
             dpi: DPI metadata tag (for print sizing, does not change pixels)
+            board: Already composited board image (default: render the tiles)
         """
-        board = self.render_board()
-
         os.makedirs(
             os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
             exist_ok=True,
         )
 
-        board.save(output_path, dpi=(dpi, dpi))
+        if self.canvas == "memmap" and board is None:
+            from .stream_export import write_png_strips
+
+            board_width, board_height = self.board_size()
+            started = time.perf_counter()
+            write_png_strips(
+                output_path, board_width, board_height, self.iter_strips(), dpi=dpi,
+                compress_level=self._png_level(),
+            )
+            print(f"Board exported to {output_path} ({board_width}x{board_height}px, {dpi} DPI)")
+            self._report_output(output_path, started)
+            return
+
+        if board is None:
+            board = self.render_board()
+        started = time.perf_counter()
+        self._save_png(board, output_path, dpi)
         print(f"Board exported to {output_path} ({board.width}x{board.height}px, {dpi} DPI)")
+        self._report_output(output_path, started)
 
     def export_image_exact_size(
-        self, output_path: str, width_mm: float, height_mm: float, dpi: int = 300
+        self,
+        output_path: str,
+        width_mm: float,
+        height_mm: float,
+        dpi: int = 300,
+        board: Optional[Image.Image] = None,
     ):
         """
         Export the board at an exact physical size.
@@ -153,48 +620,230 @@ class BoardGameEngine:
             width_mm: Output width in millimeters
             height_mm: Output height in millimeters
             dpi: Dots per inch for print quality (300 or 600 recommended)
+            board: Already composited board image (default: render the tiles)
         """
-        board = self.render_board()
-
         # Calculate target pixel dimensions
         target_width_px = mm_to_pixels(width_mm, dpi)
         target_height_px = mm_to_pixels(height_mm, dpi)
 
-        # Resize board to exact dimensions
-        board_resized = board.resize(
-            (target_width_px, target_height_px), Image.Resampling.LANCZOS
-        )
-
         # Ensure output directory exists
         os.makedirs(
             os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
             exist_ok=True,
         )
 
-        board_resized.save(output_path, dpi=(dpi, dpi))
+        if (target_width_px, target_height_px) == self.board_size():
+            # Already composed at this size (e.g. from tiles rendered at this DPI)
+            self.export_image(output_path, dpi, board)
+            return
+        if self.canvas == "memmap" and board is None:
+            from .stream_export import write_png_strips
+
+            # Resample strip by strip straight into the encoder
+            started = time.perf_counter()
+            write_png_strips(
+                output_path,
+                target_width_px,
+                target_height_px,
+                self.iter_scaled_strips((target_width_px, target_height_px)),
+                dpi=dpi,
+                compress_level=self._png_level(),
+            )
+        else:
+            if board is None:
+                board = self.render_board()
+
+            # Resize board to exact dimensions
+            board_resized = board.resize(
+                (target_width_px, target_height_px), Image.Resampling.LANCZOS
+            )
+            started = time.perf_counter()
+            self._save_png(board_resized, output_path, dpi)
         print(
             f"Board exported to {output_path} at {width_mm}x{height_mm}mm ({dpi} DPI)"
         )
         print(f"  Pixel dimensions: {target_width_px}x{target_height_px}px")
+        self._report_output(output_path, started)
+
+    def _pdf_image(self, board: Image.Image) -> "ImageReader":
+        """
+        Prepare the board for ReportLab as the output profile asks: reduced
+        by `pdf_reduce`, and JPEG encoded for "jpeg" profiles. ReportLab
+        embeds JPEG data as is (DCTDecode) instead of deflating raw pixels.
+        """
+        from reportlab.lib.utils import ImageReader
+
+        profile = self.output_profile
+        if profile["pdf_reduce"] > 1:
+            board = board.reduce(profile["pdf_reduce"])
+        if profile["pdf_image"] == "jpeg":
+            buffer = io.BytesIO()
+            board.save(buffer, format="JPEG", quality=profile["jpeg_quality"])
+            buffer.seek(0)
+            return ImageReader(buffer)
+        return ImageReader(board)
+
+    def can_embed_png(self) -> bool:
+        """
+        Whether the output profile's PDF image is the full-resolution lossless
+        board, so an exported PNG of it can be embedded without re-encoding.
+        """
+        profile = self.output_profile
+        return profile["pdf_image"] == "flate" and profile["pdf_reduce"] == 1
+
+    def _embed_png(self, output_path: str, png_path: Optional[str], page_size, margin: float) -> bool:
+        """
+        Write the PDF by copying the compressed data of `png_path`, if the
+        profile and the PNG allow it.
+
+        Returns:
+            True if the PDF was written
+        """
+        if not png_path or not self.can_embed_png():
+            return False
+        from .stream_export import png_embed_size, write_pdf_from_png
+
+        if png_embed_size(png_path) is None:
+            return False
+        write_pdf_from_png(output_path, png_path, page_size, margin=margin)
+        return True
+
+    def slot_size(self, row: int, col: int) -> Tuple[int, int]:
+        """Size of the tile at a position before rotation (swapped for quarter turns)."""
+        if self.rotations[row][col] in (90, 270):
+            return self.tile_height, self.tile_width
+        return self.tile_width, self.tile_height
+
+    def _write_pdf_vector(self, output_path: str, page_size, margin: float):
+        """
+        Draw the board as vectors: tiles from their display lists, rotated by
+        transform. Tiles set without a display list and overlays are embedded
+        as images.
+        """
+        from reportlab.lib.utils import ImageReader
+
+        from .display_list import draw_pdf, placement_matrix
+
+        board_width, board_height = self.board_size()
+        page_width, page_height = page_size
+        scale = min(page_width / board_width, page_height / board_height) * margin
+
+        c = _pdf_canvas(output_path, page_size)
+        # Work in board pixels with y pointing down, like the raster board
+        c.transform(
+            scale, 0, 0, -scale,
+            (page_width - board_width * scale) / 2,
+            (page_height + board_height * scale) / 2,
+        )
+        c.setFillColorRGB(1, 1, 1)
+        c.rect(0, 0, board_width, board_height, stroke=0, fill=1)
+
+        def draw_image(image, x, y):
+            c.saveState()
+            c.transform(1, 0, 0, -1, x, y + image.height)
+            c.drawImage(ImageReader(image), 0, 0, image.width, image.height)
+            c.restoreState()
+
+        for row in range(self.board_rows):
+            for col in range(self.board_cols):
+                x = col * (self.tile_width + self.tile_spacing)
+                y = row * (self.tile_height + self.tile_spacing)
+                display_list = self.display_lists[row][col]
+                if display_list is None:
+                    tile_image = self.placed_tile(row, col)
+                    if tile_image is not None:
+                        draw_image(tile_image, x, y)
+                    continue
+                width, height = self.slot_size(row, col)
+                c.saveState()
+                c.translate(x, y)
+                c.transform(*placement_matrix(self.rotations[row][col], width, height))
+                c.scale(width / display_list.width, height / display_list.height)
+                draw_pdf(c, display_list)
+                c.restoreState()
+
+        if self.edge_color is not None:
+            c.setFillColorRGB(*(v / 255 for v in self.edge_color))
+            c.rect(0, 0, board_width, 1, stroke=0, fill=1)
+            c.rect(0, 0, 1, board_height, stroke=0, fill=1)
+        for image, (x, y) in self.overlays:
+            draw_image(image, x, y)
+        c.save()
 
-    def export_pdf(self, output_path: str, page_size: Tuple[float, float] = A4):
+    def _write_pdf_strips(self, output_path: str, page_size, margin: float):
+        """
+        Write the memmap canvas to a PDF in strips. JPEG needs the whole image
+        at once, so the image is always deflated here.
+        """
+        from .stream_export import write_pdf_strips
+
+        if self.output_profile["pdf_image"] == "jpeg":
+            print(
+                f"Warning: The memmap canvas writes {output_path} losslessly; "
+                f"the {self.profile} profile's JPEG encoding "
+                f"(quality {self.output_profile['jpeg_quality']}) is not applied"
+            )
+        board_width, board_height = self.board_size()
+        reduce = self.output_profile["pdf_reduce"]
+        if reduce > 1:
+            size = (board_width // reduce, board_height // reduce)
+            strips = self.iter_scaled_strips(size)
+        else:
+            size = (board_width, board_height)
+            strips = self.iter_strips()
+        write_pdf_strips(
+            output_path, *size, strips, page_size, margin=margin,
+            compress_level=self._png_level(),
+        )
+
+    def export_pdf(
+        self,
+        output_path: str,
+        page_size: Tuple[float, float] = PAGE_SIZES["A4"],
+        board: Optional[Image.Image] = None,
+        png_path: Optional[str] = None,
+    ):
         """
         Export the board as a PDF using ReportLab.
 
         Args:
             output_path: Path to save the PDF
             page_size: Page size tuple (width, height) in points
+            board: Already composited board image (default: render the tiles)
+            png_path: PNG export of this board; with a lossless profile its
+                compressed data is embedded as is instead of deflating the
+                board again
         """
-        board = self.render_board()
-
         # Ensure output directory exists
         os.makedirs(
             os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
             exist_ok=True,
         )
 
+        started = time.perf_counter()
+        if self.output_profile["pdf_image"] == "vector":
+            self._write_pdf_vector(output_path, page_size, margin=0.95)
+            print(f"Board exported to PDF: {output_path} (vector)")
+            self._report_output(output_path, started)
+            return
+
+        if self._embed_png(output_path, png_path, page_size, margin=0.95):
+            print(f"Board exported to PDF: {output_path} (embedded {png_path})")
+            self._report_output(output_path, started)
+            return
+
+        if self.canvas == "memmap" and board is None:
+            self._write_pdf_strips(output_path, page_size, margin=0.95)
+            print(f"Board exported to PDF: {output_path}")
+            self._report_output(output_path, started)
+            return
+
+        if board is None:
+            board = self.render_board()
+        started = time.perf_counter()
+
         # Create PDF
-        c = canvas.Canvas(output_path, pagesize=page_size)
+        c = _pdf_canvas(output_path, page_size)
         page_width, page_height = page_size
 
         # Calculate scaling to fit board on page
@@ -209,7 +858,7 @@ class BoardGameEngine:
         y_offset = (page_height - scaled_height) / 2
 
         # Convert PIL Image to format ReportLab can use
-        img_reader = ImageReader(board)
+        img_reader = self._pdf_image(board)
 
         # Draw the board
         c.drawImage(
@@ -218,9 +867,14 @@ class BoardGameEngine:
 
         c.save()
         print(f"Board exported to PDF: {output_path}")
+        self._report_output(output_path, started)
 
     def export_pdf_exact_size(
-        self, output_path: str, width_mm: float, height_mm: float
+        self,
+        output_path: str,
+        width_mm: float,
+        height_mm: float,
+        png_path: Optional[str] = None,
     ):
         """
         Export the board as a PDF at exact physical size.
@@ -229,9 +883,8 @@ class BoardGameEngine:
             output_path: Path to save the PDF
             width_mm: Output width in millimeters
             height_mm: Output height in millimeters
+            png_path: PNG export of this board to embed as is (see export_pdf)
         """
-        board = self.render_board()
-
         # Ensure output directory exists
         os.makedirs(
             os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
@@ -243,8 +896,29 @@ class BoardGameEngine:
         page_height_pt = mm_to_points(height_mm)
         page_size = (page_width_pt, page_height_pt)
 
+        started = time.perf_counter()
+        if self.output_profile["pdf_image"] == "vector":
+            self._write_pdf_vector(output_path, page_size, margin=1.0)
+            print(f"Board exported to PDF: {output_path} at {width_mm}x{height_mm}mm (vector)")
+            self._report_output(output_path, started)
+            return
+
+        if self._embed_png(output_path, png_path, page_size, margin=1.0):
+            print(f"Board exported to PDF: {output_path} at {width_mm}x{height_mm}mm (embedded {png_path})")
+            self._report_output(output_path, started)
+            return
+
+        if self.canvas == "memmap":
+            self._write_pdf_strips(output_path, page_size, margin=1.0)
+            print(f"Board exported to PDF: {output_path} at {width_mm}x{height_mm}mm")
+            self._report_output(output_path, started)
+            return
+
+        board = self.render_board()
+        started = time.perf_counter()
+
         # Create PDF with exact size
-        c = canvas.Canvas(output_path, pagesize=page_size)
+        c = _pdf_canvas(output_path, page_size)
 
         # Scale board to fit exactly on the page
         scale_x = page_width_pt / board.width
@@ -258,7 +932,7 @@ class BoardGameEngine:
         y_offset = (page_height_pt - scaled_height) / 2
 
         # Convert PIL Image to format ReportLab can use
-        img_reader = ImageReader(board)
+        img_reader = self._pdf_image(board)
 
         # Draw the board
         c.drawImage(
@@ -267,3 +941,109 @@ class BoardGameEngine:
 
         c.save()
         print(f"Board exported to PDF: {output_path} at {width_mm}x{height_mm}mm")
+        self._report_output(output_path, started)
+
+    def export_svg(self, output_path: str, dpi: int = 300):
+        """
+        Export the board as SVG, written as it is generated.
+
+        Tiles are drawn from their display lists as <g> groups rotated by
+        transform, with real text in the embedded bundled fonts. Each image
+        file is embedded once in <defs> and <use>d by every tile showing it.
+        Tiles set without a display list and overlays are embedded as PNG.
+
+        Args:
+            output_path: Path to save the SVG
+            dpi: Resolution the board's pixels are meant for, which sets the
+                document's physical size
+        """
+        from .display_list import (
+            Picture,
+            Text,
+            is_pixelated,
+            placement_matrix,
+            png_data_uri,
+            svg_elements,
+            svg_font_face,
+            svg_shared_image,
+            svg_use,
+        )
+
+        os.makedirs(
+            os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
+            exist_ok=True,
+        )
+        started = time.perf_counter()
+        board_width, board_height = self.board_size()
+
+        # Collect the shared images and fonts up front, they go in <defs>
+        images = {}
+        fonts = set()
+        for row in self.display_lists:
+            for display_list in row:
+                for op in display_list.ops if display_list else ():
+                    if isinstance(op, Picture) and op.path not in images:
+                        images[op.path] = (f"img{len(images)}", is_pixelated(op))
+                    elif isinstance(op, Text) and op.font:
+                        fonts.add(op.font)
+
+        def use(picture):
+            return svg_use(images[picture.path][0], picture)
+
+        def png_image(image, x, y):
+            # Only panels and stray tiles are raster here; favour encode speed
+            return (
+                f'<image x="{x}" y="{y}" width="{image.width}" height="{image.height}" '
+                f'href="{png_data_uri(image, compress_level=1)}"/>\n'
+            )
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(
+                f'<svg xmlns="http://www.w3.org/2000/svg" '
+                f'width="{board_width / dpi * 25.4:.2f}mm" '
+                f'height="{board_height / dpi * 25.4:.2f}mm" '
+                f'viewBox="0 0 {board_width} {board_height}">\n<defs>\n'
+            )
+            if fonts:
+                f.write("<style>")
+                f.writelines(svg_font_face(path) for path in sorted(fonts))
+                f.write("</style>\n")
+            for path, (image_id, pixelated) in images.items():
+                f.write(svg_shared_image(image_id, path, pixelated) + "\n")
+            f.write(
+                f'</defs>\n<rect width="{board_width}" height="{board_height}" '
+                f'fill="#ffffff"/>\n'
+            )
+
+            for row in range(self.board_rows):
+                for col in range(self.board_cols):
+                    x = col * (self.tile_width + self.tile_spacing)
+                    y = row * (self.tile_height + self.tile_spacing)
+                    display_list = self.display_lists[row][col]
+                    if display_list is None:
+                        tile_image = self.placed_tile(row, col)
+                        if tile_image is not None:
+                            f.write(png_image(tile_image, x, y))
+                        continue
+                    width, height = self.slot_size(row, col)
+                    matrix = " ".join(
+                        f"{v:g}"
+                        for v in placement_matrix(self.rotations[row][col], width, height)
+                    )
+                    f.write(
+                        f'<g transform="translate({x} {y}) matrix({matrix}) '
+                        f'scale({width / display_list.width:g} {height / display_list.height:g})">'
+                    )
+                    f.writelines(svg_elements(display_list, use))
+                    f.write("</g>\n")
+
+            if self.edge_color is not None:
+                fill = "#{:02x}{:02x}{:02x}".format(*self.edge_color)
+                f.write(f'<rect width="{board_width}" height="1" fill="{fill}"/>\n')
+                f.write(f'<rect width="1" height="{board_height}" fill="{fill}"/>\n')
+            for image, (x, y) in self.overlays:
+                f.write(png_image(image, x, y))
+            f.write("</svg>\n")
+
+        print(f"Board exported to SVG: {output_path}")
+        self._report_output(output_path, started)
@@ -0,0 +1,209 @@
+"""
+Glyph atlas for fast repeated text rasterization.
+
+Each (font, size, glyph) is rasterized once into an alpha mask; drawing text
+is then a series of mask pastes positioned with kerning-aware advances.
+Faux-bold glyphs are cached as pre-dilated masks instead of drawing the text
+three times.
+"""
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+from typing import Dict, Iterable, Optional, Tuple
+
+# Horizontal offsets the faux-bold effect is smeared over (x, x+1, x+2)
+BOLD_OFFSETS = (0, 1, 2)
+
+
+def bold_offsets(scale: float = 1.0) -> Tuple[int, ...]:
+    """
+    Faux-bold offsets for text rendered at `scale`, so bold keeps roughly
+    its weight in scaled-down renders. Never thinner than a 1px smear.
+    """
+    return tuple(range(max(2, round(len(BOLD_OFFSETS) * scale))))
+
+
+class GlyphAtlas:
+    def __init__(self):
+        self._fonts: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+        # Fonts without a file, by id; kept alive so their ids aren't reused
+        self._fileless_fonts: Dict[int, ImageFont.ImageFont] = {}
+        self._glyphs: Dict[tuple, Tuple[Optional[Image.Image], Tuple[int, int]]] = {}
+        self._bboxes: Dict[Tuple[tuple, str], Tuple[int, int, int, int]] = {}
+        self._advances: Dict[Tuple[tuple, str, str], float] = {}
+        self._widths: Dict[Tuple[tuple, str], int] = {}
+
+    def load_font(self, path: str, size: int) -> ImageFont.FreeTypeFont:
+        """Load a TrueType font once per (path, size)."""
+        key = (str(path), size)
+        if key not in self._fonts:
+            self._fonts[key] = ImageFont.truetype(str(path), size)
+        return self._fonts[key]
+
+    def _font_key(self, font) -> tuple:
+        """
+        Cache key of a font: its file, size and face index, so equal fonts
+        loaded separately share glyphs. Fonts without a file (PIL's built-in
+        default) are keyed by identity.
+        """
+        path = getattr(font, "path", None)
+        if isinstance(path, str):
+            return path, font.size, getattr(font, "index", 0)
+        self._fileless_fonts.setdefault(id(font), font)
+        return (id(font),)
+
+    def _bbox(self, font, ch: str) -> Tuple[int, int, int, int]:
+        key = (self._font_key(font), ch)
+        if key not in self._bboxes:
+            self._bboxes[key] = font.getbbox(ch)
+        return self._bboxes[key]
+
+    def glyph(self, font, ch: str, bold: bool = False, offsets: Tuple[int, ...] = BOLD_OFFSETS):
+        """
+        Get the cached alpha mask for a glyph.
+
+        Args:
+            font: Font from load_font
+            ch: Character
+            bold: Whether to smear the glyph into faux bold
+            offsets: Horizontal offsets the bold smear covers
+
+        Returns:
+            (mask, (dx, dy)) where the offset is relative to the pen position,
+            or (None, offset) for glyphs without ink such as spaces
+        """
+        key = (self._font_key(font), ch, offsets if bold else False)
+        if key in self._glyphs:
+            return self._glyphs[key]
+
+        left, top, right, bottom = self._bbox(font, ch)
+        mask = None
+        if right > left and bottom > top:
+            mask = Image.new("L", (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), ch, fill=255, font=font)
+            if bold:
+                dilated = Image.new("L", (mask.width + offsets[-1], mask.height), 0)
+                for dx in offsets:
+                    shifted = Image.new("L", dilated.size, 0)
+                    shifted.paste(mask, (dx, 0))
+                    dilated = ImageChops.lighter(dilated, shifted)
+                mask = dilated
+
+        self._glyphs[key] = (mask, (left, top))
+        return self._glyphs[key]
+
+    def advance(self, font, ch: str, next_ch: Optional[str] = None) -> float:
+        """Pen advance after `ch`, including kerning against `next_ch`."""
+        key = (self._font_key(font), ch, next_ch or "")
+        if key not in self._advances:
+            if next_ch:
+                pair = font.getlength(ch + next_ch) - font.getlength(next_ch)
+            else:
+                pair = font.getlength(ch)
+            self._advances[key] = pair
+        return self._advances[key]
+
+    def text_width(self, font, text: str) -> int:
+        """
+        Ink width of a string, matching `ImageDraw.textbbox` width: from the
+        left edge of the first glyph to the right edge of the last one.
+        """
+        key = (self._font_key(font), text)
+        if key in self._widths:
+            return self._widths[key]
+
+        pen = 0.0
+        left = None
+        right = 0
+        for i, ch in enumerate(text):
+            x0, _, x1, _ = self._bbox(font, ch)
+            if x1 > x0:
+                if left is None:
+                    left = round(pen) + x0
+                right = round(pen) + x1
+            pen += self.advance(font, ch, text[i + 1] if i + 1 < len(text) else None)
+
+        width = right - left if left is not None else 0
+        self._widths[key] = width
+        return width
+
+    def measure(self, font) -> "LineMeasure":
+        """Start measuring a line that grows word by word. See LineMeasure."""
+        return LineMeasure(self, font)
+
+    def draw_runs(
+        self,
+        img: Image.Image,
+        xy: Tuple[float, float],
+        runs: Iterable[Tuple[str, bool]],
+        font,
+        fill,
+        bold_offsets: Tuple[int, ...] = BOLD_OFFSETS,
+    ) -> float:
+        """
+        Draw consecutive (text, is_bold) runs starting at xy, like `draw.text`
+        with the default left-ascender anchor. Bold runs are smeared over
+        `bold_offsets`.
+
+        Returns:
+            Pen x position after the last glyph
+        """
+        chars = [(ch, bold) for text, bold in runs for ch in text]
+        pen = float(xy[0])
+        y = int(xy[1])
+        for i, (ch, bold) in enumerate(chars):
+            mask, (dx, dy) = self.glyph(font, ch, bold, bold_offsets)
+            if mask is not None:
+                x0 = round(pen) + dx
+                img.paste(fill, (x0, y + dy, x0 + mask.width, y + dy + mask.height), mask)
+            next_ch = chars[i + 1][0] if i + 1 < len(chars) else None
+            pen += self.advance(font, ch, next_ch)
+        return pen
+
+    def draw_text(
+        self, img, xy, text: str, font, fill, bold: bool = False,
+        bold_offsets: Tuple[int, ...] = BOLD_OFFSETS,
+    ) -> float:
+        """Draw a single run of text. See `draw_runs`."""
+        return self.draw_runs(img, xy, [(text, bold)], font, fill, bold_offsets)
+
+
+class LineMeasure:
+    """
+    Ink width of a line built up piece by piece, as GlyphAtlas.text_width
+    would measure the whole string. Extending only measures the new
+    characters, so greedy word wrapping doesn't re-measure every prefix.
+    """
+
+    __slots__ = ("atlas", "font", "left", "right", "pen", "last")
+
+    def __init__(self, atlas: GlyphAtlas, font, left=None, right=0, pen=0.0, last=None):
+        self.atlas = atlas
+        self.font = font
+        self.left = left  # Ink left edge, None until the first inked glyph
+        self.right = right  # Ink right edge
+        self.pen = pen  # Pen x at the last character
+        self.last = last  # Last character, None for an empty line
+
+    @property
+    def width(self) -> int:
+        return self.right - self.left if self.left is not None else 0
+
+    def extended(self, text: str) -> "LineMeasure":
+        """Return the measure of this line with `text` appended."""
+        atlas, font = self.atlas, self.font
+        left, right, pen, last = self.left, self.right, self.pen, self.last
+        for ch in text:
+            if last is not None:
+                # The previous character's advance, kerned against this one
+                pen += atlas.advance(font, last, ch)
+            x0, _, x1, _ = atlas._bbox(font, ch)
+            if x1 > x0:
+                if left is None:
+                    left = round(pen) + x0
+                right = round(pen) + x1
+            last = ch
+        return LineMeasure(atlas, font, left, right, pen, last)
+
+
+# Shared atlas used by all tile and panel rendering
+ATLAS = GlyphAtlas()
@@ -0,0 +1,176 @@
+"""
+Rules text and the info panels rendered from it.
+
+docs/rules.md is parsed once into an index of sections keyed by heading,
+and panels are rendered from those sections.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from .build_cache import hash_file
+from .glyphs import ATLAS, bold_offsets
+
+FONTS_DIR = Path(__file__).parent.parent / "assets" / "fonts"
+
+HEADING_PATTERN = re.compile(r"^(#+) (.*)$")
+STYLED_PATTERN = re.compile(r"(\*\*.*?\*\*)")
+
+_rules_indexes: Dict[str, Dict[str, str]] = {}
+
+
+def load_rules_index(rules_file) -> Dict[str, str]:
+    """
+    Parse a rules markdown file into {heading: section text}.
+
+    A section runs from its heading to the next heading of any level. When a
+    heading occurs twice the first one wins. Indexes are cached by file content.
+
+    Args:
+        rules_file: Path to the markdown file
+
+    Returns:
+        Section texts, stripped, keyed by heading text
+    """
+    key = hash_file(rules_file)
+    if key in _rules_indexes:
+        return _rules_indexes[key]
+
+    with open(rules_file) as f:
+        lines = f.read().split("\n")
+
+    index: Dict[str, str] = {}
+    heading = None
+    body: List[str] = []
+    for line in lines + ["# "]:  # Sentinel heading closes the last section
+        match = HEADING_PATTERN.match(line)
+        if match:
+            if heading is not None:
+                index.setdefault(heading, "\n".join(body).strip())
+            heading = match.group(2).strip()
+            body = []
+        elif heading is not None:
+            body.append(line)
+
+    _rules_indexes[key] = index
+    return index
+
+
+def parse_rules_section(rules_file, section_name: str) -> str:
+    """Extract a section from rules.md by heading name."""
+    return load_rules_index(rules_file).get(section_name, "")
+
+
+def _get_font(size: int, font_type: str = "text"):
+    if font_type == "header":
+        path = FONTS_DIR / "gbboot.ttf"
+    else:
+        path = FONTS_DIR / "gil.TTF"
+    try:
+        return ATLAS.load_font(str(path), size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+def parse_styled(text: str) -> List[Tuple[str, bool]]:
+    """Parse text into [(word, is_bold), ...]"""
+    result = []
+    for seg in STYLED_PATTERN.split(text):
+        if not seg:
+            continue
+        bold = seg.startswith("**") and seg.endswith("**")
+        clean = seg[2:-2] if bold else seg
+        for word in clean.split():
+            result.append((word, bold))
+    return result
+
+
+def wrap_panel_text(body: str, width: int) -> List[Optional[List[Tuple[str, bool]]]]:
+    """
+    Greedily break panel text into lines of (word, is_bold), None marking
+    blank lines, for a panel `width` pixels wide at scale 1.0.
+
+    Breaks are measured at scale 1.0 whatever the render scale, so a panel
+    wraps the same way at every resolution.
+    """
+    body_font = _get_font(width // 18)
+    available_width = width - 16 * 2
+
+    lines: List[Optional[List[Tuple[str, bool]]]] = []
+    for line in body.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            lines.append(None)
+            continue
+
+        current_line = []
+        measure = ATLAS.measure(body_font)
+
+        for word, bold in parse_styled(stripped):
+            # Greedy wrap, measuring only the appended word
+            candidate = measure.extended(" " + word if current_line else word)
+            if candidate.width <= available_width:
+                current_line.append((word, bold))
+                measure = candidate
+            else:
+                if current_line:
+                    lines.append(current_line)
+                current_line = [(word, bold)]
+                measure = ATLAS.measure(body_font).extended(word)
+
+        if current_line:
+            lines.append(current_line)
+    return lines
+
+
+def render_info_panel(
+    header: str, body: str, width: int, height: int, scale: float = 1.0
+) -> Image.Image:
+    """
+    Render a free-form info panel with header and body text at native resolution.
+
+    Args:
+        header: Panel title
+        body: Section text, with **bold** markers
+        width: Panel width in pixels
+        height: Panel height in pixels
+        scale: Scale of the board the panel is rendered for; fixed margins
+            and spacing are given for 1.0 and scaled with it
+
+    Returns:
+        RGB PIL Image
+    """
+    w, h = width, height
+
+    def px(value):
+        return int(round(value * scale))
+
+    img = Image.new("RGB", (w, h), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+
+    header_font = _get_font(w // 10, "header")
+    hbox = draw.textbbox((0, 0), header, font=header_font)
+    hx = (w - (hbox[2] - hbox[0])) // 2
+    ATLAS.draw_text(img, (hx, px(10)), header, header_font, (0, 0, 0))
+    y = hbox[3] - hbox[1] + px(40)
+
+    body_font = _get_font(w // 18)
+    padding = px(16)
+    line_h = draw.textbbox((0, 0), "Ag", font=body_font)[3] + px(4)
+
+    def draw_styled_line(styled_words, x, y):
+        last = len(styled_words) - 1
+        runs = [(word + (" " if i < last else ""), bold) for i, (word, bold) in enumerate(styled_words)]
+        ATLAS.draw_runs(img, (x, y), runs, body_font, (0, 0, 0), bold_offsets(scale))
+
+    for styled_line in wrap_panel_text(body, round(w / scale)):
+        if styled_line is None:
+            y += px(6)
+            continue
+        draw_styled_line(styled_line, padding, y)
+        y += line_h
+
+    return img
@@ -0,0 +1,175 @@
+"""
+Layout lint: find tiles whose content doesn't fit, without rendering them.
+
+The check works on each tile's display list, so it costs header metrics,
+text wrapping and image headers only; no tile is rasterized. The one pixel
+read is a sprite's alpha channel, at source size, to tell its visible part
+from transparent margins. It reports, per tile:
+
+- overflow: text running past the tile's inner edges
+- clipped: visible image content cut off by the tile's edges
+- negative offset: text or visible image content placed above or left of
+  the tile, usually from a negative margin in the YAML
+- overlap: body text or footer drawn over the visible part of the tile
+  image. The header isn't checked: the image is raised behind it on purpose
+  (IMAGE_RAISE in tile.py).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from .display_list import Picture, Text, _load_font
+
+# Alpha above which a sprite pixel counts as visible
+VISIBLE_ALPHA = 64
+# Ignore slivers of overlap or clipping up to this many tile pixels
+TOLERANCE = 2
+
+Box = Tuple[float, float, float, float]
+
+# Thresholded alpha masks of source images, by path
+_visible_masks: Dict[str, Optional[Image.Image]] = {}
+
+
+@dataclass(slots=True, frozen=True)
+class LayoutIssue:
+    """A layout problem in one tile."""
+
+    kind: str  # "overflow", "clipped", "negative offset" or "overlap"
+    message: str
+
+    def __str__(self):
+        return f"{self.kind}: {self.message}"
+
+
+def _visible_mask(path: str) -> Optional[Image.Image]:
+    """1-bit mask of the source image's visible pixels, None if unreadable."""
+    if path not in _visible_masks:
+        try:
+            with Image.open(path) as img:
+                alpha = img.convert("RGBA").getchannel("A")
+            _visible_masks[path] = alpha.point(lambda a: 255 if a > VISIBLE_ALPHA else 0)
+        except OSError:
+            _visible_masks[path] = None
+    return _visible_masks[path]
+
+
+def _visible_box(picture: Picture, within: Optional[Box] = None) -> Optional[Box]:
+    """
+    Bounding box, in tile pixels, of the picture's visible pixels, optionally
+    only those inside `within`. None if nothing visible is there.
+    """
+    mask = _visible_mask(picture.path)
+    if mask is None:
+        return None
+    sx = mask.width / picture.width
+    sy = mask.height / picture.height
+
+    crop = (0, 0, mask.width, mask.height)
+    if within is not None:
+        x0, y0, x1, y1 = within
+        crop = (
+            max(0, int((x0 - picture.x) * sx)),
+            max(0, int((y0 - picture.y) * sy)),
+            min(mask.width, int((x1 - picture.x) * sx + 0.999)),
+            min(mask.height, int((y1 - picture.y) * sy + 0.999)),
+        )
+        if crop[0] >= crop[2] or crop[1] >= crop[3]:
+            return None
+
+    bbox = mask.crop(crop).getbbox()
+    if bbox is None:
+        return None
+    return (
+        picture.x + (crop[0] + bbox[0]) / sx,
+        picture.y + (crop[1] + bbox[1]) / sy,
+        picture.x + (crop[0] + bbox[2]) / sx,
+        picture.y + (crop[1] + bbox[3]) / sy,
+    )
+
+
+def _text_box(op: Text) -> Box:
+    """Ink box of a text line in tile pixels, from font metrics."""
+    text = "".join(run for run, _ in op.runs)
+    left, top, right, bottom = _load_font(op.font, op.size).getbbox(text)
+    return op.x + left, op.y + top, op.x + right, op.y + bottom
+
+
+def _edge_issues(kind_past: str, what: str, box: Box, inner: Box) -> List[LayoutIssue]:
+    """Issues for a box reaching outside the inner tile area."""
+    issues = []
+    x0, y0, x1, y1 = box
+    left, top, right, bottom = inner
+    for past, edge, kind in (
+        (top - y0, "top", "negative offset"),
+        (left - x0, "left", "negative offset"),
+        (y1 - bottom, "bottom", kind_past),
+        (x1 - right, "right", kind_past),
+    ):
+        if past > TOLERANCE:
+            issues.append(LayoutIssue(kind, f"{what} extends {round(past)}px past the {edge} edge"))
+    return issues
+
+
+def check_tile(tile) -> List[LayoutIssue]:
+    """
+    Check a tile's layout.
+
+    Args:
+        tile: Tile to check; its images must already be resolved or
+            resolvable without waiting (see AssetHandle.resolve_cached)
+
+    Returns:
+        Issues found, empty if the layout is clean
+    """
+    display_list = tile.display_list()
+    border = max(0, tile.border_width)
+    # The border is drawn on the right and bottom edges only
+    tile_box = (0, 0, display_list.width, display_list.height)
+    inner = (0, 0, display_list.width - border, display_list.height - border)
+
+    # The background image fills the tile by design
+    sprites = [op for op in display_list.pictures if op.role == "image"]
+
+    issues: List[LayoutIssue] = []
+    for picture in sprites:
+        box = _visible_box(picture)
+        if box is not None:
+            issues += _edge_issues("clipped", "image", box, tile_box)
+
+    text_boxes = []
+    for op in display_list.ops:
+        if not isinstance(op, Text):
+            continue
+        box = _text_box(op)
+        if op.role == "text":
+            text_boxes.append(box)
+            what = f"text line {len(text_boxes)}"
+        else:
+            what = op.role
+            issues += _edge_issues("overflow", what, box, inner)
+        if op.role == "header":
+            continue  # Drawn over the raised image by design
+
+        for picture in sprites:
+            overlap = _visible_box(picture, within=box)
+            if overlap is None:
+                continue
+            width, height = overlap[2] - overlap[0], overlap[3] - overlap[1]
+            if width > TOLERANCE and height > TOLERANCE:
+                issues.append(
+                    LayoutIssue("overlap", f"{what} overlaps the image ({round(height)}px)")
+                )
+
+    # Body text is checked as one block, so a long text reports once
+    if text_boxes:
+        block = (
+            min(box[0] for box in text_boxes),
+            min(box[1] for box in text_boxes),
+            max(box[2] for box in text_boxes),
+            max(box[3] for box in text_boxes),
+        )
+        issues += _edge_issues("overflow", "text", block, inner)
+    return issues
@@ -0,0 +1,104 @@
+"""
+Staged build pipeline.
+
+Items flow through a chain of stages (e.g. fetch -> decode -> render), each
+running its blocking function on its own thread pool. An asyncio event loop
+only moves items between the stages, through bounded queues. An item moves
+on as soon as its stage is done with it, so a tile whose sprite is still
+downloading doesn't hold up tiles that are ready to render. A full queue
+makes the stage before it wait, which bounds the work in flight between
+stages; the results of the last stage are all collected and returned
+together.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Sequence
+
+DEFAULT_QUEUE_SIZE = 8
+
+# Queue marker: the stage feeding this queue is finished
+_DONE = object()
+
+
+@dataclass(slots=True, frozen=True)
+class Stage:
+    """A pipeline step: `func` applied to each item by `workers` threads."""
+
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+
+
+async def _run_stage(
+    stage: Stage, inbox: asyncio.Queue, outbox: asyncio.Queue, consumers: int
+):
+    loop = asyncio.get_running_loop()
+
+    async def worker(pool):
+        while True:
+            entry = await inbox.get()
+            if entry is _DONE:
+                return
+            index, item = entry
+            result = await loop.run_in_executor(pool, stage.func, item)
+            await outbox.put((index, result))
+
+    with ThreadPoolExecutor(
+        max_workers=stage.workers, thread_name_prefix=f"pipeline-{stage.name}"
+    ) as pool:
+        await asyncio.gather(*(worker(pool) for _ in range(stage.workers)))
+    for _ in range(consumers):
+        await outbox.put(_DONE)
+
+
+async def _run_pipeline(items: List, stages: Sequence[Stage], queue_size: int) -> List:
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    results: List = [None] * len(items)
+
+    async def feed():
+        for index, item in enumerate(items):
+            await queues[0].put((index, item))
+        for _ in range(stages[0].workers):
+            await queues[0].put(_DONE)
+
+    async def collect():
+        while True:
+            entry = await queues[-1].get()
+            if entry is _DONE:
+                return
+            index, result = entry
+            results[index] = result
+
+    consumers = [stage.workers for stage in stages[1:]] + [1]
+    await asyncio.gather(
+        feed(),
+        *(
+            _run_stage(stage, queues[i], queues[i + 1], consumers[i])
+            for i, stage in enumerate(stages)
+        ),
+        collect(),
+    )
+    return results
+
+
+def run_pipeline(
+    items: Iterable, stages: Sequence[Stage], queue_size: int = DEFAULT_QUEUE_SIZE
+) -> List:
+    """
+    Run every item through the stages in order, stages working concurrently.
+
+    Args:
+        items: Inputs of the first stage
+        stages: Stages; each one's results are the next one's inputs
+        queue_size: Items that may wait between two stages
+
+    Returns:
+        Results of the last stage, in the order of `items`. An exception in
+        any stage stops the pipeline and is raised here.
+    """
+    items = list(items)
+    if not items or not stages:
+        return items
+    return asyncio.run(_run_pipeline(items, stages, queue_size))
@@ -0,0 +1,175 @@
+"""
+Packed sprite atlas: every source image a board uses, decoded once into
+one sheet.
+
+A render otherwise opens, inflates and converts dozens of small PNGs (local
+images, bundled and downloaded PokeAPI sprites). The atlas build step
+shelf-packs all of them, converted to RGBA, into .build_cache/atlas/
+sprites.png with a JSON index of their rects keyed by content hash. The
+derived asset store then reads sizes from the index and pixels as
+sub-regions of the sheet, which is loaded at most once per build.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image
+
+from .build_cache import CACHE_DIR, hash_file, hash_values
+
+# Bump when the sheet or index format changes to invalidate stored atlases
+ATLAS_VERSION = 1
+SHEET_WIDTH = 2048
+
+Rect = Tuple[int, int, int, int]  # x, y, width, height
+
+
+def pack_shelves(
+    sizes: Dict[str, Tuple[int, int]], width: int = SHEET_WIDTH
+) -> Tuple[Dict[str, Rect], int, int]:
+    """
+    Shelf-pack rectangles, tallest first: each row ("shelf") is filled left
+    to right and is as tall as its first rectangle.
+
+    Args:
+        sizes: {key: (width, height)}
+        width: Sheet width; rectangles wider than it widen the sheet
+
+    Returns:
+        ({key: (x, y, width, height)}, sheet width, sheet height)
+    """
+    width = max([width] + [w for w, _ in sizes.values()])
+    rects: Dict[str, Rect] = {}
+    x = y = shelf_height = 0
+    for key, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if x + w > width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        rects[key] = (x, y, w, h)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return rects, width, y + shelf_height
+
+
+class SpriteAtlas:
+    def __init__(
+        self, sheet_path: Path, rects: Dict[str, Rect], sheet: Optional[Image.Image] = None
+    ):
+        """
+        Initialize an atlas over a stored sheet.
+
+        Args:
+            sheet_path: RGBA PNG holding the packed sprites
+            rects: {content hash: (x, y, width, height)} of each sprite
+            sheet: The sheet already in memory, e.g. just packed (default:
+                loaded from sheet_path on first use)
+        """
+        self.sheet_path = sheet_path
+        self.rects = rects
+        self._sheet = sheet
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.rects)
+
+    def rect(self, source_path) -> Optional[Rect]:
+        """Rect of a source image in the sheet, None if it isn't packed."""
+        return self.rects.get(hash_file(source_path))
+
+    def _loaded_sheet(self) -> Image.Image:
+        with self._lock:
+            if self._sheet is None:
+                with Image.open(self.sheet_path) as sheet:
+                    self._sheet = sheet.convert("RGBA")
+            return self._sheet
+
+    def sprite(self, source_path) -> Optional[Image.Image]:
+        """
+        A source image as RGBA, cut from the sheet.
+
+        Returns:
+            RGBA PIL Image, or None if the image isn't packed
+        """
+        rect = self.rect(source_path)
+        if rect is None:
+            return None
+        x, y, w, h = rect
+        return self._loaded_sheet().crop((x, y, x + w, y + h))
+
+
+def build_sprite_atlas(
+    source_paths: Iterable, atlas_dir=CACHE_DIR / "atlas"
+) -> Optional[SpriteAtlas]:
+    """
+    Asset build step: pack every source image into the atlas, reusing the
+    stored atlas when it already holds exactly these images.
+
+    Args:
+        source_paths: Source images the board uses; duplicates and missing
+            files are skipped
+        atlas_dir: Directory for sprites.png and sprites.json
+
+    Returns:
+        SpriteAtlas, or None if there are no images
+    """
+    sources: Dict[str, str] = {}
+    for path in source_paths:
+        key = hash_file(path)
+        if key not in ("none", "missing"):
+            sources.setdefault(key, str(path))
+    if not sources:
+        return None
+
+    atlas_dir = Path(atlas_dir)
+    sheet_path = atlas_dir / "sprites.png"
+    index_path = atlas_dir / "sprites.json"
+    signature = hash_values(sorted(sources), ATLAS_VERSION)
+
+    if index_path.exists() and sheet_path.exists():
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+            if index.get("signature") == signature:
+                return SpriteAtlas(sheet_path, {k: tuple(r) for k, r in index["rects"].items()})
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: Rebuilding unreadable sprite atlas {index_path}: {e}")
+
+    images: Dict[str, Image.Image] = {}
+    for key, path in sources.items():
+        try:
+            with Image.open(path) as img:
+                images[key] = img.convert("RGBA")
+        except OSError as e:
+            print(f"Warning: Leaving {path} out of the sprite atlas: {e}")
+
+    rects, width, height = pack_shelves({key: img.size for key, img in images.items()})
+    sheet = Image.new("RGBA", (width, max(1, height)), (0, 0, 0, 0))
+    for key, (x, y, _, _) in rects.items():
+        sheet.paste(images[key], (x, y))
+
+    atlas_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = sheet_path.with_suffix(f".{threading.get_ident()}.tmp")
+    sheet.save(tmp_path, format="PNG", compress_level=1)
+    os.replace(tmp_path, sheet_path)
+    # The index goes last, so it never describes a sheet that wasn't written
+    tmp_path = index_path.with_suffix(f".{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps({"signature": signature, "rects": rects}))
+    os.replace(tmp_path, index_path)
+
+    return SpriteAtlas(sheet_path, rects, sheet)
+
+
+def tile_source_images(tiles) -> List[str]:
+    """
+    Paths of the images the tiles use that are available locally. Nothing is
+    fetched; PokeAPI images still downloading join the atlas next build.
+    """
+    paths = []
+    for tile in tiles:
+        for handle in tile.asset_handles():
+            path = handle.local_path()
+            if path:
+                paths.append(path)
+    return paths
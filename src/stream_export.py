@@ -0,0 +1,266 @@
+"""
+Strip-wise PNG and PDF writers for boards too large to hold as one image.
+
+The writers take the image as an iterable of uint8[rows, width, 3] strips
+and compress them incrementally, so only one strip is held at a time no
+matter how large the board is. A PNG's compressed data can also be copied
+into a PDF unchanged, so a board is deflated once for both outputs.
+"""
+
+import struct
+import zlib
+from typing import Iterable, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Only the strip writers need NumPy, not PNG passthrough
+    np = None
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_FILTER_SUB = 1
+
+
+def _png_chunk(f, kind: bytes, data: bytes):
+    f.write(struct.pack(">I", len(data)))
+    f.write(kind)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)) & 0xFFFFFFFF))
+
+
+def filter_rows(strip: "np.ndarray") -> bytes:
+    """
+    Apply the PNG "Sub" filter to a strip of RGB rows: each byte minus the
+    same channel of the pixel to its left, which compresses flat tile areas
+    far better than unfiltered rows.
+
+    Returns:
+        Filtered scanlines, each prefixed with its filter type byte
+    """
+    rows, width, channels = strip.shape
+    flat = strip.reshape(rows, width * channels)
+    out = np.empty((rows, width * channels + 1), dtype=np.uint8)
+    out[:, 0] = PNG_FILTER_SUB
+    out[:, 1:1 + channels] = flat[:, :channels]
+    # uint8 arithmetic wraps modulo 256, as the filter requires
+    np.subtract(flat[:, channels:], flat[:, :-channels], out=out[:, 1 + channels:])
+    return out.tobytes()
+
+
+def png_predictor(width: int) -> str:
+    """FlateDecode parameters for PNG-filtered 8-bit RGB rows."""
+    return f"<< /Predictor 15 /Colors 3 /BitsPerComponent 8 /Columns {width} >>"
+
+
+def write_png_strips(
+    output_path: str,
+    width: int,
+    height: int,
+    strips: Iterable["np.ndarray"],
+    dpi: Optional[int] = None,
+    compress_level: int = 6,
+):
+    """
+    Write an RGB PNG from row strips, one IDAT chunk per compressed strip.
+
+    Args:
+        output_path: Path to save the PNG
+        width: Image width in pixels
+        height: Image height in pixels (the strips must add up to it)
+        strips: uint8[rows, width, 3] arrays, top to bottom
+        dpi: DPI metadata tag (pHYs chunk)
+        compress_level: zlib level, 0-9
+    """
+    with open(output_path, "wb") as f:
+        f.write(PNG_SIGNATURE)
+        # 8 bits per channel, truecolor, deflate, adaptive filtering, no interlace
+        _png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        if dpi:
+            # Pixels per meter, rounded like PIL does
+            ppm = int(dpi / 0.0254 + 0.5)
+            _png_chunk(f, b"pHYs", struct.pack(">IIB", ppm, ppm, 1))
+
+        compressor = zlib.compressobj(compress_level)
+        for strip in strips:
+            data = compressor.compress(filter_rows(strip))
+            if data:
+                _png_chunk(f, b"IDAT", data)
+        _png_chunk(f, b"IDAT", compressor.flush())
+        _png_chunk(f, b"IEND", b"")
+
+
+def iter_png_chunks(png_path: str) -> Iterator[Tuple[bytes, bytes]]:
+    """Yield the (type, data) chunks of a PNG file in order."""
+    with open(png_path, "rb") as f:
+        if f.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+            raise ValueError(f"{png_path} is not a PNG file")
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{png_path} is truncated")
+            length, kind = struct.unpack(">I4s", header)
+            data = f.read(length)
+            f.read(4)  # CRC
+            yield kind, data
+            if kind == b"IEND":
+                return
+
+
+def png_embed_size(png_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Check whether a PNG's compressed data can be embedded in a PDF as is:
+    8-bit RGB without interlacing, which PDF's PNG predictors decode directly.
+
+    Returns:
+        (width, height) if embeddable, else None
+    """
+    kind, data = next(iter_png_chunks(png_path))
+    if kind != b"IHDR":
+        return None
+    width, height, depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", data)
+    if depth != 8 or color_type != 2 or interlace != 0:
+        return None
+    return width, height
+
+
+def write_pdf_image(
+    output_path: str,
+    width: int,
+    height: int,
+    data: Iterable[bytes],
+    page_size: Tuple[float, float],
+    margin: float = 0.95,
+    decode_parms: Optional[str] = None,
+):
+    """
+    Write a single-page PDF showing an RGB image centered on the page.
+
+    Args:
+        output_path: Path to save the PDF
+        width: Image width in pixels
+        height: Image height in pixels
+        data: The image stream, already Flate compressed, in pieces
+        page_size: Page (width, height) in points
+        margin: Fraction of the page the image may fill (1.0 = edge to edge)
+        decode_parms: FlateDecode parameters dictionary, e.g. a PNG predictor
+    """
+    page_width, page_height = page_size
+    scale = min(page_width / width, page_height / height) * margin
+    scaled_width = width * scale
+    scaled_height = height * scale
+    x_offset = (page_width - scaled_width) / 2
+    y_offset = (page_height - scaled_height) / 2
+    content = (
+        f"q {scaled_width:.4f} 0 0 {scaled_height:.4f} {x_offset:.4f} {y_offset:.4f} cm "
+        f"/Im0 Do Q"
+    ).encode("ascii")
+    parms = f" /DecodeParms {decode_parms}" if decode_parms else ""
+
+    offsets = []
+    with open(output_path, "wb") as f:
+
+        def begin_object():
+            offsets.append(f.tell())
+            f.write(f"{len(offsets)} 0 obj\n".encode("ascii"))
+
+        def write_object(body: str):
+            begin_object()
+            f.write(body.encode("ascii") + b"\nendobj\n")
+
+        f.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        write_object("<< /Type /Catalog /Pages 2 0 R >>")
+        write_object("<< /Type /Pages /Kids [3 0 R] /Count 1 >>")
+        write_object(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width:.4f} {page_height:.4f}] "
+            f"/Resources << /XObject << /Im0 5 0 R >> >> /Contents 4 0 R >>"
+        )
+        begin_object()
+        f.write(f"<< /Length {len(content)} >>\nstream\n".encode("ascii"))
+        f.write(content + b"\nendstream\nendobj\n")
+
+        # The image length isn't known until the last piece is written,
+        # so it goes in a separate object written afterwards
+        begin_object()
+        f.write(
+            f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /FlateDecode{parms} "
+            f"/Length 6 0 R >>\nstream\n".encode("ascii")
+        )
+        length = 0
+        for piece in data:
+            f.write(piece)
+            length += len(piece)
+        f.write(b"\nendstream\nendobj\n")
+        write_object(str(length))
+
+        xref_offset = f.tell()
+        f.write(f"xref\n0 {len(offsets) + 1}\n0000000000 65535 f \n".encode("ascii"))
+        for offset in offsets:
+            f.write(f"{offset:010d} 00000 n \n".encode("ascii"))
+        f.write(
+            f"trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\n"
+            f"startxref\n{xref_offset}\n%%EOF\n".encode("ascii")
+        )
+
+
+def write_pdf_strips(
+    output_path: str,
+    width: int,
+    height: int,
+    strips: Iterable["np.ndarray"],
+    page_size: Tuple[float, float],
+    margin: float = 0.95,
+    compress_level: int = 6,
+):
+    """
+    Write a single-page PDF of an RGB image, deflating it strip by strip.
+    Rows are PNG "Sub" filtered like write_png_strips, declared to the PDF
+    reader as a PNG predictor.
+
+    Args:
+        output_path: Path to save the PDF
+        width: Image width in pixels
+        height: Image height in pixels
+        strips: uint8[rows, width, 3] arrays, top to bottom
+        page_size: Page (width, height) in points
+        margin: Fraction of the page the image may fill (1.0 = edge to edge)
+        compress_level: zlib level, 0-9
+    """
+
+    def compressed():
+        compressor = zlib.compressobj(compress_level)
+        for strip in strips:
+            yield compressor.compress(filter_rows(strip))
+        yield compressor.flush()
+
+    write_pdf_image(
+        output_path, width, height, compressed(), page_size, margin, png_predictor(width)
+    )
+
+
+def write_pdf_from_png(
+    output_path: str,
+    png_path: str,
+    page_size: Tuple[float, float],
+    margin: float = 0.95,
+):
+    """
+    Write a single-page PDF embedding a PNG's compressed image data as is.
+
+    The concatenated IDAT chunks of a PNG are a zlib stream of filtered
+    scanlines, exactly what FlateDecode with a PNG predictor reads, so the
+    image is neither decompressed nor re-deflated. Check the PNG with
+    png_embed_size first.
+
+    Args:
+        output_path: Path to save the PDF
+        png_path: 8-bit RGB, non-interlaced PNG
+        page_size: Page (width, height) in points
+        margin: Fraction of the page the image may fill (1.0 = edge to edge)
+    """
+    size = png_embed_size(png_path)
+    if size is None:
+        raise ValueError(f"{png_path} can't be embedded without re-encoding")
+    width, height = size
+    idat = (data for kind, data in iter_png_chunks(png_path) if kind == b"IDAT")
+    write_pdf_image(output_path, width, height, idat, page_size, margin, png_predictor(width))
+
@@ -1,8 +1,40 @@
 import re
 from PIL import Image, ImageDraw, ImageFont
-from typing import Optional, Tuple, List
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+from .asset_handle import AssetHandle
+from .build_cache import hash_file, hash_values
+from .derived_assets import DERIVED
+from .display_list import Border, DisplayList, Picture, Text, render_raster
+from .glyphs import ATLAS
+from .engine import mm_to_pixels
+
+# Layout in relative units: fractions of the tile's shorter side (or width,
+# for PADDING), tuned on 600px tiles. YAML values (margins, font_size,
+# border_width) are pixels of the tile's own size.
+HEADER_FONT = 1 / 8
+TEXT_FONT = 1 / 14
+FOOTER_FONT = 1 / 10
+HEADER_TOP = 20 / 600
+HEADER_GAP = 10 / 600
+IMAGE_RAISE = 10 / 600
+FOOTER_BOTTOM = 60 / 600
+PADDING = 1 / 30
+MIN_PADDING = 10 / 600
+LINE_SPACING = 1.2
+# Smallest size `font_size: auto` may shrink text to
+MIN_TEXT_FONT = 1 / 30
+
+# font_size value that fits the text to its box, see Tile._fit_text_font
+AUTO_FONT_SIZE = "auto"
+
+# Wrapped lines by (text, font, width), shared by fitting and layout
+_wrapped_text: Dict[tuple, list] = {}
+
+# Display lists by tile state, see Tile.display_list
+_display_lists: Dict[str, DisplayList] = {}
+
 
 class Tile:
     def __init__(
@@ -19,18 +51,22 @@ class Tile:
         text_color: Tuple[int, int, int] = (0, 0, 0),
         border_color: Tuple[int, int, int] = (0, 0, 0),
         border_width: int = 0,
-        font_size: Optional[int] = None,
+        font_size: Optional[int | str] = None,
         footer: Optional[str] = None,
         background_image: Optional[str] = None,
         text_margin_top: int = 0,
         text_align: str = "center",
+        poke_api_image: Optional[str] = None,
+        image_filter: str = "auto",
     ):
         self.width = width
         self.height = height
         self.header = header
         self.text = text
-        self.image_path = image_path
+        # Images are resolved on first use; PokeAPI images may need a fetch
+        self._image = AssetHandle(image_path, poke_api_image)
         self.image_scale = image_scale
+        self.image_filter = image_filter
         self.image_margin_top = image_margin_top
         self.image_anchor_bottom = image_anchor_bottom
         self.background_color = background_color
@@ -39,10 +75,38 @@ class Tile:
         self.border_width = border_width
         self.font_size = font_size
         self.footer = footer
-        self.background_image = background_image
+        self._background = AssetHandle(background_image)
         self.text_align = text_align
         self.text_margin_top = text_margin_top
 
+    @property
+    def image_path(self) -> Optional[str]:
+        """Local path of the tile image, fetched from PokeAPI on first access if needed."""
+        return self._image.resolve()
+
+    @image_path.setter
+    def image_path(self, path: Optional[str]):
+        self._image = AssetHandle(path)
+
+    @property
+    def background_image(self) -> Optional[str]:
+        return self._background.resolve()
+
+    @background_image.setter
+    def background_image(self, path: Optional[str]):
+        self._background = AssetHandle(path)
+
+    def local_image_paths(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Paths of the tile image and background that are available without the
+        network (see AssetHandle.local_path). Never fetches.
+        """
+        return self._image.local_path(), self._background.local_path()
+
+    def asset_handles(self) -> List[AssetHandle]:
+        """Handles of the images this tile uses, for prefetching."""
+        return [handle for handle in (self._image, self._background) if handle]
+
     def _get_font(self, size: int, font_type: str = "text") -> ImageFont.ImageFont:
         """
         Get font based on type: header uses gbboot.ttf, text uses pokemon_classic.ttf.
@@ -62,7 +126,7 @@ class Tile:
             font_path = fonts_dir / "gbboot.ttf"
             if font_path.exists():
                 try:
-                    return ImageFont.truetype(str(font_path), size)
+                    return ATLAS.load_font(str(font_path), size)
                 except Exception as e:
                     print(f"Warning: Could not load gbboot.ttf font: {e}")
         else:
@@ -70,13 +134,13 @@ class Tile:
             font_path = fonts_dir / "gil.TTF"
             if font_path.exists():
                 try:
-                    return ImageFont.truetype(str(font_path), size)
+                    return ATLAS.load_font(str(font_path), size)
                 except Exception as e:
                     print(f"Warning: Could not load gil.ttf font: {e}")
 
         # Fallback to system font
         try:
-            return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
+            return ATLAS.load_font("/System/Library/Fonts/Helvetica.ttc", size)
         except Exception:
             # Final fallback to default font
             return ImageFont.load_default()
@@ -113,186 +177,267 @@ class Tile:
         segments.append((" ".join(current_words), current_bold))
         return segments
 
-    def render(self) -> Image.Image:
-        img = Image.new("RGB", (self.width, self.height), self.background_color)
+    def render_size(self, scale: float = 1.0) -> Tuple[int, int]:
+        """Pixel (width, height) of the tile rendered at `scale`."""
+        return max(1, round(self.width * scale)), max(1, round(self.height * scale))
 
-        if self.background_image:
-            try:
-                bg_img = Image.open(self.background_image).convert("RGBA")
-                bg_img = bg_img.resize(
-                    (self.width, self.height), Image.Resampling.LANCZOS
-                )
-                img.paste(bg_img, (0, 0), bg_img)
-            except Exception as e:
-                print(
-                    f"Warning: Could not load background image {self.background_image}: {e}"
-                )
+    def scale_for(self, width_mm: float, dpi: int) -> float:
+        """
+        Render scale at which the tile is `width_mm` wide at `dpi`, for
+        rendering straight at a print resolution.
+
+        Args:
+            width_mm: Physical tile width in millimeters
+            dpi: Target dots per inch
 
-        draw = ImageDraw.Draw(img)
+        Returns:
+            Scale to pass to render
+        """
+        return mm_to_pixels(width_mm, dpi) / self.width
 
-        # Draw border on right and bottom only (avoids double borders between adjacent tiles)
-        if self.border_width > 0:
-            for i in range(self.border_width):
-                draw.line(
-                    [(self.width - 1 - i, 0), (self.width - 1 - i, self.height - 1)],
-                    fill=self.border_color,
-                )
-                draw.line(
-                    [(0, self.height - 1 - i), (self.width - 1, self.height - 1 - i)],
-                    fill=self.border_color,
+    def _text_font_size(self) -> int:
+        if self.font_size and self.font_size != AUTO_FONT_SIZE:
+            return max(1, self.font_size)
+        return int(min(self.width, self.height) * TEXT_FONT)
+
+    def _text_area_width(self) -> int:
+        return self.width - (self._text_padding() * 2) - (self._border_px() * 2)
+
+    @staticmethod
+    def _line_height(font) -> int:
+        top, bottom = font.getbbox("Ag")[1::2]
+        return int((bottom - top) * LINE_SPACING)
+
+    def _text_padding(self) -> int:
+        side = min(self.width, self.height)
+        return max(int(round(side * MIN_PADDING)), int(self.width * PADDING))
+
+    def _border_px(self) -> int:
+        return max(0, self.border_width)
+
+    def _wrap_text(self, font) -> List[Optional[List[Tuple[str, bool]]]]:
+        """
+        Greedily break the text into lines of (word, is_bold), None marking
+        blank lines. Memoized by text, font and width.
+        """
+        available_width = self._text_area_width()
+        key = (self.text, getattr(font, "path", None), getattr(font, "size", None), available_width)
+        if key in _wrapped_text:
+            return _wrapped_text[key]
+
+        styled_lines = []
+        for paragraph in self.text.split("\n"):
+            stripped = paragraph.strip()
+            if not stripped or stripped == "\\n":
+                styled_lines.append(None)
+                continue
+
+            styled_words = self._parse_styled_words(paragraph)
+            current_line = []
+
+            for word, is_bold in styled_words:
+                test_text = " ".join(
+                    w for w, _ in current_line + [(word, is_bold)]
                 )
+                test_width = ATLAS.text_width(font, test_text)
+
+                if test_width <= available_width:
+                    current_line.append((word, is_bold))
+                else:
+                    if current_line:
+                        styled_lines.append(current_line)
+                    current_line = [(word, is_bold)]
+
+            if current_line:
+                styled_lines.append(current_line)
+        _wrapped_text[key] = styled_lines
+        return styled_lines
+
+    def _fit_text_font(self, available_height: int):
+        """
+        Binary search for the largest text font, from MIN_TEXT_FONT up to the
+        default size, whose wrapped text fits `available_height` with no word
+        wider than a line. Fonts, text widths and wrapping are all memoized,
+        so each step only measures what it hasn't seen.
+
+        Returns:
+            PIL font, the smallest size if nothing fits
+        """
+        available_width = self._text_area_width()
+
+        def fits(size):
+            font = self._get_font(size, font_type="text")
+            lines = self._wrap_text(font)
+            if len(lines) * self._line_height(font) > available_height:
+                return False
+            return all(
+                ATLAS.text_width(font, " ".join(w for w, _ in line)) <= available_width
+                for line in lines
+                if line
+            )
+
+        side = min(self.width, self.height)
+        low, high = max(1, int(side * MIN_TEXT_FONT)), self._text_font_size()
+        best = low
+        while low <= high:
+            size = (low + high) // 2
+            if fits(size):
+                best, low = size, size + 1
+            else:
+                high = size - 1
+        return self._get_font(best, font_type="text")
+
+    def image_target_size(self, source_size: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Size the tile image is scaled to: `image_scale` of the inner tile width,
+        keeping the source aspect ratio.
+
+        Args:
+            source_size: (width, height) of the source image
+
+        Returns:
+            Target (width, height) in pixels
+        """
+        base_width = self.width - (self._border_px() * 2)
+        target_width = int(base_width * self.image_scale)
+        aspect_ratio = source_size[1] / source_size[0]
+        return target_width, int(target_width * aspect_ratio)
+
+    def _layout_key(self) -> str:
+        return hash_values(
+            sorted(vars(self).items()),
+            hash_file(self.image_path),
+            hash_file(self.background_image),
+        )
+
+    def display_list(self) -> DisplayList:
+        """
+        Lay out the tile: header metrics, text wrapping and image placement,
+        in the tile's own pixels. Computed once per tile state and shared by
+        every resolution, rotation and output format (see display_list.py).
+
+        Returns:
+            DisplayList of the tile
+        """
+        key = self._layout_key()
+        if key not in _display_lists:
+            _display_lists[key] = self._layout()
+        return _display_lists[key]
+
+    def _layout(self) -> DisplayList:
+        width, height = self.width, self.height
+        border_width = self._border_px()
+        side = min(width, height)
+
+        def unit(fraction):
+            return int(round(side * fraction))
+
+        def text_op(x, y, runs, font, role="text"):
+            # PIL's built-in fallback font has no file to embed in vector output
+            path = getattr(font, "path", None)
+            return Text(
+                x, y, tuple(runs), path if isinstance(path, str) else None,
+                getattr(font, "size", 10), font.getmetrics()[0], self.text_color, role,
+            )
+
+        ops = []
+        measure = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+        if self.background_image:
+            ops.append(Picture(self.background_image, 0, 0, width, height, role="background"))
+
+        # Border on right and bottom only (avoids double borders between adjacent tiles)
+        if border_width > 0:
+            ops.append(Border(border_width, self.border_color))
 
         # Calculate header dimensions (needed for image positioning)
         header_height = 0
-        header_font = None
-        header_x = 0
-        header_y = 0
+        header_op = None
         if self.header:
             try:
-                header_font_size = min(self.width, self.height) // 8
-                header_font = self._get_font(header_font_size, font_type="header")
-                header_bbox = draw.textbbox((0, 0), self.header, font=header_font)
+                header_font = self._get_font(int(side * HEADER_FONT), font_type="header")
+                header_bbox = measure.textbbox((0, 0), self.header, font=header_font)
                 header_height = header_bbox[3] - header_bbox[1]
-                header_y = self.border_width + 20
+                header_y = border_width + unit(HEADER_TOP)
                 header_width = header_bbox[2] - header_bbox[0]
-                header_x = (self.width - header_width) // 2
-                header_height += 10
+                header_x = (width - header_width) // 2
+                header_height += unit(HEADER_GAP)
+                header_op = text_op(header_x, header_y, [(self.header, False)], header_font, "header")
             except Exception as e:
                 print(f"Warning: Could not calculate header: {e}")
 
-        # Load and paste image (drawn before header/text so it's always behind)
+        # Image goes before header/text so it's always behind
         if self.image_path:
             try:
-                tile_image = Image.open(self.image_path)
-
-                # Convert to RGBA if image has transparency (handles P mode with transparency)
-                if tile_image.mode in ("P", "LA"):
-                    # Convert palette/grayscale with alpha to RGBA
-                    tile_image = tile_image.convert("RGBA")
-                elif tile_image.mode != "RGBA":
-                    # Convert RGB to RGBA (add full opacity alpha channel)
-                    tile_image = tile_image.convert("RGBA")
-
-                # Resize image using scale parameter
-                base_width = self.width - (self.border_width * 2)
-                target_width = int(base_width * self.image_scale)
-
-                # Calculate height to maintain aspect ratio
-                aspect_ratio = tile_image.height / tile_image.width
-                target_height = int(target_width * aspect_ratio)
-
-                # Resize image
-                tile_image = tile_image.resize(
-                    (target_width, target_height), Image.Resampling.LANCZOS
+                target_width, target_height = self.image_target_size(
+                    DERIVED.source_size(self.image_path)
                 )
 
                 # Center horizontally, position vertically
-                x_offset = (self.width - tile_image.width) // 2
+                x_offset = (width - target_width) // 2
 
                 if self.image_anchor_bottom:
-                    y_offset = self.height - tile_image.height
+                    y_offset = height - target_height
                 elif self.image_margin_top is not None:
                     y_offset = self.image_margin_top
                 elif self.header:
-                    y_offset = self.border_width + header_height - 10
+                    y_offset = border_width + header_height - unit(IMAGE_RAISE)
                 else:
-                    y_offset = self.border_width - 10
-
-                # Convert to integer (allow negative values for positioning above border)
-                y_offset = int(y_offset)
+                    y_offset = border_width - unit(IMAGE_RAISE)
 
-                # Paste with alpha channel support (transparency preserved)
-                if tile_image.mode == "RGBA":
-                    img.paste(tile_image, (x_offset, y_offset), tile_image)
-                else:
-                    img.paste(tile_image, (x_offset, y_offset))
+                # Negative values position the image above the border
+                ops.append(
+                    Picture(
+                        self.image_path, x_offset, int(y_offset),
+                        target_width, target_height, self.image_filter,
+                    )
+                )
             except Exception as e:
                 print(f"Warning: Could not load image {self.image_path}: {e}")
                 import traceback
 
                 traceback.print_exc()
 
-        # Draw header on top of image
-        if self.header and header_font:
-            draw.text(
-                (header_x, header_y),
-                self.header,
-                fill=self.text_color,
-                font=header_font,
-            )
+        # Header on top of image
+        if header_op:
+            ops.append(header_op)
 
-        # Draw text if provided
         if self.text:
             try:
-                font_size = (
-                    self.font_size
-                    if self.font_size
-                    else min(self.width, self.height) // 14
-                )
-                font = self._get_font(font_size, font_type="text")
-
                 # Calculate available space for text
-                padding = max(10, self.width // 30)
-                available_width = self.width - (padding * 2) - (self.border_width * 2)
+                padding = self._text_padding()
 
                 # Account for header space
                 header_space = header_height if self.header else 0
 
                 if self.image_path and self.image_anchor_bottom:
-                    image_area_height = self.height // 2
+                    image_area_height = height // 2
                     available_height = image_area_height
                     text_y_start = header_space
                 elif self.image_path:
-                    image_area_height = self.height // 2
+                    image_area_height = height // 2
                     available_height = (
-                        self.height
+                        height
                         - image_area_height
                         - padding
-                        - self.border_width
+                        - border_width
                         - header_space
                     )
                     text_y_start = image_area_height + padding
                 else:
                     # Text can use remaining height after header
                     available_height = (
-                        self.height - (padding * 2) - self.border_width - header_space
+                        height - (padding * 2) - border_width - header_space
                     )
-                    text_y_start = padding + self.border_width + header_space
-
-                paragraphs = self.text.split("\n")
-                styled_lines = []
-
-                for paragraph in paragraphs:
-                    stripped = paragraph.strip()
-                    if not stripped or stripped == "\\n":
-                        styled_lines.append(None)
-                        continue
+                    text_y_start = padding + border_width + header_space
 
-                    styled_words = self._parse_styled_words(paragraph)
-                    current_line = []
-
-                    for word, is_bold in styled_words:
-                        test_text = " ".join(
-                            w for w, _ in current_line + [(word, is_bold)]
-                        )
-                        bbox = draw.textbbox((0, 0), test_text, font=font)
-                        test_width = bbox[2] - bbox[0]
-
-                        if test_width <= available_width:
-                            current_line.append((word, is_bold))
-                        else:
-                            if current_line:
-                                styled_lines.append(current_line)
-                            current_line = [(word, is_bold)]
-
-                    if current_line:
-                        styled_lines.append(current_line)
+                if self.font_size == AUTO_FONT_SIZE:
+                    font = self._fit_text_font(available_height)
+                else:
+                    font = self._get_font(self._text_font_size(), font_type="text")
 
-                base_line_height = (
-                    draw.textbbox((0, 0), "Ag", font=font)[3]
-                    - draw.textbbox((0, 0), "Ag", font=font)[1]
-                )
-                line_height = int(base_line_height * 1.2)
+                styled_lines = self._wrap_text(font)
+                line_height = self._line_height(font)
                 total_text_height = len(styled_lines) * line_height
 
                 if self.image_path:
@@ -302,64 +447,56 @@ class Tile:
                         + self.text_margin_top
                     )
                 else:
-                    y = (self.height - total_text_height) // 2 + self.text_margin_top
+                    y = (height - total_text_height) // 2 + self.text_margin_top
 
                 for styled_line in styled_lines:
                     if styled_line is None:
                         y += line_height // 2
                         continue
                     line_text = " ".join(w for w, _ in styled_line)
-                    bbox = draw.textbbox((0, 0), line_text, font=font)
-                    total_width = bbox[2] - bbox[0]
-                    padding = max(10, self.width // 30)
+                    total_width = ATLAS.text_width(font, line_text)
                     if self.text_align == "left":
-                        start_x = padding + self.border_width
+                        start_x = padding + border_width
                     else:
-                        start_x = (self.width - total_width) // 2
+                        start_x = (width - total_width) // 2
 
+                    # Bold and regular segments form one line so kerning carries across
                     segments = self._group_line_segments(styled_line)
-                    char_pos = 0
-                    for seg_idx, (seg_text, is_bold) in enumerate(segments):
-                        prefix = line_text[:char_pos]
-                        if prefix:
-                            prefix_w = (
-                                draw.textbbox((0, 0), prefix, font=font)[2]
-                                - draw.textbbox((0, 0), prefix, font=font)[0]
-                            )
-                        else:
-                            prefix_w = 0
-
-                        seg_x = start_x + prefix_w
-                        draw.text((seg_x, y), seg_text, fill=self.text_color, font=font)
-                        if is_bold:
-                            draw.text((seg_x + 1, y), seg_text, fill=self.text_color, font=font)
-                            draw.text((seg_x + 2, y), seg_text, fill=self.text_color, font=font)
-
-                        char_pos += len(seg_text)
-                        if seg_idx < len(segments) - 1:
-                            char_pos += 1
+                    runs = [
+                        (seg_text + (" " if seg_idx < len(segments) - 1 else ""), is_bold)
+                        for seg_idx, (seg_text, is_bold) in enumerate(segments)
+                    ]
+                    ops.append(text_op(start_x, y, runs, font))
 
                     y += line_height
 
             except Exception as e:
-                print(f"Warning: Could not render text: {e}")
+                print(f"Warning: Could not lay out text: {e}")
 
         if self.footer:
             try:
-                footer_font_size = min(self.width, self.height) // 10
-                footer_font = self._get_font(footer_font_size, font_type="header")
-                footer_bbox = draw.textbbox((0, 0), self.footer, font=footer_font)
+                footer_font = self._get_font(int(side * FOOTER_FONT), font_type="header")
+                footer_bbox = measure.textbbox((0, 0), self.footer, font=footer_font)
                 footer_width = footer_bbox[2] - footer_bbox[0]
                 footer_height = footer_bbox[3] - footer_bbox[1]
-                footer_x = (self.width - footer_width) // 2
-                footer_y = self.height - footer_height - self.border_width - 60
-                draw.text(
-                    (footer_x, footer_y),
-                    self.footer,
-                    fill=self.text_color,
-                    font=footer_font,
-                )
+                footer_x = (width - footer_width) // 2
+                footer_y = height - footer_height - border_width - unit(FOOTER_BOTTOM)
+                ops.append(text_op(footer_x, footer_y, [(self.footer, False)], footer_font, "footer"))
             except Exception as e:
-                print(f"Warning: Could not render footer: {e}")
+                print(f"Warning: Could not lay out footer: {e}")
+
+        return DisplayList(width, height, self.background_color, tuple(ops))
+
+    def render(self, scale: float = 1.0) -> Image.Image:
+        """
+        Render the tile by rasterizing its display list.
+
+        Args:
+            scale: Fraction of the tile's own pixel size to render at (e.g.
+                0.25 for previews, 2.0 for 600 DPI; see scale_for). The
+                layout is the same at every scale.
 
-        return img
+        Returns:
+            RGB PIL Image of size render_size(scale)
+        """
+        return render_raster(self.display_list(), scale)
@@ -1,10 +1,20 @@
 """
 File watcher that rebuilds the board whenever source files change.
 Usage: python watch.py [--tileRotation]
+
+Change events are coalesced into a set of changed paths and handed to a
+single build worker. If files change while a build is running, the running
+build is cancelled and a fresh one starts once the burst of saves settles,
+so the output always reflects the latest state on disk.
+
+Builds use the fast "draft" output profile unless --profile is given. Each
+build runs `main.py --check` first, so layout problems show up before the
+full render finishes.
 """
 
 import sys
 import time
+import threading
 import subprocess
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -15,12 +25,156 @@ WATCHED_DIRS = [
 ]
 
 DEBOUNCE_SECONDS = 0.5
+BUILD_TIMEOUT_SECONDS = 60
+DEFAULT_PROFILE = "draft"
 
 
-class RebuildHandler(FileSystemEventHandler):
-    def __init__(self, extra_args):
+class BuildScheduler:
+    """
+    Runs `main.py` builds on a background worker.
+
+    Changed paths are collected until no new change has arrived for
+    `settle_seconds`, then built in one go. A change that arrives while a
+    build is running supersedes it: the build subprocess is terminated and
+    its paths are merged back into the pending set for the next build.
+    """
+
+    def __init__(self, extra_args, settle_seconds: float = DEBOUNCE_SECONDS):
         self.extra_args = extra_args
-        self.last_trigger = 0
+        self.settle_seconds = settle_seconds
+        self._cond = threading.Condition()
+        self._pending: set[str] = set()
+        self._build_requested = False
+        self._last_change = 0.0
+        self._process = None
+        self._cancelled = False
+        self._stopped = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._worker.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cancel_running()
+            self._cond.notify_all()
+        self._worker.join()
+
+    def request_build(self, path=None):
+        """Queue a build, optionally recording the path that triggered it."""
+        with self._cond:
+            if path is not None:
+                self._pending.add(path)
+            self._build_requested = True
+            self._last_change = time.monotonic()
+            self._cancel_running()
+            self._cond.notify_all()
+
+    def _cancel_running(self):
+        """Terminate the in-flight build, if any. Caller holds the lock."""
+        if self._process is not None and self._process.poll() is None:
+            self._cancelled = True
+            self._process.terminate()
+
+    def _wait_for_changes(self):
+        """Block until a build is requested and changes have settled."""
+        with self._cond:
+            while not self._stopped:
+                if self._build_requested:
+                    remaining = self._last_change + self.settle_seconds - time.monotonic()
+                    if remaining <= 0:
+                        changed = self._pending
+                        self._pending = set()
+                        self._build_requested = False
+                        return changed
+                    self._cond.wait(remaining)
+                else:
+                    self._cond.wait()
+            return None
+
+    def _run(self):
+        while True:
+            changed = self._wait_for_changes()
+            if changed is None:
+                return
+            if changed:
+                print(f"\n--- Change detected: {', '.join(sorted(changed))} ---")
+            if not self._build(changed):
+                with self._cond:
+                    self._pending |= changed
+                print("--- Build superseded by newer changes ---")
+
+    def _run_step(self, cmd):
+        """
+        Run one build subprocess.
+
+        Returns:
+            (returncode, stdout, stderr), None if it was cancelled by a newer
+            change, or (None, "", "") if it failed to run
+        """
+        with self._cond:
+            if self._stopped or self._build_requested:
+                return None
+            self._cancelled = False
+            try:
+                self._process = subprocess.Popen(
+                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                )
+            except Exception as e:
+                print(f"ERROR: {e}")
+                return None, "", ""
+
+        process = self._process
+        try:
+            stdout, stderr = process.communicate(timeout=BUILD_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            print(f"ERROR: Build timed out after {BUILD_TIMEOUT_SECONDS}s")
+            return None, "", ""
+        finally:
+            with self._cond:
+                self._process = None
+
+        if self._cancelled:
+            return None
+        return process.returncode, stdout, stderr
+
+    def _build(self, changed) -> bool:
+        """
+        Run one build: the quick layout check, then the full render. Layout
+        issues are reported but don't stop the render.
+
+        Returns False if it was cancelled by a newer change.
+        """
+        check = self._run_step([sys.executable, "main.py", "--check"] + self.extra_args)
+        if check is None:
+            return False
+        returncode, stdout, stderr = check
+        if returncode is not None and stdout:
+            print(stdout.rstrip())
+        if returncode not in (None, 0, 1) and stderr:
+            print(f"ERROR:\n{stderr}")
+
+        result = self._run_step([sys.executable, "main.py"] + self.extra_args)
+        if result is None:
+            return False
+        returncode, stdout, stderr = result
+        if returncode is None:
+            return True
+        if stdout:
+            print(stdout)
+        if returncode != 0 and stderr:
+            print(f"ERROR:\n{stderr}")
+        elif returncode == 0:
+            print("--- Rebuild complete ---")
+        return True
+
+
+class RebuildHandler(FileSystemEventHandler):
+    def __init__(self, scheduler: BuildScheduler):
+        self.scheduler = scheduler
 
     def _should_watch(self, path):
         return any(
@@ -31,42 +185,25 @@ class RebuildHandler(FileSystemEventHandler):
     def on_any_event(self, event):
         if event.is_directory:
             return
-        if not self._should_watch(event.src_path):
-            return
-
-        now = time.time()
-        if now - self.last_trigger < DEBOUNCE_SECONDS:
-            return
-        self.last_trigger = now
-
-        print(f"\n--- Change detected: {event.src_path} ---")
-        self._rebuild()
-
-    def _rebuild(self):
-        cmd = [sys.executable, "main.py"] + self.extra_args
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            if result.stdout:
-                print(result.stdout)
-            if result.returncode != 0 and result.stderr:
-                print(f"ERROR:\n{result.stderr}")
-            elif result.returncode == 0:
-                print("--- Rebuild complete ---")
-        except subprocess.TimeoutExpired:
-            print("ERROR: Build timed out after 60s")
-        except Exception as e:
-            print(f"ERROR: {e}")
+        paths = [event.src_path, getattr(event, "dest_path", "")]
+        for path in paths:
+            if path and self._should_watch(path):
+                self.scheduler.request_build(path)
 
 
 def main():
     extra_args = sys.argv[1:]
-    handler = RebuildHandler(extra_args)
+    if not any(arg == "--profile" or arg.startswith("--profile=") for arg in extra_args):
+        extra_args += ["--profile", DEFAULT_PROFILE]
+    scheduler = BuildScheduler(extra_args)
+    handler = RebuildHandler(scheduler)
 
     print("Watching for changes... (Ctrl+C to stop)")
     print(f"  Flags: {extra_args or '(none)'}")
     print(f"  Dirs: {WATCHED_DIRS}")
 
-    handler._rebuild()
+    scheduler.start()
+    scheduler.request_build()
 
     observer = Observer()
     for path in WATCHED_DIRS:
@@ -78,6 +215,7 @@ def main():
             time.sleep(1)
     except KeyboardInterrupt:
         observer.stop()
+        scheduler.stop()
         print("\nStopped watching.")
     observer.join()
 